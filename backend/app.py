@@ -1,24 +1,199 @@
 from flask import Flask, request
 from flask_cors import CORS 
-from questions import Questions
+from questions import Questions, keys as QUESTION_KEYS
 from model.matching_logic import Matches
-from flask import jsonify
+from model.catalog import RoleCatalog
+from model.metrics import METRICS, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from model.answers import parse_answers
+from model.result_cache import RESULT_CACHE
+from model import snapshot
+from sessions import SessionStore, SharedSessionStore
+from cache_backends import backend_from_url
+from catalog_watcher import CatalogWatcher
+from flask import jsonify, g
+from contextlib import nullcontext
+import os
+import time
 
 app = Flask(__name__, template_folder="../templates")
 CORS(app, origins="*")
 
 TOTAL_ID = 10
 
-DATA_PATH = "/Users/chansoon/Downloads/Matching Logic - Sheet1.csv"
+# The role sheet exported as CSV, next to this file unless ROLE_DATA_PATH is set
+DATA_PATH = os.environ.get("ROLE_DATA_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "Matching Logic - Sheet1.csv"))
+
+# Built with: python -m model.snapshot <DATA_PATH> <SNAPSHOT_PATH>
+SNAPSHOT_PATH = os.environ.get("ROLE_SNAPSHOT_PATH", os.path.splitext(DATA_PATH)[0] + ".snapshot")
+
+SESSION_HEADER = "X-Session-Token"
+SESSION_TTL_SECONDS = 30 * 60
+MAX_SESSIONS = 5000
+MAX_BATCH_SIZE = 10000
+
+# Seconds browsers may reuse question payloads before revalidating their ETag
+QUESTION_CACHE_SECONDS = 3600
+
+# Sessions and cached rankings are shared by every worker through this 
+# backend when set, e.g. sqlite:///tmp/matching.db or redis://localhost:6379/0
+CACHE_BACKEND_URL = os.environ.get("CACHE_BACKEND_URL")
+
+# Seconds between checks of the role sheet for edits, 0 turns reloading off
+CATALOG_RELOAD_SECONDS = float(os.environ.get("CATALOG_RELOAD_SECONDS", "5"))
+
+# Instrumentation is on unless MATCHING_METRICS=0
+if os.environ.get("MATCHING_METRICS", "1") != "0":
+    METRICS.enable()
+
+def load_role_catalog() -> RoleCatalog:
+    """
+    Loads the catalog snapshot when it is up to date with the role 
+    sheet, so workers start without pandas. Otherwise, or if the 
+    snapshot is unreadable, parses the CSV.
+    """
+    if snapshot.is_fresh(SNAPSHOT_PATH, DATA_PATH):
+        try:
+            return snapshot.load_snapshot(SNAPSHOT_PATH)
+        except snapshot.SnapshotError as e:
+            app.logger.warning("Ignoring the role catalog snapshot %s, parsing %s instead: %s",
+                SNAPSHOT_PATH, DATA_PATH, e)
+
+    return RoleCatalog.from_csv(DATA_PATH)
+
+def set_role_catalog(catalog: RoleCatalog) -> None:
+    """
+    Publishes a reloaded catalog. New sessions start on it, sessions 
+    in flight keep the catalog they started with.
+    """
+    global role_catalog
+    role_catalog = catalog
+    app.logger.info("Loaded role catalog version %s with %s roles", catalog.version, len(catalog))
+
+catalog_watcher = CatalogWatcher(load_role_catalog, [DATA_PATH, SNAPSHOT_PATH],
+    interval=CATALOG_RELOAD_SECONDS or 5)
 
 try:
-    match = Matches(data_path=DATA_PATH, student_status=True)
+    # Every session shares the current immutable catalog, which is
+    # swapped whole when the role sheet is edited
+    role_catalog = catalog_watcher.load()
+    catalog_watcher.subscribe(set_role_catalog)
+
+    if CATALOG_RELOAD_SECONDS:
+        catalog_watcher.start()
+
+    if CACHE_BACKEND_URL:
+        cache_backend = backend_from_url(CACHE_BACKEND_URL)
+        RESULT_CACHE.backend = cache_backend
+        sessions = SharedSessionStore(cache_backend, lambda: role_catalog,
+            ttl_seconds=SESSION_TTL_SECONDS)
+    else:
+        sessions = SessionStore(
+            lambda: Matches(catalog=role_catalog, student_status=True),
+            ttl_seconds=SESSION_TTL_SECONDS,
+            max_sessions=MAX_SESSIONS
+        )
     questions = Questions()
     print("Successfully intialized the matching and questions system")
 
 except Exception as e:
     print(f"Failed to intialize the matching system and questions system: {e}")
-    match, questions = None, None
+    role_catalog, sessions, questions = None, None, None
+
+@app.before_request
+def start_timer():
+    if METRICS.enabled:
+        g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request(response):
+    start = g.get("request_start")
+
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        METRICS.observe_request(route, request.method, response.status_code,
+            time.perf_counter() - start)
+
+    return response
+
+def cached_json(payload):
+    """
+    Sends a preserialized JSON payload with its ETag and caching 
+    headers, or a 304 if the client already has it.
+    """
+    response = app.response_class(payload.body, mimetype="application/json")
+    response.set_etag(payload.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = QUESTION_CACHE_SECONDS
+
+    return response.make_conditional(request)
+
+def get_session_token() -> str | None:
+    """
+    Reads the session token from the X-Session-Token header, falling 
+    back to a session_token query argument or JSON field.
+    """
+    token = request.headers.get(SESSION_HEADER) or request.args.get("session_token")
+
+    if not token and request.is_json:
+        data = request.get_json(silent=True) or {}
+        token = data.get("session_token")
+
+    return token
+
+def get_session() -> tuple[Matches | None, tuple | None]:
+    """
+    Looks up the caller's matching session.
+
+    Returns:
+        - tuple: The session and None, or None and an error response 
+            to return to the caller.
+    """
+    if sessions is None:
+        return None, (jsonify({"error": "Matching system not initialized"}), 500)
+
+    token = get_session_token()
+
+    if not token:
+        return None, (jsonify({"error" : f"Missing session token, start a session "
+            f"with /api/session and send it in the {SESSION_HEADER} header"}), 400)
+
+    match = sessions.get(token)
+
+    if match is None:
+        return None, (jsonify({"error" : "Session not found or expired"}), 404)
+
+    return match, None
+
+def session_lock():
+    """
+    Returns the lock of the caller's session, held around getting, 
+    assessing and saving it, since Flask serves requests on many 
+    threads. Does nothing if there is no session to lock.
+    """
+    token = get_session_token()
+
+    if sessions is None or not token:
+        return nullcontext()
+
+    return sessions.locked(token)
+
+@app.route("/api/session", methods=["POST"])
+def start_session():
+    """
+    Starts a new matching session and returns its token.
+    """
+    try:
+        if sessions is None:
+            return jsonify({"error": "Matching system not initialized"}), 500
+
+        token, match = sessions.create()
+
+        return jsonify({"status": "Success", "session_token" : token,
+            "catalog_version": match.catalog.version}), 201
+
+    except Exception as e:
+        return jsonify({"error" : f"Failed to start session: {str(e)}"}), 500
 
 @app.route("/api/get-question", methods=["GET"])
 def get_question():
@@ -34,48 +209,90 @@ def get_question():
         if question_id > TOTAL_ID:
             return jsonify({"error" : "Question and question IDs don't exist"}), 404
 
-        question = questions.get_question(question_id)
-
-        return jsonify(question), 200
+        return cached_json(questions.get_payload(question_id))
 
     except Exception as e:
         return jsonify({"error" : f"Failed to get next question: {str(e)}"}), 500
 
+@app.route("/api/questions", methods=["GET"])
+def get_questions():
+    """
+    Sends every question payload at once, in question id order, so 
+    the questionnaire can be loaded with a single request.
+    """
+    if not questions:
+        return jsonify({"error" : "The question system was not successfully initialized"}), 500
+
+    return cached_json(questions.questionnaire)
+
 @app.route("/api/update-role", methods=["POST"])
 def update_role():
     """
     Front end POST data in object form: {
         "answer" : answer,
         "question_id" : question_id
-    } with question_id being a str
+    } with question_id being a question key from questions.py or its 
+    numeric id, sent with the session token
     """
     try:
-        if not match:
-            return jsonify({"error": "Matching system not initialized"}), 500
+        with session_lock():
+            match, error = get_session()
 
-        data = request.get_json()
+            if error:
+                return error
 
-        if not data:
-            return jsonify({"error" : "No data received"}), 500
+            data = request.get_json()
 
-        # Validate required fields
-        if not "answer" in data or not "question_id" in data:
-            return jsonify({"error" : "Data was not formatted correctly, missing field requirements"}), 404 
+            if not data:
+                return jsonify({"error" : "No data received"}), 500
+
+            # Validate required fields
+            if not isinstance(data, dict) or not "answer" in data or not "question_id" in data:
+                return jsonify({"error" : "Data was not formatted correctly, missing field requirements"}), 404 
+
+            question_id = data["question_id"]
 
-        match.next_assessment(data)
+            # Numeric ids are positions in questions.py keys
+            if isinstance(question_id, int) and 0 <= question_id < len(QUESTION_KEYS):
+                question_id = QUESTION_KEYS[question_id]
 
-        return jsonify({"status": "Success", "message" : "Role updated successfuly"}), 200
+            try:
+                match.next_assessment({"question_id": question_id, "answer": data["answer"]})
+            except (TypeError, ValueError) as e:
+                return jsonify({"error" : str(e)}), 400
+
+            sessions.save(get_session_token(), match)
+
+            return jsonify({"status": "Success", "message" : "Role updated successfuly"}), 200
 
     except Exception as e:
         return jsonify({"error": f"Failed to update role: {str(e)}"}), 500
 
 @app.route("/api/get-roles", methods=["GET"])
 def get_best_fit_roles():
+    """
+    Sends the session's best fit roles. Optional query arguments: num 
+    (number of best fit roles), and page and page_size for a page of 
+    the full ranking.
+    """
     try:
-        if not match:
-            return jsonify({"error": "Matching system not initialized"}), 500
+        with session_lock():
+            match, error = get_session()
+
+            if error:
+                return error
+
+            page = request.args.get("page", type=int)
+            page_size = request.args.get("page_size", 10, type=int)
+
+            if (page is not None and page < 0) or page_size < 1:
+                return jsonify({"error" : "page must be >= 0 and page_size must be >= 1"}), 400
 
-        best_roles = match.get_best_fit_roles()
+            best_roles = match.get_best_fit_roles(
+                num=request.args.get("num", 3, type=int),
+                page=page,
+                page_size=page_size
+            )
 
         if not best_roles:
             return jsonify({"error" : "no best fit roles data"}), 400
@@ -91,21 +308,131 @@ def get_best_fit_roles():
     except Exception as e:
         return jsonify({"error" : f"Failed to get best fit roles: {str(e)}"}), 500
 
+def requested_num(data: dict) -> int:
+    """
+    Reads the optional number of best fit roles from a request body.
+
+    Raises:
+        - ValueError: If num is not a positive whole number.
+    """
+    num = data.get("num", 3)
+
+    if isinstance(num, str) and num.strip().isdigit():
+        num = int(num)
+
+    if isinstance(num, bool) or not isinstance(num, int) or num < 1:
+        raise ValueError(f"num must be a positive whole number, got {num!r}")
+
+    return num
+
+@app.route("/api/match", methods=["POST"])
+def match_answers():
+    """
+    Scores one volunteer's complete answer set without keeping any 
+    server-side state. Front end POST data in object form: {
+        "answers" : {question key : answer, ...},
+        "num" : number of best fit roles (optional)
+    } and responds with the best fit roles.
+    """
+    try:
+        # Read the global once, a reload may swap it during the request
+        catalog = role_catalog
+
+        if catalog is None:
+            return jsonify({"error": "Matching system not initialized"}), 500
+
+        data = request.get_json()
+
+        if not isinstance(data, dict) or not isinstance(data.get("answers"), dict):
+            return jsonify({"error" : "Data was not formatted correctly, expected "
+                "an object of answers under answers"}), 400
+
+        try:
+            num = requested_num(data)
+            responses = parse_answers(data["answers"])
+        except (TypeError, ValueError) as e:
+            return jsonify({"error" : str(e)}), 400
+
+        # Identical answer profiles are scored once per catalog
+        best_roles = RESULT_CACHE.best_fit_roles(catalog, responses, num=num)
+
+        return jsonify(best_roles), 200
+
+    except Exception as e:
+        return jsonify({"error" : f"Failed to match answers: {str(e)}"}), 500
+
+@app.route("/api/batch-match", methods=["POST"])
+def batch_match():
+    """
+    Scores many volunteers at once. Front end POST data in object 
+    form: {
+        "answers" : [{question key : answer, ...}, ...],
+        "num" : number of best fit roles per volunteer (optional)
+    } and responds with the score matrix, elimination mask and best 
+    fit roles of every volunteer, in the order they were sent.
+    """
+    try:
+        catalog = role_catalog
+
+        if catalog is None:
+            return jsonify({"error": "Matching system not initialized"}), 500
+
+        data = request.get_json()
+
+        if not isinstance(data, dict) or not isinstance(data.get("answers"), list):
+            return jsonify({"error" : "Data was not formatted correctly, expected "
+                "a list of answer sets under answers"}), 400
+
+        if len(data["answers"]) > MAX_BATCH_SIZE:
+            return jsonify({"error" : f"Batches are limited to {MAX_BATCH_SIZE} volunteers"}), 413
+
+        match = Matches(catalog=catalog, student_status=True)
+
+        try:
+            num = requested_num(data)
+            result = match.score_batch(data["answers"])
+        except ValueError as e:
+            return jsonify({"error" : str(e)}), 400
+
+        return jsonify(result.to_dict(num=num)), 200
+
+    except Exception as e:
+        return jsonify({"error" : f"Failed to match batch: {str(e)}"}), 500
+
 @app.route("/api/reset", methods=["POST"])
 def reset_assessment():
+    """
+    Restarts the caller's session on the latest role catalog, keeping 
+    the same session token.
+    """
     try:
-        global match, questions
-        match = Matches(data_path=DATA_PATH, student_status=True)
-        questions = Questions()
+        with session_lock():
+            _, error = get_session()
+
+            if error:
+                return error
+
+            match = sessions.reset(get_session_token())
+
+        if match is None:
+            return jsonify({"error" : "Session not found or expired"}), 404
         
         return jsonify({
             "status": "Success", 
-            "message" : "Assessment system reset successfully"
+            "message" : "Assessment system reset successfully",
+            "catalog_version": match.catalog.version
         }), 200
 
     except Exception as e:
          return jsonify({"error" : f"Failed to reset assessment system: {str(e)}"}), 500
 
+@app.route("/api/metrics", methods=["GET"])
+def metrics():
+    """
+    Sends assessment and route metrics in the Prometheus text format.
+    """
+    return METRICS.render(), 200, {"Content-Type": METRICS_CONTENT_TYPE}
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -0,0 +1,330 @@
+"""
+ASGI serving mode of the questionnaire API. Serves the session routes
+of app.py from one event loop, so a single process can hold thousands
+of keep-alive clients. Run it with any ASGI server, for example:
+    uvicorn asgi:app --port 8000
+"""
+from app import role_catalog, questions, catalog_watcher, sessions as flask_sessions, TOTAL_ID, \
+    SESSION_HEADER, SESSION_TTL_SECONDS, MAX_SESSIONS, QUESTION_CACHE_SECONDS
+from questions import keys as QUESTION_KEYS
+from model.matching_logic import Matches
+from model.metrics import METRICS, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from sessions import AsyncSessionStore, SharedSessionStore
+from urllib.parse import parse_qs
+import json
+import time
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-headers", b"Content-Type, X-Session-Token"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS")
+]
+
+class Request:
+    """
+    The parts of an HTTP request the handlers read.
+
+    Attributes:
+        - headers (dict): Lowercased header names mapped to values.
+        - args (dict): Query arguments, first value of each.
+        - body (bytes): The raw request body.
+    """
+    def __init__(self, scope: dict, body: bytes) -> None:
+        self.headers = {name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])}
+        self.args = {key: values[0] for key, values
+            in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()}
+        self.body = body
+
+    def get_json(self):
+        """
+        Returns the decoded JSON body, or None for an empty or
+        invalid body.
+        """
+        if not self.body:
+            return None
+
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return None
+
+    def get_int(self, name: str, default=None) -> int | None:
+        """
+        Reads an integer query argument, falling back to default if
+        it is missing or not an integer, like Flask's args.get.
+        """
+        try:
+            return int(self.args[name])
+        except (KeyError, ValueError):
+            return default
+
+class QuestionnaireApp:
+    """
+    The ASGI application. Handlers return (status, payload) pairs
+    matching the responses of the Flask routes, optionally followed 
+    by extra response headers. A bytes payload is sent as is, as
+    JSON unless the headers give another content type.
+
+    Attributes:
+        - catalog (RoleCatalog | None): The role catalog new sessions 
+            start on, replaced whole when the role sheet is reloaded.
+        - questions (Questions | None): The question payloads.
+        - sessions (AsyncSessionStore | None): Per-volunteer sessions.
+    """
+    def __init__(self, catalog, questions, sessions: AsyncSessionStore | None = None) -> None:
+        self.catalog = catalog
+        self.questions = questions
+
+        if sessions is None and catalog is not None:
+            sessions = AsyncSessionStore(
+                lambda: Matches(catalog=self.catalog, student_status=True),
+                ttl_seconds=SESSION_TTL_SECONDS,
+                max_sessions=MAX_SESSIONS
+            )
+
+        self.sessions = sessions
+        self.routes = {
+            ("POST", "/api/session"): self.start_session,
+            ("GET", "/api/get-question"): self.get_question,
+            ("GET", "/api/questions"): self.get_questions,
+            ("POST", "/api/update-role"): self.update_role,
+            ("GET", "/api/get-roles"): self.get_best_fit_roles,
+            ("POST", "/api/reset"): self.reset_session,
+            ("GET", "/api/metrics"): self.metrics
+        }
+        self.paths = {path for _, path in self.routes}
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            return
+
+        start = time.perf_counter() if METRICS.enabled else None
+        method, path = scope["method"], scope["path"]
+        handler = self.routes.get((method, path))
+
+        headers = []
+
+        if method == "OPTIONS" and path in self.paths:
+            status, payload = 204, None
+        elif handler is None:
+            status, payload = (405, {"error": "Method not allowed"}) if path in self.paths \
+                else (404, {"error": "Endpoint not found"})
+        else:
+            request = Request(scope, await read_body(receive))
+
+            try:
+                status, payload, *rest = await handler(request)
+                headers = rest[0] if rest else []
+            except Exception:
+                status, payload = 500, {"error": "Internal server error"}
+
+        await send_json(send, status, payload, headers)
+
+        if start is not None:
+            route = path if path in self.paths else "unmatched"
+            METRICS.observe_request(route, method, status, time.perf_counter() - start)
+
+    async def lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def session_token(self, request: Request) -> str | None:
+        """
+        Reads the session token from the X-Session-Token header,
+        falling back to a session_token query argument or JSON field.
+        """
+        token = request.headers.get(SESSION_HEADER.lower()) or request.args.get("session_token")
+
+        if not token:
+            data = request.get_json()
+
+            if isinstance(data, dict):
+                token = data.get("session_token")
+
+        return token
+
+    def session_error(self, token: str | None, match) -> tuple[int, dict] | None:
+        if self.sessions is None:
+            return 500, {"error": "Matching system not initialized"}
+
+        if not token:
+            return 400, {"error": f"Missing session token, start a session "
+                f"with /api/session and send it in the {SESSION_HEADER} header"}
+
+        if match is None:
+            return 404, {"error": "Session not found or expired"}
+
+        return None
+
+    async def start_session(self, request: Request) -> tuple[int, dict]:
+        if self.sessions is None:
+            return 500, {"error": "Matching system not initialized"}
+
+        token, match = await self.sessions.create()
+
+        return 201, {"status": "Success", "session_token": token,
+            "catalog_version": match.catalog.version}
+
+    async def get_question(self, request: Request) -> tuple[int, dict]:
+        if not self.questions:
+            return 500, {"error": "The question system was not successfully initialized"}
+
+        try:
+            question_id = int(request.args.get("question_id"))
+        except (TypeError, ValueError) as e:
+            return 500, {"error": f"Failed to get next question: {str(e)}"}
+
+        if question_id > TOTAL_ID:
+            return 404, {"error": "Question and question IDs don't exist"}
+
+        return cached_json(request, self.questions.get_payload(question_id))
+
+    async def get_questions(self, request: Request) -> tuple:
+        if not self.questions:
+            return 500, {"error": "The question system was not successfully initialized"}
+
+        return cached_json(request, self.questions.questionnaire)
+
+    async def update_role(self, request: Request) -> tuple[int, dict]:
+        token = self.session_token(request)
+
+        if self.sessions is None or not token:
+            return self.session_error(token, None)
+
+        async with self.sessions.session(token) as match:
+            error = self.session_error(token, match)
+
+            if error:
+                return error
+
+            data = request.get_json()
+
+            if not data:
+                return 500, {"error": "No data received"}
+
+            if not isinstance(data, dict) or "answer" not in data or "question_id" not in data:
+                return 404, {"error": "Data was not formatted correctly, missing field requirements"}
+
+            question_id = data["question_id"]
+
+            # Numeric ids are positions in questions.py keys
+            if isinstance(question_id, int) and 0 <= question_id < len(QUESTION_KEYS):
+                question_id = QUESTION_KEYS[question_id]
+
+            try:
+                match.next_assessment({"question_id": question_id, "answer": data["answer"]})
+            except (TypeError, ValueError) as e:
+                return 400, {"error": str(e)}
+
+            await self.sessions.save(token, match)
+
+            return 200, {"status": "Success", "message": "Role updated successfuly"}
+
+    async def get_best_fit_roles(self, request: Request) -> tuple[int, dict]:
+        token = self.session_token(request)
+
+        if self.sessions is None or not token:
+            return self.session_error(token, None)
+
+        async with self.sessions.session(token) as match:
+            error = self.session_error(token, match)
+
+            if error:
+                return error
+
+            page = request.get_int("page")
+            page_size = request.get_int("page_size", 10)
+
+            if (page is not None and page < 0) or page_size < 1:
+                return 400, {"error": "page must be >= 0 and page_size must be >= 1"}
+
+            try:
+                return 200, match.get_best_fit_roles(
+                    num=request.get_int("num", 3),
+                    page=page,
+                    page_size=page_size
+                )
+            except ValueError as e:
+                return 500, {"error": f"Failed to get best fit roles: {str(e)}"}
+
+    async def reset_session(self, request: Request) -> tuple[int, dict]:
+        token = self.session_token(request)
+
+        if self.sessions is None or not token:
+            return self.session_error(token, None)
+
+        match = await self.sessions.reset(token)
+
+        if match is None:
+            return 404, {"error": "Session not found or expired"}
+
+        return 200, {"status": "Success", "message": "Assessment system reset successfully",
+            "catalog_version": match.catalog.version}
+
+    async def metrics(self, request: Request) -> tuple[int, bytes, list]:
+        return 200, METRICS.render().encode("utf-8"), [(b"content-type", METRICS_CONTENT_TYPE.encode("latin-1"))]
+
+async def read_body(receive) -> bytes:
+    body = b""
+
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+
+        if not message.get("more_body"):
+            return body
+
+def cached_json(request: Request, payload) -> tuple:
+    """
+    Returns a preserialized JSON payload with its ETag and caching 
+    headers, or a 304 if the request's If-None-Match has it.
+    """
+    etag = f'"{payload.etag}"'
+    headers = [(b"etag", etag.encode("latin-1")),
+        (b"cache-control", f"public, max-age={QUESTION_CACHE_SECONDS}".encode("latin-1"))]
+    if_none_match = request.headers.get("if-none-match", "")
+
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return 304, None, headers
+
+    return 200, payload.body, headers
+
+async def send_json(send, status: int, payload, headers=()) -> None:
+    if payload is None:
+        body = b""
+    elif isinstance(payload, bytes):
+        body = payload
+    else:
+        body = json.dumps(payload).encode("utf-8")
+
+    headers = list(headers)
+
+    # Handlers may send another content type with their headers
+    if not any(name == b"content-type" for name, _ in headers):
+        headers.insert(0, (b"content-type", b"application/json"))
+
+    headers += [(b"content-length", str(len(body)).encode("latin-1"))] + CORS_HEADERS
+
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+# Share sessions with the other workers when app.py was configured with a cache backend
+app = QuestionnaireApp(role_catalog, questions, AsyncSessionStore(None, store=flask_sessions)
+    if isinstance(flask_sessions, SharedSessionStore) else None)
+catalog_watcher.subscribe(lambda catalog: setattr(app, "catalog", catalog))
+
+if __name__ == "__main__":
+    import uvicorn # Optional, any ASGI server can serve app
+
+    uvicorn.run("asgi:app", port=8000)
@@ -0,0 +1,253 @@
+"""
+Load test of the questionnaire API. Many concurrent keep-alive clients
+each start a session, answer every question, fetch their best fit
+roles and reset, over and over.
+
+Run from the backend directory, either against a running server:
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --clients 500
+or starting the Flask and ASGI servers to compare their throughput:
+    python -m benchmarks.load_test --compare --clients 500 --duration 10
+"""
+from benchmarks.synthetic import generate_roles, generate_answers
+from benchmarks.startup_benchmark import BACKEND_DIR, write_csv
+from benchmarks.run_benchmarks import RESULTS_DIR, git_commit
+from questions import keys as QUESTION_KEYS
+from model.catalog import RoleCatalog
+from model.snapshot import write_snapshot
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SERVER_COMMANDS = {
+    "flask": [sys.executable, "-c",
+        "import app, sys; app.app.run(port=int(sys.argv[1]), threaded=True)"],
+    "asgi": [sys.executable, "-m", "uvicorn", "asgi:app", "--log-level", "warning", "--port"]
+}
+
+class Connection:
+    """
+    A minimal HTTP/1.1 keep-alive client, reconnecting whenever the
+    server closes the connection.
+    """
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, payload=None, token: str | None = None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n"
+
+        if payload is not None:
+            head += "Content-Type: application/json\r\n"
+
+        if token:
+            head += f"X-Session-Token: {token}\r\n"
+
+        self.writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+
+        if not status_line:
+            raise ConnectionError("Server closed the connection")
+
+        version, status = status_line.decode("latin-1").split()[:2]
+        headers = {}
+
+        while (line := await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        response_body = await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        if version == "HTTP/1.0" or headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return int(status), json.loads(response_body) if response_body else None
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+async def run_client(host: str, port: int, answer_sets: list[dict], deadline: float, stats: dict) -> None:
+    connection = Connection(host, port)
+    volunteer = 0
+
+    async def timed(method: str, path: str, payload=None, token=None):
+        start = time.perf_counter()
+
+        try:
+            status, data = await connection.request(method, path, payload, token)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError):
+            await connection.close()
+            stats["errors"] += 1
+            return None, None
+
+        stats["latencies"].append(time.perf_counter() - start)
+
+        if status >= 400:
+            stats["errors"] += 1
+
+        return status, data
+
+    try:
+        while time.perf_counter() < deadline:
+            _, data = await timed("POST", "/api/session")
+
+            if not data or "session_token" not in data:
+                continue
+
+            token = data["session_token"]
+            answers = answer_sets[volunteer % len(answer_sets)]
+            volunteer += 1
+
+            for question_id, key in enumerate(QUESTION_KEYS):
+                await timed("GET", f"/api/get-question?question_id={question_id}")
+
+                if key in answers:
+                    await timed("POST", "/api/update-role",
+                        {"question_id": key, "answer": answers[key]}, token)
+
+            await timed("GET", "/api/get-roles", token=token)
+            await timed("POST", "/api/reset", {}, token)
+            stats["sessions"] += 1
+    finally:
+        await connection.close()
+
+async def load_test(url: str, clients: int, duration: float, seed: int = 0) -> dict:
+    """
+    Runs the load test against the server at url.
+
+    Returns:
+        - dict: Requests and sessions per second, error count and
+            latency percentiles in seconds.
+    """
+    parts = urlsplit(url)
+    answer_sets = generate_answers(1000, seed)
+    stats = {"latencies": [], "errors": 0, "sessions": 0}
+
+    start = time.perf_counter()
+    deadline = start + duration
+
+    await asyncio.gather(*(run_client(parts.hostname, parts.port or 80, answer_sets, deadline, stats)
+        for _ in range(clients)))
+
+    elapsed = time.perf_counter() - start
+    latencies = sorted(stats["latencies"])
+
+    def percentile(fraction: float) -> float | None:
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else None
+
+    return {
+        "clients": clients,
+        "duration": elapsed,
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "sessions_per_second": stats["sessions"] / elapsed,
+        "errors": stats["errors"],
+        "latency_mean": statistics.fmean(latencies) if latencies else None,
+        "latency_p50": percentile(0.5),
+        "latency_p99": percentile(0.99)
+    }
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+
+    raise TimeoutError(f"Server did not listen on port {port}")
+
+def compare_servers(clients: int, duration: float, num_roles: int, seed: int = 0) -> dict:
+    """
+    Starts the Flask server and the ASGI server on a synthetic
+    catalog in turn and load tests each of them.
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = os.path.join(directory, "roles.csv")
+        snapshot_path = os.path.join(directory, "roles.snapshot")
+        write_csv(generate_roles(num_roles, seed), data_path)
+        write_snapshot(RoleCatalog.from_csv(data_path), snapshot_path)
+
+        env = {**os.environ, "ROLE_DATA_PATH": data_path, "ROLE_SNAPSHOT_PATH": snapshot_path}
+
+        for name, command in SERVER_COMMANDS.items():
+            port = free_port()
+            process = subprocess.Popen(command + [str(port)], cwd=BACKEND_DIR, env=env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+            try:
+                wait_for_port(port, process)
+                results[name] = asyncio.run(load_test(f"http://127.0.0.1:{port}", clients, duration, seed))
+            finally:
+                process.terminate()
+                process.wait()
+
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load tests the questionnaire API")
+    parser.add_argument("--url", help="A running server to test")
+    parser.add_argument("--compare", action="store_true",
+        help="Start and compare the Flask and ASGI servers")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of load")
+    parser.add_argument("--roles", type=int, default=1000, help="Roles in the synthetic catalog")
+    parser.add_argument("--output", help="JSON results path, defaults to results/load-<commit>.json")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        results = compare_servers(args.clients, args.duration, args.roles)
+    elif args.url:
+        results = {args.url: asyncio.run(load_test(args.url, args.clients, args.duration))}
+    else:
+        parser.error("Pass --url or --compare")
+
+    for name, result in results.items():
+        print(f"{name}: {result['requests_per_second']:.0f} requests/s, p50 "
+            f"{result['latency_p50'] * 1000:.1f}ms, p99 {result['latency_p99'] * 1000:.1f}ms, "
+            f"{result['errors']} errors")
+
+    commit = git_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{commit or 'working-tree'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    with open(output, "w") as file:
+        json.dump({"meta": {"commit": commit, "timestamp": datetime.now(timezone.utc).isoformat(),
+            "clients": args.clients, "roles": args.roles}, "results": results}, file, indent=2)
+
+    print(f"Saved results to {output}")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,316 @@
+"""
+Times the matching pipeline against synthetic role catalogs and saves
+the results as JSON, so runs from different commits can be compared.
+
+Alongside the timings, each size records the bytes held per role by
+the catalog, per volunteer session and per parsed answer set.
+
+Run from the backend directory:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 100 1000 --compare benchmarks/results/abc1234.json
+"""
+from model.answers import ASSESSMENT_HANDLERS, parse_answer, parse_answers
+from model.catalog import RoleCatalog
+from model.keywords import *
+from model.matching_logic import Matches
+from model.parallel import score_serial, score_parallel
+from model.vectorized import np
+from benchmarks.synthetic import generate_roles, generate_answers
+from datetime import datetime, timezone
+import pandas as pd
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# A representative volunteer, answering every question
+BENCHMARK_ANSWERS = {
+    "age": 17,
+    "physical_ability": "Yes",
+    "physical_ability_stand": "Yes",
+    "physical_ability_move": "Yes",
+    "availability": 2,
+    "working_preference": "No Preference",
+    "leadership_preference": "No Preference",
+    "prior_experience": "Yes",
+    "game_knowledge": "Average",
+    "required_skills": ["Basic computer literacy", "Event coordination"],
+    "experience": ["Event management experience", "Technical inspection experience"]
+}
+
+def time_call(func, repeat: int, setup=None) -> dict:
+    """
+    Times func over several runs, calling setup (untimed) before each
+    run and passing its result to func.
+
+    Returns:
+        - dict: Best and mean wall time in seconds.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+
+    return {"best": min(timings), "mean": statistics.fmean(timings)}
+
+def benchmark_assessments(catalog: RoleCatalog, repeat: int) -> dict:
+    """
+    Times each assess_* method on a fresh session scoring every role.
+    """
+    results = {}
+    steps = [(f"{handler.assessment}[{key}]", handler, parse_answer(key, BENCHMARK_ANSWERS[key]))
+        for key, handler in ASSESSMENT_HANDLERS.items()]
+
+    for name, handler, response in steps:
+        results[name] = time_call(
+            lambda match, response=response, handler=handler: handler.assess(match, response),
+            repeat, setup=lambda: (Matches(catalog=catalog, student_status=True),))
+
+    preferred = {"GAME RULES KNOWLEDGE", "FRC REFEREE EXPERIENCE"}
+    results["assess_pref_experience"] = time_call(
+        lambda match: match.assess_pref_experience(match.dataset, "preferred_experience",
+            PREF_EXPERIENCE_KEYWORDS, preferred),
+        repeat, setup=lambda: (Matches(catalog=catalog, student_status=True),))
+
+    return results
+
+def benchmark_top_skill_category(roles: list[dict], repeat: int) -> dict:
+    """
+    Times classifying every required_skills cell, with and without
+    the top category memo.
+    """
+    texts = [role["required_skills"] for role in roles]
+    categorizer = get_categorizer(REQ_SKILLS_KEYWORDS)
+
+    def classify_uncached():
+        for text in texts:
+            categorizer.get_top_category(categorizer.categorize_skills(text))
+
+    def classify_memoized():
+        for text in texts:
+            get_top_skill_category(text, REQ_SKILLS_KEYWORDS)
+
+    classify_memoized() # Warm the memo
+
+    return {
+        "uncached": time_call(classify_uncached, repeat),
+        "memoized": time_call(classify_memoized, repeat)
+    }
+
+def benchmark_sessions(catalog: RoleCatalog, answer_sets: list[dict], repeat: int) -> dict:
+    """
+    Times complete sessions: start, assess every answer and rank.
+    """
+    def run_sessions():
+        for answers in answer_sets:
+            match = Matches(catalog=catalog, student_status=True)
+            match.assess_answers(answers)
+            match.get_best_fit_roles()
+
+    timing = time_call(run_sessions, repeat)
+
+    return {key: value / len(answer_sets) for key, value in timing.items()}
+
+def allocated_bytes(build) -> int:
+    """
+    Returns the bytes still allocated by build() once it returns,
+    keeping its result alive while measuring.
+    """
+    tracemalloc.start()
+
+    try:
+        result = build()
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return allocated
+
+def benchmark_memory(roles: list[dict], answer_sets: list[dict]) -> dict:
+    """
+    Measures the memory held per catalog role, per session that has
+    assessed a volunteer's answers, and per parsed answer set. The
+    catalog is built once beforehand so the parser and keyword memos
+    are warm and only the catalog itself is counted.
+    """
+    catalog = RoleCatalog(roles, convert_booleans=True)
+
+    def build_sessions():
+        sessions = [Matches(catalog=catalog, student_status=True) for _ in answer_sets]
+
+        for match, answers in zip(sessions, answer_sets):
+            match.assess_answers(answers)
+
+        return sessions
+
+    build_sessions() # Warm the memos
+
+    return {
+        "bytes_per_role": allocated_bytes(lambda: RoleCatalog(roles, convert_booleans=True))
+            / len(roles),
+        "bytes_per_session": allocated_bytes(build_sessions) / len(answer_sets),
+        "bytes_per_answer_set": allocated_bytes(lambda: [parse_answers(answers)
+            for answers in answer_sets]) / len(answer_sets)
+    }
+
+def benchmark_parallel(catalog: RoleCatalog, answer_sets: list[dict], processes: int) -> dict:
+    """
+    Compares the throughput, in volunteers per second, of the serial
+    and the multi-process batch runners, including the pool startup.
+    """
+    results = {"processes": processes}
+
+    for name, run in (("serial", lambda: list(score_serial(catalog, answer_sets))),
+        ("parallel", lambda: list(score_parallel(catalog, answer_sets, processes=processes)))):
+        start = time.perf_counter()
+        run()
+        results[f"{name}_volunteers_per_second"] = len(answer_sets) / (time.perf_counter() - start)
+
+    return results
+
+def benchmark_size(num_roles: int, num_volunteers: int, repeat: int, seed: int,
+    parallel_volunteers: int = 0, processes: int | None = None) -> dict:
+    roles = generate_roles(num_roles, seed)
+    answer_sets = generate_answers(num_volunteers, seed)
+    results = {"roles": num_roles, "volunteers": num_volunteers}
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = os.path.join(directory, "roles.csv")
+        pd.DataFrame(roles).to_csv(data_path, index=False)
+
+        start = time.perf_counter()
+        match = Matches(data_path=data_path, student_status=True)
+        results["load_csv_session"] = time.perf_counter() - start
+
+    results["create_dataset"] = time_call(lambda: match.create_dataset(convert_booleans=True), repeat)
+    results["build_catalog"] = time_call(lambda: RoleCatalog.from_dataframe(match.df), repeat)
+    results["get_top_skill_category"] = benchmark_top_skill_category(roles, repeat)
+
+    catalog = match.catalog
+    results["assessments"] = benchmark_assessments(catalog, repeat)
+    results["session_end_to_end"] = benchmark_sessions(catalog, answer_sets, repeat)
+    results["memory"] = benchmark_memory(roles, answer_sets)
+
+    if np is not None:
+        results["score_batch"] = time_call(lambda: match.score_batch(answer_sets), repeat)
+
+    if parallel_volunteers:
+        results["batch_runner"] = benchmark_parallel(catalog,
+            generate_answers(parallel_volunteers, seed), processes or os.cpu_count() or 1)
+
+    return results
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    """
+    Flattens nested results into {"size/name/stat": seconds}.
+    """
+    flat = {}
+
+    for key, value in results.items():
+        name = f"{prefix}/{key}" if prefix else str(key)
+
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, float):
+            flat[name] = value
+
+    return flat
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Lists the timings that got slower than threshold times their
+    baseline.
+    """
+    current_flat = flatten(current["results"])
+    baseline_flat = flatten(baseline["results"])
+    regressions = []
+
+    for name, seconds in sorted(current_flat.items()):
+        previous = baseline_flat.get(name)
+
+        if previous and name.endswith("best") and seconds > previous * threshold:
+            regressions.append(f"{name}: {previous:.6f}s -> {seconds:.6f}s "
+                f"({seconds / previous:.2f}x)")
+
+    return regressions
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+        help="Numbers of roles in the synthetic catalogs")
+    parser.add_argument("--volunteers", type=int, default=50,
+        help="Answer sets scored by the end-to-end and batch benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per timing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--parallel-volunteers", type=int, default=0,
+        help="Also compare the serial and multi-process batch runners on this many volunteers")
+    parser.add_argument("--processes", type=int, help="Worker processes, one per CPU by default")
+    parser.add_argument("--output", help="JSON results path, defaults to results/<commit>.json")
+    parser.add_argument("--compare", help="Previous JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2,
+        help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np is not None,
+            "repeat": args.repeat,
+            "seed": args.seed
+        },
+        "results": {}
+    }
+
+    for size in args.sizes:
+        print(f"Benchmarking {size} roles...")
+        report["results"][str(size)] = benchmark_size(size, args.volunteers, args.repeat, args.seed,
+            args.parallel_volunteers, args.processes)
+
+        memory = report["results"][str(size)]["memory"]
+        print(f"  {memory['bytes_per_role']:.0f} bytes per role, "
+            f"{memory['bytes_per_session']:.0f} bytes per session")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit or 'working-tree'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Saved results to {output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
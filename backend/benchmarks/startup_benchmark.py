@@ -0,0 +1,121 @@
+"""
+Measures worker startup: the time from `import app` in a fresh
+interpreter to the first served request, loading the role catalog from
+the CSV and from its snapshot.
+
+Run from the backend directory:
+    python -m benchmarks.startup_benchmark --roles 1000
+"""
+from benchmarks.synthetic import generate_roles
+from benchmarks.run_benchmarks import RESULTS_DIR, git_commit
+from model.catalog import RoleCatalog
+from model.snapshot import write_snapshot
+from datetime import datetime, timezone
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter and prints its timings as JSON
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+response = app.app.test_client().post("/api/match", json={"answers": {"age": 16}})
+served = time.perf_counter()
+assert response.status_code == 200, response.get_data(as_text=True)
+import json, sys
+print(json.dumps({"import_app": imported - start, "first_request": served - imported,
+    "total": served - start, "pandas_imported": "pandas" in sys.modules}))
+"""
+
+def write_csv(roles: list[dict], path: str) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(roles[0]))
+        writer.writeheader()
+        writer.writerows(roles)
+
+def measure_startup(data_path: str, snapshot_path: str) -> dict:
+    """
+    Starts one worker interpreter and returns its timings.
+    """
+    env = {**os.environ, "ROLE_DATA_PATH": data_path, "ROLE_SNAPSHOT_PATH": snapshot_path,
+        "MATCHING_METRICS": "0"}
+    result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True)
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def benchmark_startup(num_roles: int, repeat: int, seed: int = 0) -> dict:
+    """
+    Times worker startup from the CSV and from a snapshot of the same
+    synthetic catalog.
+
+    Returns:
+        - dict: For each mode, the best and mean of every timing and
+            whether pandas was imported.
+    """
+    roles = generate_roles(num_roles, seed)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = os.path.join(directory, "roles.csv")
+        snapshot_path = os.path.join(directory, "roles.snapshot")
+        write_csv(roles, data_path)
+
+        modes = {"csv": os.path.join(directory, "missing.snapshot"), "snapshot": snapshot_path}
+
+        for mode, mode_snapshot_path in modes.items():
+            if mode == "snapshot":
+                write_snapshot(RoleCatalog.from_csv(data_path), snapshot_path)
+
+            runs = [measure_startup(data_path, mode_snapshot_path) for _ in range(repeat)]
+
+            results[mode] = {key: {"best": min(run[key] for run in runs),
+                "mean": statistics.fmean(run[key] for run in runs)}
+                for key in ("import_app", "first_request", "total")}
+            results[mode]["pandas_imported"] = any(run["pandas_imported"] for run in runs)
+
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measures import app to first served request")
+    parser.add_argument("--roles", type=int, default=1000, help="Roles in the synthetic catalog")
+    parser.add_argument("--repeat", type=int, default=5, help="Worker starts per mode")
+    parser.add_argument("--output", help="JSON results path, defaults to results/startup-<commit>.json")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "roles": args.roles,
+            "repeat": args.repeat
+        },
+        "results": benchmark_startup(args.roles, args.repeat)
+    }
+
+    for mode, timings in report["results"].items():
+        print(f"{mode}: import {timings['import_app']['best']:.3f}s, first request "
+            f"{timings['first_request']['best']:.3f}s, pandas imported: {timings['pandas_imported']}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"startup-{commit or 'working-tree'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Saved results to {output}")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
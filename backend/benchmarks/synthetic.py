@@ -0,0 +1,96 @@
+from model.keywords import *
+from questions import questions
+import random
+
+# Cell values in the formats found in the real role sheet
+AGE_MINIMUMS = ["14", "16", "18", "21", "Students", ""]
+AGE_PREFERENCES = ["", "", "", "18", "21"]
+BOOLEAN_CELLS = ["TRUE", "FALSE"]
+PRIOR_EXPERIENCE = ["FALSE", "TRUE", "Preferred", "Must have 2 prior years",
+    "Knowledge of FIRST is helpful", ""]
+GAME_KNOWLEDGE = ["TRUE", "FALSE", "Thorough knowledge of game rules",
+    "Basic understanding, can learn", "Average, familiar with the game", ""]
+PHYSICAL_REQUIREMENTS = ["FALSE", "Must be able to stand for long periods",
+    "Must be able to walk, lift and carry field elements", "Moves around the venue", ""]
+TIME_COMMITMENTS = ["1 day", "2 days", "3 days", "1.5 days", "4 hours", "1/2 day", "Varies"]
+WORK_PREFERENCES = ["BTS", "FRONT", "bts ", "Front", ""]
+
+def requirement_text(rng: random.Random, keywords: dict) -> str:
+    """
+    Builds a free text requirement mentioning keywords from one to
+    three categories, or FALSE for roles without the requirement.
+    """
+    if rng.random() < 0.3:
+        return "FALSE"
+
+    phrases = [rng.choice(keywords[category])
+        for category in rng.sample(list(keywords), rng.randint(1, 3))]
+
+    return "Experience with " + ", ".join(phrases)
+
+def generate_roles(num_roles: int, seed: int = 0) -> list[dict]:
+    """
+    Generates a role sheet with the real column schema, as the raw
+    string cells read from the CSV.
+
+    Args:
+        - num_roles (int): Number of roles to generate.
+        - seed (int): Seed of the random generator.
+
+    Returns:
+        - list[dict]: One dict per role, with unique role names.
+    """
+    rng = random.Random(seed)
+
+    return [{
+        "role_name": f"Synthetic Role {index}",
+        "event_type": rng.choice(["FRC", "FTC", "FLL"]),
+        "age_min": rng.choice(AGE_MINIMUMS),
+        "age_preference": rng.choice(AGE_PREFERENCES),
+        "age_exception_allowed": rng.choice(BOOLEAN_CELLS),
+        "required_skills": requirement_text(rng, REQ_SKILLS_KEYWORDS),
+        "prior_first_exp": rng.choice(PRIOR_EXPERIENCE),
+        "required_experience": requirement_text(rng, REQ_EXPERIENCE_KEYWORDS),
+        "preferred_experience": requirement_text(rng, PREF_EXPERIENCE_KEYWORDS),
+        "basic_game_knowledge": rng.choice(GAME_KNOWLEDGE),
+        "physical_req": rng.choice(PHYSICAL_REQUIREMENTS),
+        "time_commitment": rng.choice(TIME_COMMITMENTS),
+        "work_pref": rng.choice(WORK_PREFERENCES),
+        "leadership_pref": rng.choice(BOOLEAN_CELLS),
+        "notes": ""
+    } for index in range(num_roles)]
+
+def generate_answers(num_volunteers: int, seed: int = 0) -> list[dict]:
+    """
+    Generates volunteer answer sets using the options offered by
+    questions.py, leaving some questions unanswered.
+
+    Args:
+        - num_volunteers (int): Number of answer sets to generate.
+        - seed (int): Seed of the random generator.
+
+    Returns:
+        - list[dict]: One dict of question keys to answers per
+            volunteer.
+    """
+    rng = random.Random(seed)
+    answer_sets = []
+
+    for _ in range(num_volunteers):
+        answers = {
+            "age": rng.randint(13, 60),
+            "availability": rng.choice([-1, 1, 2, 3])
+        }
+
+        for key, question in questions.items():
+            if question["type"] == "multiselect":
+                answers[key] = rng.sample(question["options"], rng.randint(1, 3))
+            elif "options" in question:
+                answers[key] = rng.choice(question["options"])
+
+        if rng.random() < 0.2:
+            del answers[rng.choice(list(answers))]
+
+        answer_sets.append(answers)
+
+    return answer_sets
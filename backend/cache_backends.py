@@ -0,0 +1,309 @@
+"""
+Key-value backends for state shared by every worker process: the
+result cache and the session store. Each backend stores bytes under
+string keys with an optional time to live, behind the same get, set
+and delete methods:
+
+    - MemoryBackend: a dict in this process, for a single worker.
+    - SQLiteBackend: a file shared by the workers of one machine.
+    - RedisBackend: a Redis server, or anything speaking its
+        protocol, shared by workers on any machine.
+
+backend_from_url builds one from a URL such as memory://,
+sqlite:///var/cache/matching.db or redis://localhost:6379/0.
+"""
+from collections import OrderedDict
+from urllib.parse import urlsplit
+import socket
+import sqlite3
+import threading
+import time
+
+
+class CacheBackend:
+    """
+    The interface every backend implements.
+    """
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the value stored under key, or None if it is missing
+        or has expired.
+        """
+        raise NotImplementedError("Subclasses must implement get() themselves.")
+
+    def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        """
+        Stores value under key, expiring it after ttl_seconds if
+        given.
+        """
+        raise NotImplementedError("Subclasses must implement set() themselves.")
+
+    def delete(self, key: str) -> bool:
+        """
+        Removes key.
+
+        Returns:
+            - bool: True if the key was stored.
+        """
+        raise NotImplementedError("Subclasses must implement delete() themselves.")
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Keeps values in this process, evicting the least recently used
+    entry once max_entries are stored.
+
+    Attributes:
+        - max_entries (int): Maximum number of stored values.
+    """
+    def __init__(self, max_entries: int = 100000, clock=time.monotonic) -> None:
+        if max_entries < 1:
+            raise ValueError("Backend must hold at least one entry.")
+
+        self.max_entries = max_entries
+        self.clock = clock
+
+        # key -> (value, expiry time or None), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+
+            if expires_at is not None and self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = None if ttl_seconds is None else self.clock() + ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Keeps values in a SQLite file, so every worker on the machine
+    shares them. Each thread opens its own connection, and the
+    database runs in write-ahead logging mode so readers never wait
+    on a writer.
+
+    Attributes:
+        - path (str): The database file.
+    """
+    # Expired rows are purged once every this many writes
+    PURGE_EVERY = 1000
+
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def get(self, key: str) -> bytes | None:
+        row = self._connection().execute(
+            "SELECT value FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())).fetchone()
+
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = None if ttl_seconds is None else time.time() + ttl_seconds
+
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO entries (key, value, expires_at) "
+                "VALUES (?, ?, ?)", (key, value, expires_at))
+
+        self._writes += 1
+
+        if self._writes % self.PURGE_EVERY == 0:
+            self.purge_expired()
+
+    def delete(self, key: str) -> bool:
+        with self._connection() as connection:
+            return connection.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def purge_expired(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class RedisError(Exception):
+    """
+    An error reply from the Redis server.
+    """
+
+
+class RedisBackend(CacheBackend):
+    """
+    A minimal client of the Redis protocol (RESP), covering the GET,
+    SET and DEL commands the caches need. Each thread keeps one
+    connection open and reconnects once if it was dropped.
+
+    Attributes:
+        - host (str): The server's host.
+        - port (int): The server's port.
+        - db (int): The database selected after connecting.
+    """
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+        timeout: float = 2.0) -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        connection = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._local.connection = connection
+        self._local.reader = connection.makefile("rb")
+
+        if self.db:
+            self._send("SELECT", str(self.db))
+
+    def execute(self, *args):
+        """
+        Sends one command and returns its decoded reply.
+
+        Raises:
+            - RedisError: If the server replied with an error.
+            - OSError: If the server cannot be reached.
+        """
+        for attempt in range(2):
+            try:
+                if getattr(self._local, "connection", None) is None:
+                    self._connect()
+
+                return self._send(*args)
+            except (OSError, EOFError):
+                self.close()
+
+                if attempt:
+                    raise
+
+    def _send(self, *args):
+        command = [f"*{len(args)}\r\n".encode()]
+
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            command.append(b"$%d\r\n%s\r\n" % (len(data), data))
+
+        self._local.connection.sendall(b"".join(command))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self._local.reader.readline()
+
+        if not line.endswith(b"\r\n"):
+            raise EOFError("Connection closed by the server")
+
+        kind, body = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return body.decode("utf-8")
+        elif kind == b"-":
+            raise RedisError(body.decode("utf-8"))
+        elif kind == b":":
+            return int(body)
+        elif kind == b"$":
+            length = int(body)
+
+            if length < 0:
+                return None
+
+            data = self._local.reader.read(length + 2)
+
+            if len(data) < length + 2:
+                raise EOFError("Connection closed by the server")
+
+            return data[:-2]
+        elif kind == b"*":
+            length = int(body)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+
+        raise RedisError(f"Unexpected reply {line!r}")
+
+    def get(self, key: str) -> bytes | None:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        if ttl_seconds is None:
+            self.execute("SET", key, value)
+        else:
+            self.execute("SET", key, value, "PX", max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, key: str) -> bool:
+        return self.execute("DEL", key) > 0
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+
+        if connection is not None:
+            self._local.reader.close()
+            connection.close()
+            self._local.connection = None
+
+
+def backend_from_url(url: str) -> CacheBackend:
+    """
+    Builds a backend from memory://, sqlite:///<path> or
+    redis://<host>:<port>/<db>.
+
+    Raises:
+        - ValueError: If the scheme is not supported.
+    """
+    parts = urlsplit(url)
+
+    if parts.scheme == "memory":
+        return MemoryBackend()
+    elif parts.scheme == "sqlite":
+        return SQLiteBackend(parts.netloc + parts.path)
+    elif parts.scheme == "redis":
+        db = parts.path.strip("/")
+        return RedisBackend(parts.hostname or "localhost", parts.port or 6379, int(db) if db else 0)
+
+    raise ValueError(f"Unsupported cache backend '{url}', expected memory://, "
+        f"sqlite:///<path> or redis://<host>:<port>/<db>")
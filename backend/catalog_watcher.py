@@ -0,0 +1,164 @@
+import logging
+import os
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWatcher:
+    """
+    Reloads the role catalog when its files change, without
+    restarting the worker. A daemon thread polls the files and parses
+    a changed sheet off the request path, then publishes the new
+    catalog to every listener in one assignment.
+
+    A change is only loaded once the files look the same on two polls
+    in a row, so a sheet caught while it is being written is not 
+    published half written.
+
+    Catalogs are immutable and each session keeps the catalog it was
+    started with, so sessions in flight finish on their version while
+    new sessions start on the latest one.
+
+    Attributes:
+        - loader (Callable): Builds a RoleCatalog from the files.
+        - paths (tuple[str]): Files whose changes trigger a reload.
+        - interval (float): Seconds between polls.
+        - version (int): Version of the latest published catalog.
+        - last_error (Exception | None): Why the latest reload
+            failed, None if it succeeded.
+    """
+    def __init__(self, loader: Callable, paths: list[str], interval: float = 5) -> None:
+        if interval <= 0:
+            raise ValueError("Reload interval must be a positive number of seconds.")
+
+        self.loader = loader
+        self.paths = tuple(paths)
+        self.interval = interval
+        self.version = 0
+        self.last_error = None
+        self.listeners = []
+
+        self._signature = None
+        self._failed_signature = None
+
+        # A changed signature waiting to be seen again before loading
+        self._pending_signature = None
+
+        # Serializes reloads, publishing never waits on it
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def signature(self) -> tuple:
+        """
+        Returns the modification time and size of every watched
+        file, None for a missing file.
+        """
+        signature = []
+
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+
+        return tuple(signature)
+
+    def subscribe(self, listener: Callable) -> None:
+        """
+        Calls listener with every catalog published from now on.
+        """
+        self.listeners.append(listener)
+
+    def load(self):
+        """
+        Loads and publishes the catalog whether or not its files
+        changed.
+
+        Returns:
+            - RoleCatalog: The published catalog.
+
+        Raises:
+            - Exception: Whatever the loader raised.
+        """
+        with self._lock:
+            return self._load(self.signature())
+
+    def check(self):
+        """
+        Reloads the catalog if its files changed since the last load
+        and have not changed since the previous check. A sheet that 
+        fails to load is not retried until it changes again, and the 
+        previous catalog stays in use.
+
+        Returns:
+            - RoleCatalog | None: The new catalog, or None if nothing
+                changed, the files are still changing or the reload 
+                failed.
+        """
+        with self._lock:
+            signature = self.signature()
+
+            if signature in (self._signature, self._failed_signature):
+                self._pending_signature = None
+                return None
+
+            # Wait for the files to settle, they may still be being written
+            if signature != self._pending_signature:
+                self._pending_signature = signature
+                return None
+
+            try:
+                return self._load(signature)
+            except Exception as e:
+                self.last_error = e
+                self._failed_signature = signature
+                logger.warning("Failed to reload the role catalog, keeping version %s: %s",
+                    self.version, e)
+                return None
+
+    def _load(self, signature: tuple):
+        # Take the signature before loading, so a change made during
+        # the load is picked up by the next check
+        catalog = self.loader().with_version(self.version + 1)
+
+        self.version = catalog.version
+        self.last_error = None
+        self._signature = signature
+        self._failed_signature = None
+        self._pending_signature = None
+
+        for listener in self.listeners:
+            listener(catalog)
+
+        return catalog
+
+    def start(self) -> None:
+        """
+        Starts polling the files on a daemon thread.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops polling and waits for a reload in progress to finish.
+        """
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,274 @@
+from .response import *
+from .keywords import *
+from .metrics import METRICS
+import math
+import time
+
+# Questionnaire labels mapped onto the responses the assessments expect
+PREFERENCE_LABELS = {
+    "YES": "YES",
+    "NO": "NO",
+    "NO PREFERENCE": "NO_PREF",
+    "NO_PREF": "NO_PREF"
+}
+
+WORKING_PREFERENCE_LABELS = {
+    "BEHIND THE SCENES": "BTS",
+    "BTS": "BTS",
+    "FRONT-FACING": "FRONT",
+    "FRONT FACING": "FRONT",
+    "FRONT": "FRONT",
+    "NO PREFERENCE": "NO_PREF",
+    "NO_PREF": "NO_PREF"
+}
+
+WORKING_PREFERENCE_OPTIONS = intern_options({"NO_PREF", "BTS", "FRONT"})
+
+GAME_KNOWLEDGE_LEVELS = ["NONE", "LIMITED", "AVERAGE", "THOROUGH"]
+
+# The questions feeding each assessment, in questionnaire order:
+# (question key, assessment, arguments before the response, eliminate)
+# where eliminate is None for assessments that never eliminate.
+ASSESSMENT_PLAN = [
+    ("age", "assess_age", (), True),
+    ("physical_ability", "assess_physical_ability", (), True),
+    ("physical_ability_stand", "assess_standing_ability", (), True),
+    ("physical_ability_move", "assess_moving_ability", (), True),
+    ("availability", "assess_availability", (), True),
+    ("working_preference", "assess_working_pref", (), True),
+    ("leadership_preference", "assess_leadership_pref", (), True),
+    ("prior_experience", "assess_prior_first_experience", (), None),
+    ("game_knowledge", "assess_knowledge_of_game", (), True),
+    ("required_skills", "assess_requirements_general",
+        ("required_skills", REQ_SKILLS_KEYWORDS), True),
+    ("experience", "assess_requirements_general",
+        ("required_experience", REQ_EXPERIENCE_KEYWORDS), True)
+]
+
+# Questions answered with a free-form number. Their assessments find the
+# qualifying roles through the catalog's threshold indexes, and every
+# distinct number would need its own partition, so they are never
+# partitioned
+THRESHOLD_QUESTIONS = frozenset({"age", "availability"})
+
+def is_unanswered(raw) -> bool:
+    """
+    Checks if an answer is missing, including NaN cells from
+    spreadsheet imports.
+    """
+    return raw is None or raw == "" or (isinstance(raw, float) and raw != raw)
+
+def _label(raw, labels: dict, question: str) -> str:
+    if not isinstance(raw, str):
+        raise TypeError(f"Answer to {question} must be a string, got {type(raw)}")
+
+    label = raw.strip().upper().replace("_", " ")
+
+    for candidate in (label, label.replace(" ", "_")):
+        if candidate in labels:
+            return labels[candidate]
+
+    raise ValueError(f"Invalid answer '{raw}' to {question}, expected one of "
+        f"{sorted(set(labels.values()))}")
+
+def parse_age(raw) -> int:
+    if isinstance(raw, bool):
+        raise TypeError("Age must be a whole number")
+
+    if isinstance(raw, float) and raw.is_integer():
+        return int(raw)
+
+    if isinstance(raw, str) and raw.strip().isdigit():
+        return int(raw.strip())
+
+    if not isinstance(raw, int):
+        raise TypeError(f"Age must be a whole number, got {raw!r}")
+
+    if raw < 0:
+        raise ValueError(f"Age cannot be negative, got {raw}")
+
+    return raw
+
+def parse_preference(raw) -> PreferenceResponse:
+    return PreferenceResponse(_label(raw, PREFERENCE_LABELS, "a yes/no question"))
+
+def parse_availability(raw) -> AvailabilityResponse:
+    if isinstance(raw, str):
+        raw = float(raw.strip())
+
+    if isinstance(raw, bool) or not isinstance(raw, (int, float)):
+        raise TypeError(f"Availability must be a number of days or -1, got {raw!r}")
+
+    # "inf" and "nan" parse as floats, but are no number of days
+    if not math.isfinite(raw):
+        raise ValueError(f"Availability must be a number of days or -1, got {raw!r}")
+
+    return AvailabilityResponse(raw)
+
+def parse_working_preference(raw) -> MultiChoiceResponse:
+    choice = _label(raw, WORKING_PREFERENCE_LABELS, "working preference")
+    return MultiChoiceResponse(choice, WORKING_PREFERENCE_OPTIONS)
+
+def parse_prior_experience(raw) -> bool:
+    if isinstance(raw, bool):
+        return raw
+
+    return _label(raw, PREFERENCE_LABELS, "prior experience") == "YES"
+
+def parse_game_knowledge(raw) -> str:
+    if not isinstance(raw, str) or raw.strip().upper() not in GAME_KNOWLEDGE_LEVELS:
+        raise ValueError(f"Invalid game knowledge '{raw}', expected one of {GAME_KNOWLEDGE_LEVELS}")
+
+    return raw.strip().upper()
+
+def parse_categories(raw, keywords: dict) -> set[str]:
+    """
+    Maps multiselect answers onto keyword categories. Answers may be
+    category names or free text, which is classified with the
+    keywords; text matching no keyword is ignored.
+    """
+    if isinstance(raw, str):
+        raw = [raw]
+
+    if not isinstance(raw, (list, tuple, set, frozenset)):
+        raise TypeError(f"Multiselect answers must be a list of strings, got {type(raw)}")
+
+    categories = set()
+
+    for answer in raw:
+        answer = str(answer).strip()
+
+        if answer.upper() in keywords or answer.upper() == "NONE":
+            categories.add(answer.upper())
+            continue
+
+        scores = get_categorizer(keywords).categorize_skills(answer)
+
+        if scores and max(scores.values()) > 0:
+            categories.add(max(scores, key=scores.get))
+
+    return categories
+
+ANSWER_PARSERS = {
+    "age": parse_age,
+    "physical_ability": parse_preference,
+    "physical_ability_stand": parse_preference,
+    "physical_ability_move": parse_preference,
+    "availability": parse_availability,
+    "working_preference": parse_working_preference,
+    "leadership_preference": parse_preference,
+    "prior_experience": parse_prior_experience,
+    "game_knowledge": parse_game_knowledge,
+    "required_skills": lambda raw: parse_categories(raw, REQ_SKILLS_KEYWORDS),
+    "experience": lambda raw: parse_categories(raw, REQ_EXPERIENCE_KEYWORDS)
+}
+
+def parse_answer(question_key: str, raw):
+    """
+    Parses a raw questionnaire answer into the response the
+    matching assessment expects.
+
+    Args:
+        - question_key (str): The question's key in questions.py.
+        - raw: The answer as sent by the front end or read from a
+            spreadsheet.
+
+    Returns:
+        - The parsed response.
+
+    Raises:
+        - KeyError: If the question key is unknown.
+        - TypeError | ValueError: If the answer is malformed.
+    """
+    return ANSWER_PARSERS[question_key](raw)
+
+def canonical_answer(response):
+    """
+    Returns a hashable value identifying a parsed response, equal
+    for responses that score identically.
+    """
+    if isinstance(response, PreferenceResponse):
+        return ("PREFERENCE", response.response)
+
+    if isinstance(response, AvailabilityResponse):
+        return ("AVAILABILITY", response.completely, response.days)
+
+    if isinstance(response, MultiChoiceResponse):
+        return ("CHOICE", response.choice)
+
+    if isinstance(response, (set, frozenset)):
+        return frozenset(response)
+
+    return response
+
+def parse_answers(answers: dict) -> dict:
+    """
+    Parses a complete answer set, skipping unanswered questions and
+    keys that are not questions.
+
+    Returns:
+        - dict: Question keys mapped to parsed responses.
+    """
+    return {key: parse_answer(key, answers[key]) for key in ANSWER_PARSERS
+        if key in answers and not is_unanswered(answers[key])}
+
+class AssessmentHandler:
+    """
+    A precompiled step of the assessment pipeline: parses the answer 
+    to one question and applies the matching assessment to a 
+    session's active roles.
+
+    Attributes:
+        - question_key (str): The question's key in questions.py.
+        - assessment (str): Name of the Matches assessment method.
+        - args (tuple): Arguments passed before the response.
+        - eliminate (bool | None): eliminate_unqualified, or None 
+            for assessments that never eliminate.
+        - partitioned (bool): Whether answers are applied through 
+            the catalog's partitions, False for THRESHOLD_QUESTIONS.
+    """
+    def __init__(self, question_key: str, assessment: str, args: tuple, eliminate: bool | None) -> None:
+        self.question_key = question_key
+        self.assessment = assessment
+        self.args = args
+        self.eliminate = eliminate
+        self.parse = ANSWER_PARSERS[question_key]
+        self.kwargs = {} if eliminate is None else {"eliminate_unqualified": eliminate}
+        self.partitioned = question_key not in THRESHOLD_QUESTIONS
+
+    def __call__(self, match, raw) -> None:
+        self.assess(match, self.parse(raw))
+
+    def assess(self, match, response) -> None:
+        """
+        Applies the assessment to an already parsed response, through
+        the partition the catalog keeps for it if the question is 
+        partitioned.
+        """
+        match.apply_assessment(self, response)
+
+    def scan(self, match, response) -> None:
+        """
+        Applies the assessment by visiting every active role, and 
+        records it in METRICS under the question key while enabled.
+        """
+        dataset = match.get_active_roles()
+        assessment = getattr(match, self.assessment)
+
+        if not METRICS.enabled:
+            assessment(dataset, *self.args, response, **self.kwargs)
+            return
+
+        eliminated_before = len(match.eliminated_roles)
+        start = time.perf_counter()
+
+        try:
+            assessment(dataset, *self.args, response, **self.kwargs)
+        finally:
+            METRICS.observe_assessment(self.question_key, time.perf_counter() - start, len(dataset),
+                len(match.eliminated_roles) - eliminated_before)
+
+# Built once at import, so each submitted answer only parses itself
+# and makes a single dictionary lookup
+ASSESSMENT_HANDLERS = {question_key: AssessmentHandler(question_key, assessment, args, eliminate)
+    for question_key, assessment, args, eliminate in ASSESSMENT_PLAN}
@@ -0,0 +1,459 @@
+from .keywords import *
+from . import parsers
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
+from typing import NamedTuple
+import hashlib
+import sys
+
+# Requirement columns whose top category is precomputed, along with
+# the keywords used to classify them and the record field holding it
+REQUIREMENT_KEYWORDS = {
+    "required_skills": REQ_SKILLS_KEYWORDS,
+    "required_experience": REQ_EXPERIENCE_KEYWORDS,
+    "preferred_experience": PREF_EXPERIENCE_KEYWORDS
+}
+
+TOP_CATEGORY_FIELDS = {
+    "required_skills": "top_required_skill",
+    "required_experience": "top_required_experience",
+    "preferred_experience": "top_preferred_experience"
+}
+
+# The only sheet columns scoring reads. Free text columns such as notes
+# or game_category are dropped when the catalog is built
+SCORING_COLUMNS = (
+    "role_name",
+    "age_min",
+    "age_preference",
+    "age_exception_allowed",
+    "physical_req",
+    "time_commitment",
+    "work_pref",
+    "leadership_pref",
+    "prior_first_exp",
+    "basic_game_knowledge",
+    "required_skills",
+    "required_experience",
+    "preferred_experience"
+)
+
+class RoleRow(Mapping):
+    """
+    A read-only row of the role sheet holding only the scoring 
+    columns. Cells live in slots rather than a per-row dict, which 
+    makes a row several times smaller than the dict it replaces.
+
+    Columns missing from the sheet are missing from the row, so 
+    row.get(column) behaves like it does on the original dict.
+    """
+    __slots__ = SCORING_COLUMNS
+
+    def __init__(self, cells: dict) -> None:
+        for column in SCORING_COLUMNS:
+            if column in cells:
+                object.__setattr__(self, column, cells[column])
+
+    def __getitem__(self, column: str):
+        if column not in SCORING_COLUMN_SET:
+            raise KeyError(column)
+
+        try:
+            return getattr(self, column)
+        except AttributeError:
+            raise KeyError(column) from None
+
+    def __iter__(self):
+        return (column for column in SCORING_COLUMNS if hasattr(self, column))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RoleRow is immutable")
+
+    def __reduce__(self):
+        return RoleRow, (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"RoleRow({dict(self)!r})"
+
+SCORING_COLUMN_SET = frozenset(SCORING_COLUMNS)
+
+# Distinct answers a catalog keeps partitions for. Only categorical
+# answers are partitioned, but multiselect answers still combine into
+# many sets, so answers past the limit are scanned instead
+MAX_PARTITIONS = 4096
+
+# Role entries a catalog's partitions may hold together. A partition
+# holds at most one score change per role, so large catalogs keep
+# fewer partitions and the cache stays bounded however many roles 
+# the sheet lists
+MAX_PARTITION_ENTRIES = 1 << 20
+
+class RoleRecord(NamedTuple):
+    """
+    The parsed, scoring-ready attributes of a single role.
+    """
+    index: int
+    role_name: str
+    age_min: int | float | str
+    age_pref: int | float | bool
+    age_exception_allowed: bool
+    physical_req: bool
+    requires_standing: bool
+    requires_moving: bool
+    time_commitment: int | float
+    work_pref: str | None
+    leadership_pref: bool
+    prior_experience: str
+    game_knowledge: str
+    top_required_skill: str | int | None
+    top_required_experience: str | int | None
+    top_preferred_experience: str | int | None
+
+class RolePartition(NamedTuple):
+    """
+    What one answer to one question does to every role of a catalog,
+    computed once and replayed on each session that gives the answer.
+
+    Attributes:
+        - deltas (dict): Role names mapped to their nonzero change in
+            score.
+        - eliminated (int): Bitmask of the roles the answer 
+            eliminates, see RoleCatalog.role_mask.
+    """
+    deltas: dict
+    eliminated: int
+
+class ThresholdIndex:
+    """
+    Role names sorted by a numeric threshold, such as a minimum age. 
+    The roles whose threshold is at most some value are a prefix of 
+    the order, found by binary search, so a role qualifies exactly 
+    when its rank is below that prefix's length.
+
+    Attributes:
+        - names (tuple[str]): Role names by ascending threshold.
+        - thresholds (tuple): The thresholds, aligned with names.
+        - ranks (dict): Each role name mapped to its position.
+    """
+    def __init__(self, thresholds: dict) -> None:
+        ordered = sorted(thresholds.items(), key=lambda item: item[1])
+        self.names = tuple(role_name for role_name, _ in ordered)
+        self.thresholds = tuple(threshold for _, threshold in ordered)
+        self.ranks = {role_name: rank for rank, role_name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def count_at_most(self, value) -> int:
+        """
+        Returns how many roles have a threshold <= value.
+        """
+        return bisect_right(self.thresholds, value)
+
+    def at_most(self, value) -> tuple[str]:
+        """
+        Returns the names of the roles with a threshold <= value.
+        """
+        return self.names[:self.count_at_most(value)]
+
+    def above(self, value) -> tuple[str]:
+        """
+        Returns the names of the roles with a threshold > value.
+        """
+        return self.names[self.count_at_most(value):]
+
+def categorize_requirement(raw_value, keywords: dict) -> str | int | None:
+    """
+    Classifies a requirement cell into its top keyword category.
+
+    Args:
+        - raw_value: The raw requirement cell.
+        - keywords (dict): Keywords used to classify the cell.
+
+    Returns:
+        - str | int | None: "NONE" for missing or False cells, None
+            for a bare True (the requirement is unspecified and
+            cannot be assessed), otherwise the top category.
+    """
+    if raw_value is None or raw_value is False:
+        return "NONE"
+
+    if raw_value is True:
+        return None
+
+    return get_top_skill_category(raw_value, keywords)
+
+def normalize_cell(value, convert_booleans: bool = False):
+    """
+    Normalizes a raw sheet cell: missing values (NaN) become None
+    and, optionally, "TRUE"/"FALSE" strings in any casing become
+    booleans.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+
+    if convert_booleans and isinstance(value, str):
+        lowered = value.lower()
+
+        if lowered == "true":
+            return True
+        elif lowered == "false":
+            return False
+
+    return value
+
+class RoleCatalog:
+    """
+    An immutable, preparsed view of the role sheet. Built once and
+    shared by every matching session, so starting a session never
+    touches the CSV.
+
+    Attributes:
+        - rows (tuple[RoleRow]): Read-only role rows with the 
+            normalized scoring cells.
+        - records (tuple[RoleRecord]): Parsed role attributes,
+            aligned with rows.
+        - role_names (tuple[str]): Role names in sheet order.
+        - rows_by_name (MappingProxyType): Each distinct role name 
+            mapped to its rows, in sheet order.
+        - version (int): Which load of the role sheet this is, 0 
+            until a CatalogWatcher publishes it.
+        - partitions (dict): RolePartitions of the answers sessions 
+            have given, keyed by (question key, canonical answer, 
+            student status). Filled in lazily by Matches and shared 
+            with every versioned copy.
+
+    Raises:
+        - TypeError: If a role's leadership_pref is not a boolean.
+    """
+    def __init__(self, rows: list[dict], convert_booleans: bool = False) -> None:
+        normalized = tuple(
+            RoleRow({key: normalize_cell(value, convert_booleans)
+                for key, value in row.items() if key in SCORING_COLUMN_SET})
+            for row in rows
+        )
+
+        records = tuple(self.build_record(index, row) for index, row in enumerate(normalized))
+        self._initialize(normalized, records)
+
+    def _initialize(self, normalized: tuple, records: tuple) -> None:
+        index_by_name = {}
+        rows_by_name = {}
+        for record in records:
+            # Duplicate role names share one scoreboard entry, keep the first row
+            index_by_name.setdefault(record.role_name, record.index)
+            rows_by_name.setdefault(record.role_name, []).append(normalized[record.index])
+
+        object.__setattr__(self, "rows", normalized)
+        object.__setattr__(self, "records", records)
+        object.__setattr__(self, "role_names", tuple(record.role_name for record in records))
+        object.__setattr__(self, "rows_by_name", MappingProxyType(
+            {role_name: tuple(role_rows) for role_name, role_rows in rows_by_name.items()}))
+        object.__setattr__(self, "_index_by_name", index_by_name)
+        object.__setattr__(self, "version", 0)
+        object.__setattr__(self, "partitions", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RoleCatalog is immutable")
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __contains__(self, role_name: str) -> bool:
+        return role_name in self._index_by_name
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        A hash of every parsed record. Catalogs with equal 
+        fingerprints score every volunteer identically, whichever 
+        process or reload built them.
+        """
+        return hashlib.sha256(repr(self.records).encode("utf-8")).hexdigest()
+
+    def _distinct_records(self):
+        # Duplicate role names are scored with their first record
+        return (self.records[index] for index in self._index_by_name.values())
+
+    @cached_property
+    def age_min_index(self) -> ThresholdIndex:
+        """
+        Roles with a numeric minimum age, by minimum age.
+        """
+        return ThresholdIndex({record.role_name: record.age_min for record
+            in self._distinct_records() if isinstance(record.age_min, int)})
+
+    @cached_property
+    def age_preference_index(self) -> ThresholdIndex:
+        """
+        Roles with an age preference, by preferred age.
+        """
+        return ThresholdIndex({record.role_name: record.age_pref for record
+            in self._distinct_records() if record.age_pref})
+
+    @cached_property
+    def student_roles(self) -> frozenset[str]:
+        """
+        Names of the roles open to students of any age.
+        """
+        return frozenset(record.role_name for record in self._distinct_records()
+            if record.age_min == "Students")
+
+    @cached_property
+    def time_commitment_index(self) -> ThresholdIndex:
+        """
+        Every role, by time commitment in days.
+        """
+        return ThresholdIndex({record.role_name: record.time_commitment
+            for record in self._distinct_records()})
+
+    def with_version(self, version: int) -> "RoleCatalog":
+        """
+        Returns a copy of the catalog tagged with version. The copy 
+        shares every row and record with this catalog.
+        """
+        catalog = self.__class__.__new__(self.__class__)
+        catalog.__dict__.update(self.__dict__)
+        object.__setattr__(catalog, "version", version)
+        return catalog
+
+    @classmethod
+    def from_parsed(cls, rows: tuple, records: tuple) -> "RoleCatalog":
+        """
+        Rebuilds a catalog from already normalized rows and parsed 
+        records, such as those stored in a snapshot, without parsing 
+        anything again.
+        """
+        catalog = cls.__new__(cls)
+        catalog._initialize(tuple(RoleRow(row) for row in rows), tuple(records))
+        return catalog
+
+    @classmethod
+    def from_dataframe(cls, df) -> "RoleCatalog":
+        """
+        Builds a catalog from the role sheet, converting string
+        booleans into Pythonic booleans.
+        """
+        return cls(df.to_dict(orient="records"), convert_booleans=True)
+
+    @classmethod
+    def from_csv(cls, data_path: str) -> "RoleCatalog":
+        """
+        Reads and parses the role sheet CSV at data_path.
+        """
+        import pandas as pd # Only needed when parsing the CSV
+
+        return cls.from_dataframe(pd.read_csv(data_path))
+
+    @staticmethod
+    def build_record(index: int, row: dict) -> RoleRecord:
+        """
+        Parses every scoring attribute of a single normalized row.
+        """
+        leadership = row.get("leadership_pref")
+
+        if leadership is None:
+            leadership = False
+
+        # Ensure that our data is formatted correctly
+        if not isinstance(leadership, bool):
+            raise TypeError(f"Input type for leadership is not boolean type "
+                f"for role {row.get('role_name')}")
+
+        work_pref = row.get("work_pref")
+        physical_req = row.get("physical_req")
+
+        return RoleRecord(
+            index=index,
+            role_name=row["role_name"],
+            age_min=parsers.parse_age_min(row.get("age_min")),
+            age_pref=parsers.parse_age_preference(row.get("age_preference")),
+            age_exception_allowed=bool(row.get("age_exception_allowed", False)),
+            physical_req=bool(physical_req),
+            requires_standing=parsers.requires_standing(physical_req),
+            requires_moving=parsers.requires_moving(physical_req),
+            time_commitment=parsers.parse_time_commitment(row.get("time_commitment")),
+            # Compared verbatim, as the sheet cell, so only "BTS" and "FRONT" match
+            work_pref=sys.intern(work_pref) if isinstance(work_pref, str) else work_pref,
+            leadership_pref=leadership,
+            prior_experience=parsers.parse_prior_first_experience(row.get("prior_first_exp")),
+            game_knowledge=parsers.parse_knowledge_of_game(row.get("basic_game_knowledge")),
+            **{field: categorize_requirement(row.get(req), REQUIREMENT_KEYWORDS[req])
+                for req, field in TOP_CATEGORY_FIELDS.items()}
+        )
+
+    def record(self, role_name: str) -> RoleRecord:
+        """
+        Returns the parsed record for a role.
+
+        Raises:
+            - KeyError: If the role is not in the catalog.
+        """
+        return self.records[self._index_by_name[role_name]]
+
+    def role_mask(self, role_names) -> int:
+        """
+        Packs role names into a bitmask, setting the bit at the index 
+        of each role's first record.
+
+        Raises:
+            - KeyError: If a role is not in the catalog.
+        """
+        mask = 0
+
+        for role_name in role_names:
+            mask |= 1 << self._index_by_name[role_name]
+
+        return mask
+
+    def masked_roles(self, mask: int, among=None) -> list[str]:
+        """
+        Unpacks a bitmask built by role_mask, walking whichever of the
+        set bits and among is smaller.
+
+        Args:
+            - mask (int): The bitmask.
+            - among (Collection[str] | None): Only return these roles.
+
+        Returns:
+            - list[str]: Names of the roles whose bits are set.
+        """
+        # Bit i of the mask is character i of the reversed binary string
+        bits = bin(mask)[:1:-1].ljust(len(self.records), "0")
+
+        if among is not None and len(among) < mask.bit_count():
+            index_by_name = self._index_by_name
+            return [role_name for role_name in among if bits[index_by_name[role_name]] == "1"]
+
+        role_names = []
+        position = bits.find("1")
+
+        while position != -1:
+            role_names.append(self.records[position].role_name)
+            position = bits.find("1", position + 1)
+
+        if among is None:
+            return role_names
+
+        return [role_name for role_name in role_names if role_name in among]
+
+    def top_category(self, role_name: str, req: str, keywords: dict) -> str | int | None:
+        """
+        Returns the top category of a role's requirement column,
+        using the precomputed value when the column is classified
+        with its default keywords.
+        """
+        record = self.record(role_name)
+
+        if REQUIREMENT_KEYWORDS.get(req) is keywords:
+            return getattr(record, TOP_CATEGORY_FIELDS[req])
+
+        return categorize_requirement(self.rows[record.index].get(req), keywords)
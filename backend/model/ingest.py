@@ -0,0 +1,233 @@
+"""
+Streaming ingestion of volunteer answer files. Rows are read, parsed
+into typed responses, scored and written out one at a time, so memory
+stays flat however long the file is.
+
+Run from the backend directory:
+    python -m model.ingest roles.snapshot volunteers.csv matches.jsonl --errors errors.jsonl
+"""
+from .answers import parse_answers
+from .catalog import RoleCatalog
+from .result_cache import RESULT_CACHE
+from typing import NamedTuple
+import csv
+import json
+import os
+
+# CSV cells of multiselect questions hold their choices separated by
+# semicolons, since the choices themselves contain commas
+MULTISELECT_QUESTIONS = ("required_skills", "experience")
+MULTISELECT_SEPARATOR = ";"
+
+class AnswerRow(NamedTuple):
+    """
+    One row of an answer file.
+
+    Attributes:
+        - row (int): Line number of the row in the file.
+        - responses (dict | None): Question keys mapped to parsed
+            responses, None if the row is malformed.
+        - error (str | None): Why the row is malformed.
+    """
+    row: int
+    responses: dict | None
+    error: str | None = None
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    elif extension == ".csv":
+        return "csv"
+
+    raise ValueError(f"Cannot tell the format of {path}, expected a .csv or .jsonl file")
+
+def normalize_csv_row(answers: dict) -> dict:
+    """
+    Drops empty cells, which are unanswered questions, and splits
+    multiselect cells into their choices.
+    """
+    answers = {key: value.strip() for key, value in answers.items()
+        if key is not None and isinstance(value, str) and value.strip()}
+
+    for key in MULTISELECT_QUESTIONS:
+        if key in answers:
+            answers[key] = [choice.strip() for choice in answers[key].split(MULTISELECT_SEPARATOR)
+                if choice.strip()]
+
+    return answers
+
+def is_undecodable(text: str) -> bool:
+    """
+    Checks if text kept bytes that are not UTF-8, which the answer 
+    file is read with surrogateescape to carry.
+    """
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return True
+
+    return False
+
+def read_raw_rows(path: str, file_format: str | None = None):
+    """
+    Yields (line number, raw answers or error message) for every row
+    of a CSV or JSONL answer file. Blank JSONL lines are skipped.
+    Rows that are not UTF-8, or that the csv module cannot parse, 
+    are reported without stopping the file.
+    """
+    file_format = file_format or detect_format(path)
+
+    with open(path, newline="", encoding="utf-8", errors="surrogateescape") as file:
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+
+            while True:
+                try:
+                    answers = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    # The failing line is consumed but not counted
+                    yield reader.line_num + 1, f"Invalid CSV: {e}"
+                    continue
+
+                if any(isinstance(value, str) and is_undecodable(value) for value in answers.values()):
+                    yield reader.line_num, "Invalid UTF-8"
+                    continue
+
+                yield reader.line_num, normalize_csv_row(answers)
+
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            if is_undecodable(line):
+                yield line_number, "Invalid UTF-8"
+                continue
+
+            try:
+                answers = json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {e}"
+                continue
+
+            if not isinstance(answers, dict):
+                yield line_number, "Expected an object of answers"
+                continue
+
+            yield line_number, answers
+
+def read_answer_rows(path: str, file_format: str | None = None):
+    """
+    Streams an answer file as typed responses, one row at a time.
+
+    Args:
+        - path (str): A .csv file with question keys as columns, or
+            a .jsonl file with one object of answers per line.
+        - file_format (str | None): "csv" or "jsonl", detected from
+            the extension if None.
+
+    Returns:
+        - Iterator[AnswerRow]: Parsed rows. Malformed rows carry an
+            error instead of responses.
+    """
+    for row, answers in read_raw_rows(path, file_format):
+        if isinstance(answers, str):
+            yield AnswerRow(row, None, answers)
+            continue
+
+        try:
+            yield AnswerRow(row, parse_answers(answers))
+        except (TypeError, ValueError) as e:
+            yield AnswerRow(row, None, str(e))
+
+def match_answer_file(
+    catalog: RoleCatalog,
+    path: str,
+    output,
+    errors=None,
+    num: int = 3,
+    student_status: bool = True,
+    file_format: str | None = None
+) -> dict:
+    """
+    Scores every row of an answer file and writes each row's ranked
+    roles as a JSON line as soon as it is scored. Repeated answer 
+    profiles are served from the result cache. Malformed rows are
+    reported and skipped.
+
+    Args:
+        - catalog (RoleCatalog): The roles to score against.
+        - path (str): The answer file.
+        - output (TextIO): Receives {"row", "Best fit roles", ...}
+            lines.
+        - errors (TextIO | None): Receives {"row", "error"} lines for
+            malformed rows, output if None.
+        - num (int): Number of best fit roles per row.
+        - student_status (bool): Student status of every volunteer.
+        - file_format (str | None): "csv" or "jsonl".
+
+    Returns:
+        - dict: Counts of rows read, matched and malformed.
+    """
+    errors = errors or output
+    summary = {"rows": 0, "matched": 0, "malformed": 0}
+
+    for answer_row in read_answer_rows(path, file_format):
+        summary["rows"] += 1
+
+        if answer_row.error is not None:
+            summary["malformed"] += 1
+            errors.write(json.dumps({"row": answer_row.row, "error": answer_row.error}) + "\n")
+            continue
+
+        best_roles = RESULT_CACHE.best_fit_roles(catalog, answer_row.responses, num, student_status)
+
+        output.write(json.dumps({"row": answer_row.row, **best_roles}) + "\n")
+        summary["matched"] += 1
+
+    return summary
+
+def load_catalog(path: str) -> RoleCatalog:
+    """
+    Loads a catalog snapshot, or parses a role sheet CSV.
+    """
+    from .snapshot import load_snapshot, SnapshotError
+
+    try:
+        return load_snapshot(path)
+    except SnapshotError:
+        return RoleCatalog.from_csv(path)
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scores a volunteer answer file row by row")
+    parser.add_argument("catalog", help="Role sheet CSV or catalog snapshot")
+    parser.add_argument("answers", help="Answer file, .csv or .jsonl")
+    parser.add_argument("output", help="Where to write one JSON line of ranked roles per row")
+    parser.add_argument("--errors", help="Where to write malformed rows, the output by default")
+    parser.add_argument("--num", type=int, default=3, help="Best fit roles per volunteer")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Answer file format")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(args.catalog)
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        if args.errors:
+            with open(args.errors, "w", encoding="utf-8") as errors:
+                summary = match_answer_file(catalog, args.answers, output, errors, args.num,
+                    file_format=args.format)
+        else:
+            summary = match_answer_file(catalog, args.answers, output, num=args.num,
+                file_format=args.format)
+
+    print(f"Matched {summary['matched']} of {summary['rows']} rows, "
+        f"{summary['malformed']} malformed")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,10 @@
+from .metrics import METRICS
+from functools import lru_cache
 import re
 
+# Bound on memoized (text, keyword set) categorization results
+TOP_CATEGORY_CACHE_SIZE = 4096
+
 PREF_EXPERIENCE_KEYWORDS = {
     "FRC CONTROL SYSTEM EXPERIENCE": [
         "frc control system", "hands-on frc control system", "control system experience",
@@ -163,11 +168,70 @@ REQ_EXPERIENCE_KEYWORDS = {
     ]
 }
 
+# Zero-width matches at every word boundary, where any keyword match must start
+_WORD_BOUNDARY = re.compile(r"\b")
+
+class KeywordTrie:
+    """
+    A character trie over lowercase keywords. Walking it from every 
+    word boundary of a text finds all keyword occurrences, including 
+    overlapping ones, in a single scan.
+
+    Attributes:
+        keywords (list[str]): The distinct keywords, lowercased.
+    """
+    def __init__(self, keywords):
+        """
+        Builds the trie.
+
+        Args:
+            keywords (Iterable[str]): The keywords to search for.
+        """
+        self.keywords = list(dict.fromkeys(kw.lower() for kw in keywords if kw))
+
+        # Each node maps a character to its child, None marks the keyword ending there
+        self._root = {}
+
+        for keyword in self.keywords:
+            node = self._root
+
+            for char in keyword:
+                node = node.setdefault(char, {})
+
+            node[None] = keyword
+
+    def find_all(self, text: str):
+        """
+        Yields (start, keyword) for every keyword occurrence in an 
+        already lowercased text that starts and ends on a word 
+        boundary.
+        """
+        starts = [match.start() for match in _WORD_BOUNDARY.finditer(text)]
+        boundaries = set(starts)
+        root = self._root
+
+        for start in starts:
+            node = root.get(text[start]) if start < len(text) else None
+            end = start + 1
+
+            while node is not None:
+                keyword = node.get(None)
+
+                if keyword is not None and end in boundaries:
+                    yield start, keyword
+
+                node = node.get(text[end]) if end < len(text) else None
+                end += 1
+
 class RegexSkillCategorizer:
     """
     A class that categorizes a given string into predefined skill 
     categories using keyword-based regular expression matching.
 
+    ASCII input is scanned once with a trie of every keyword, crediting 
+    each category a hit belongs to with the same counts its pattern 
+    would produce. Other input falls back to the compiled patterns.
+
     Attributes:
         category_patterns (dict): A dictionary mapping category 
             names to compiled regex patterns.
@@ -184,11 +248,25 @@ class RegexSkillCategorizer:
         """
         self.category_patterns = {}
 
+        # Lowercased keyword -> (category, position in the category's alternation)
+        self._keyword_categories = {}
+        self._ascii_only = True
+
         for category, keyword in keywords.items():
             escaped_keywords = [re.escape(kw) for kw in keyword if kw]
             pattern = r'\b(' + '|'.join(escaped_keywords) + r')\b'
             self.category_patterns[category] = re.compile(pattern, re.IGNORECASE)
 
+            # An empty alternation matches at every word boundary, leave it to regex
+            if not escaped_keywords:
+                self._ascii_only = False
+
+            for rank, kw in enumerate(kw for kw in keyword if kw):
+                self._ascii_only = self._ascii_only and kw.isascii()
+                self._keyword_categories.setdefault(kw.lower(), []).append((category, rank))
+
+        self._trie = KeywordTrie(self._keyword_categories)
+
     def categorize_skills(self, raw_str: str):
         """
         Categorizes the input string by counting keyword matches for 
@@ -204,7 +282,39 @@ class RegexSkillCategorizer:
         """
         if not raw_str:
             return {}
-        
+
+        if not self._ascii_only or not isinstance(raw_str, str) or not raw_str.isascii():
+            return self.categorize_skills_regex(raw_str)
+
+        # Per category, the earliest alternative matching at each start position
+        best = {category: {} for category in self.category_patterns}
+
+        for start, keyword in self._trie.find_all(raw_str.lower()):
+            for category, rank in self._keyword_categories[keyword]:
+                current = best[category].get(start)
+
+                if current is None or rank < current[0]:
+                    best[category][start] = (rank, len(keyword))
+
+        # Replay each category's left to right, non-overlapping scan
+        category_scores = {}
+        for category, starts in best.items():
+            count, resume = 0, 0
+
+            for start in sorted(starts):
+                if start >= resume:
+                    count += 1
+                    resume = start + starts[start][1]
+
+            category_scores[category] = count
+
+        return category_scores
+
+    def categorize_skills_regex(self, raw_str: str):
+        """
+        Categorizes the input string with one regex scan per 
+        category. Used for input the keyword trie does not cover.
+        """
         category_scores = {}
         for category, pattern in self.category_patterns.items():
             matches = pattern.findall(raw_str)
@@ -226,5 +336,55 @@ class RegexSkillCategorizer:
         max_score = max(category_skills, key=category_skills.get)
         return max_score
 
+# Categorizers keyed by the identity of their keyword dict. The dict is
+# kept alive alongside its categorizer so its id is never reused, and
+# keyword dicts are expected not to change once they have been used.
+_categorizers = {}
+
+def get_categorizer(keywords: dict) -> RegexSkillCategorizer:
+    """
+    Returns the shared categorizer for a keyword dict, compiling it 
+    on first use.
+
+    Args:
+        keywords (dict): Category names mapped to lists of keywords.
+
+    Returns:
+        RegexSkillCategorizer: The categorizer for keywords.
+    """
+    entry = _categorizers.get(id(keywords))
+
+    if entry is None:
+        entry = (keywords, RegexSkillCategorizer(keywords))
+        _categorizers[id(keywords)] = entry
+
+    return entry[1]
+
+@lru_cache(maxsize=TOP_CATEGORY_CACHE_SIZE)
+def _cached_top_category(raw_str: str, keywords_id: int):
+    categorizer = _categorizers[keywords_id][1]
+    return categorizer.get_top_category(categorizer.categorize_skills(raw_str))
 
+def get_top_skill_category(raw_str: str, keywords: dict):
+    """
+    Categorizes a text and returns its top category, memoized per 
+    (text, keyword dict) pair.
+
+    Args:
+        raw_str (str): A text description potentially containing 
+            skill-related information.
+        keywords (dict): Category names mapped to lists of keywords.
+
+    Returns:
+        str | int: The top category, or -1 for an empty text.
+    """
+    get_categorizer(keywords)
+    return _cached_top_category(raw_str, id(keywords))
+
+def top_category_cache_info():
+    """
+    Returns hit and miss statistics of the top category memo.
+    """
+    return _cached_top_category.cache_info()
 
+METRICS.register_cache("top_skill_category", top_category_cache_info)
@@ -1,40 +1,60 @@
 from .response import *
 from .keywords import *
-import pandas as pd
-import re
-
-data = "/Users/chansoon/Downloads/Matching Logic - Sheet1.csv"
+from .catalog import RoleCatalog, RolePartition, MAX_PARTITIONS, MAX_PARTITION_ENTRIES
+from .answers import ASSESSMENT_HANDLERS, parse_answers, canonical_answer
+from .metrics import METRICS
+from . import parsers
+from collections import Counter
+import heapq
+import sys
+import time
 
 class Matches:
-    def __init__(self, student_status, data_path=None, dataset=None):
-        self.index = -1 # Start a negative because we immediately increment
+    def __init__(self, student_status, data_path=None, dataset=None, catalog=None):
+        # A shared, preparsed catalog makes starting a session cheap
+        if catalog is not None:
+            self.catalog = catalog
+
+        elif not dataset:
+            import pandas as pd # Only needed when reading the CSV directly
 
-        if not dataset:
             self.df = pd.read_csv(data_path)
-            self.all_role_names = self.df["role_name"].tolist()
 
-            # Initialize dataset with booleans converted
-            self.dataset = self.create_dataset(convert_booleans=True)
+            # Initialize catalog with booleans converted
+            self.catalog = RoleCatalog.from_dataframe(self.df)
             
         # If a dataset is directly provided, used primarily for testing
         else:
-            self.dataset = dataset
+            self.catalog = RoleCatalog(dataset)
+
+        self.dataset = self.catalog.rows
+        self.all_role_names = list(self.catalog.role_names)
             
         # Create a scoreboard to keep track of the best match
-        self.all_role_scoreboard = {role["role_name"] : 0 for role in self.dataset}
+        self.all_role_scoreboard = dict.fromkeys(self.catalog.role_names, 0)
         
         self.eliminated_roles = set()
 
+        # Rows of the roles still in consideration, keyed by role name.
+        # Eliminating a role deletes its entry, so assessments only visit
+        # surviving roles and counting them is O(1)
+        self.active_roles = dict(self.catalog.rows_by_name)
+
         # # TODO: integrate age_exception_datasets in the future if needed
         # self.age_exception_dataset = self.create_special_dataset("age_exception_allowed")
 
         self.student_status = student_status
 
+        # Answers applied by next_assessment, in order, so a shared 
+        # session store can rebuild this session in another worker
+        self.answer_log = []
+
     def create_dataset(self, convert_booleans: bool = False) -> list[dict]:
         """
         Converts a pandas dataframe into a dataset (list of dicts), 
         with an option to convert string booleans into actual 
-        booleans.
+        booleans. Sessions that were not read from a CSV return 
+        their catalog's rows, normalized when the catalog was built.
 
         Args: 
             - convert_booleans (bool, optional): If True, converts 
@@ -45,6 +65,9 @@ class Matches:
             - list[dict]: Dataset as a list of dictionaries, each 
                 representing a row.
         """
+        if getattr(self, "df", None) is None:
+            return [dict(role) for role in self.catalog.rows]
+
         df_copy = self.df.copy()
 
         if convert_booleans:
@@ -88,16 +111,19 @@ class Matches:
                 "eliminate"
         """
         self.eliminated_roles.add(role_name)
+        self.active_roles.pop(role_name, None)
 
     def get_active_roles(self) -> list[dict]:
         """
-        Returns only the roles that haven't been eliminated.
+        Returns only the roles that haven't been eliminated. The 
+        list is a snapshot, so assessments may eliminate roles 
+        while iterating over it.
         
         Returns:
             - list[dict]: Dataset filtered to exclude 
                 eliminated roles.
         """
-        return [role for role in self.dataset if role["role_name"] not in self.eliminated_roles]
+        return [role for rows in self.active_roles.values() for role in rows]
 
     def extract_numerical_value(self, raw_str: str) -> int | float:
         """
@@ -120,36 +146,7 @@ class Matches:
             - ZeroDivisionError: If the fraction extraction's 
                 denominator is 0.
         """
-        if not raw_str or pd.isna(raw_str):
-            return -1
-            
-        raw_str = str(raw_str).strip()
-
-        # Ensure that the string contains at least one digit
-        if not any(digit.isnumeric() for digit in raw_str):
-            return -1  # Return -1 instead of raising error
-
-        # Extract fractions
-        fraction_match = re.search(r"(-?\d+)\s*/\s*(\d+)", raw_str)
-        if fraction_match:
-            numerator, denominator = fraction_match.groups()
-
-            if int(denominator) == 0:
-                return -1  # Return -1 instead of raising error
-
-            return float(numerator) / float(denominator)
-
-        # Extract decimals
-        decimal_match = re.search(r"-?\d+\.\d+", raw_str)
-        if decimal_match:
-            return float(decimal_match.group())
-        
-        # Extract ints 
-        int_match = re.search(r"-?\d+", raw_str) 
-        if int_match:
-            return int(int_match.group())
-
-        return -1 
+        return parsers.extract_numerical_value(raw_str)
 
     def assess_age(
         self, 
@@ -186,56 +183,40 @@ class Matches:
         if not isinstance(self.student_status, bool):
             raise TypeError("Input student status is not type boolean.")
 
-        for role in dataset:
-            role_name = role["role_name"]
-            
-            age_min_raw = role["age_min"]
-            age_pref_raw = role["age_preference"]
-
-            # Get a safe age minimum
-            if str(age_min_raw).isnumeric():
-                age_min = int(age_min_raw)
-            elif age_min_raw == "Students":
-                age_min = "Students"
-            else:
-                # Try to extract as many numbers as possible
-                age_min = self.extract_numerical_value(age_min_raw)
-            
-            # Get a safe age preference
-            if age_pref_raw:
-                if str(age_pref_raw).isnumeric():
-                    age_pref = int(age_pref_raw)
-                else:
-                    age_pref = self.extract_numerical_value(age_pref_raw)
-            else:
-                age_pref = False # Default age preference value
+        # Each row is scored, so duplicate role names count once per row
+        rows = Counter(role["role_name"] for role in dataset)
+        scoreboard = self.all_role_scoreboard
 
-            # Check if role should be eliminated
-            age_qualified = False
-            
-            if isinstance(age_min, int) and age_min <= age:
-                age_qualified = True
-                if not age_pref:
-                    self.all_role_scoreboard[role_name] += 5
-                elif age_pref and age_pref > age:
-                    self.all_role_scoreboard[role_name] += 3
-            
-            # Check student status qualification
-            if self.student_status and age_min == "Students":
-                age_qualified = True
-                self.all_role_scoreboard[role_name] += 5
-            
-            # IMPORTANT: Only eliminate if not qualified AND elimination is enabled 
-            # AND age exceptions are NOT allowed for this role
-            if eliminate_unqualified and not age_qualified:
-                age_exception_allowed = role.get("age_exception_allowed", False)
-                
-                if not age_exception_allowed:
+        # Binary search splits the roles by minimum and preferred age,
+        # so only the slices meeting the dataset are visited
+        age_qualified = rows.keys() & self.catalog.age_min_index.at_most(age)
+        age_preferred = self.catalog.age_preference_index
+
+        for role_name in age_qualified - age_preferred.ranks.keys():
+            scoreboard[role_name] += 5 * rows[role_name]
+
+        for role_name in age_qualified.intersection(age_preferred.above(age)):
+            scoreboard[role_name] += 3 * rows[role_name]
+
+        # Check student status qualification
+        if self.student_status:
+            students = rows.keys() & self.catalog.student_roles
+
+            for role_name in students:
+                scoreboard[role_name] += 5 * rows[role_name]
+
+            age_qualified |= students
+
+        # IMPORTANT: Only eliminate if not qualified AND elimination is enabled 
+        # AND age exceptions are NOT allowed for this role
+        if eliminate_unqualified:
+            for role_name in rows.keys() - age_qualified:
+                if not self.catalog.record(role_name).age_exception_allowed:
                     self.eliminate_role(role_name)
                 else:
                     # Age exception is possible, don't eliminate but give lower score
                     # This role stays in consideration but gets a penalty
-                    self.all_role_scoreboard[role_name] -= 3
+                    scoreboard[role_name] -= 3 * rows[role_name]
     
     def assess_physical_ability(
             self, 
@@ -269,17 +250,18 @@ class Matches:
         
         for role in dataset:
             role_name = role["role_name"]
+            physical_req = self.catalog.record(role_name).physical_req
 
             if response.yes:
-                if role["physical_req"]:
+                if physical_req:
                     self.all_role_scoreboard[role_name] += 5
-                elif eliminate_unqualified and not role["physical_req"]:
+                elif eliminate_unqualified and not physical_req:
                     # User wants physical roles but this role isn't physical
                     self.eliminate_role(role_name)
             elif response.no:
-                if not role["physical_req"]:
+                if not physical_req:
                     self.all_role_scoreboard[role_name] += 5
-                elif eliminate_unqualified and role["physical_req"]:
+                elif eliminate_unqualified and physical_req:
                     # User doesn't want physical roles but this role is physical
                     self.eliminate_role(role_name)
 
@@ -307,13 +289,8 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
             
-            # Check if physical_req contains "stand" or "walk"
-            physical_req = role.get("physical_req", "")
-            requires_standing = False
-            
-            if isinstance(physical_req, str):
-                physical_req_lower = physical_req.lower()
-                requires_standing = "stand" in physical_req_lower or "walk" in physical_req_lower
+            # Whether physical_req contains "stand" or "walk"
+            requires_standing = self.catalog.record(role_name).requires_standing
             
             if response.no and requires_standing and eliminate_unqualified:
                 # User cannot stand but role requires standing/walking
@@ -347,15 +324,8 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
             
-            # Check if physical_req contains movement-related terms
-            physical_req = role.get("physical_req", "")
-            requires_moving = False
-            
-            if isinstance(physical_req, str):
-                physical_req_lower = physical_req.lower()
-                # Check for various movement-related terms
-                movement_terms = ["move", "walk", "run", "carry", "lift", "transport", "stand"]
-                requires_moving = any(term in physical_req_lower for term in movement_terms)
+            # Whether physical_req contains movement-related terms
+            requires_moving = self.catalog.record(role_name).requires_moving
             
             if response.no and requires_moving and eliminate_unqualified:
                 # User cannot move but role requires moving
@@ -386,26 +356,7 @@ class Matches:
         NOTE: Time commitment is expected to either be in days
         or hours format.
         """
-        if not time_commitment or pd.isna(time_commitment):
-            return 0  # Default to 0 for missing data
-
-        time_commitment = str(time_commitment).strip()
-        
-        # Handle special cases
-        if not time_commitment or time_commitment.lower() in ['varies', 'variable', 'tbd', 'to be determined']:
-            return 0  # Default to 0 for variable commitments
-
-        # Handle the case that the input is in the hours format
-        in_hours = False
-        if "hours" in time_commitment.lower() or "hr" in time_commitment.lower():
-            in_hours = True
-
-        time_extracted = self.extract_numerical_value(time_commitment)
-
-        if time_extracted == -1 or time_extracted <= 0:
-            return 0  # Default to 0 for invalid extractions
-
-        return time_extracted if not in_hours else time_extracted / 8
+        return parsers.parse_time_commitment(time_commitment)
 
     def assess_availability(
         self, 
@@ -435,26 +386,26 @@ class Matches:
         if availability.defined:
             assert(availability.days is not None), "Days of availability is not defined"
 
-        for role in dataset:
-            role_name = role["role_name"]
-            
-            raw_time_commitment = role["time_commitment"]
-            
-            # Increment roles that vary in time commitment indiscriminately
-            if raw_time_commitment.isalpha() and "varies" in raw_time_commitment.lower():
-                time_commitment = 0
-            else:
-                time_commitment = self.parse_time_commitment(raw_time_commitment)
+        # Each row is scored, so duplicate role names count once per row
+        rows = Counter(role["role_name"] for role in dataset)
 
-            if availability.completely:
-                # User is available for all days, so all roles qualify
-                self.all_role_scoreboard[role_name] += 5
-            elif availability.defined:
-                if availability.days >= time_commitment:
-                    self.all_role_scoreboard[role_name] += 5
-                elif eliminate_unqualified and availability.days < time_commitment:
-                    # User doesn't have enough availability for this role
+        if availability.completely:
+            # User is available for all days, so all roles qualify
+            qualified = rows.keys()
+        elif availability.defined:
+            # Roles that vary in time commitment are parsed as 0 days.
+            # Binary search finds those needing at most the available days
+            qualified = rows.keys() & self.catalog.time_commitment_index.at_most(availability.days)
+
+            if eliminate_unqualified:
+                # User doesn't have enough availability for these roles
+                for role_name in rows.keys() - qualified:
                     self.eliminate_role(role_name)
+        else:
+            qualified = ()
+
+        for role_name in qualified:
+            self.all_role_scoreboard[role_name] += 5 * rows[role_name]
 
     def assess_working_pref(
         self, 
@@ -492,7 +443,7 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
             
-            working_pref = role["work_pref"]
+            working_pref = self.catalog.record(role_name).work_pref
 
             if pref.choice == "NO_PREF":
                 # No preference, so all roles get equal treatment
@@ -535,11 +486,8 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
             
-            leadership = role.get("leadership_pref", False)
-
-            # Ensure that our data is formatted correctly
-            if not isinstance(leadership, bool):
-                raise TypeError("Input type for leadership is not boolean type")
+            # Validated as a boolean when the catalog was built
+            leadership = self.catalog.record(role_name).leadership_pref
 
             # User prefers roles with leadership
             if response.yes and leadership:
@@ -574,45 +522,7 @@ class Matches:
             str: One of "REQUIRED", "PREFERRED", "FALSE", or 
             "UNKNOWN"
         """
-        if not raw_value:
-            return "UNKNOWN"
-
-        if not isinstance(raw_value, str) and not isinstance(raw_value, bool):
-            raise TypeError("Cannot parse user input for prior experience "
-                    f"as it is not str or bool")
-
-        # Bool
-        if isinstance(raw_value, bool):
-            if raw_value:
-                return "REQUIRED"
-            else:
-                return "FALSE"
-        
-        # Str 
-        if isinstance(raw_value, str):
-            raw_value = raw_value.strip().upper()
-            
-            if "FALSE" in raw_value:
-                return "FALSE"
-            elif "TRUE" in raw_value:
-                return "REQUIRED"
-            elif "PREFERRED" in raw_value:
-                return "PREFERRED"
-
-            # In the case that the raw value is missing above keywords
-            req_keywords = ["must", "required", "years", "prior years",
-                "minimum", "experience required"]
-
-            pref_keywords = ["recommended", "helpful", "knowledge of",
-                "general knowledge", "understanding of"]
-            
-            if any(indicator in raw_value.lower() for indicator in req_keywords):
-                return "REQUIRED"
-
-            if any(indicator in raw_value.lower() for indicator in pref_keywords):
-                return "PREFERRED"
-
-        return "UNKNOWN" # Last case
+        return parsers.parse_prior_first_experience(raw_value)
 
     def assess_prior_first_experience(self, dataset: list[dict], response: bool):
         """
@@ -636,7 +546,7 @@ class Matches:
 
         for role in dataset:
             role_name = role["role_name"]
-            prior_experience = self.parse_prior_first_experience(role["prior_first_exp"])
+            prior_experience = self.catalog.record(role_name).prior_experience
 
             # User has prior first experience
             if response:     
@@ -666,48 +576,7 @@ class Matches:
             - str: One of "NONE", "LIMITED", "AVERAGE", 
             "THOROUGH", or "UNKNOWN"
         """
-        if not raw_value:
-            return "UNKNOWN"
-        
-        if not isinstance(raw_value, str) and not isinstance(raw_value, bool):
-            raise TypeError("Cannot parse user input for game knowledge \
-                    as it is not str or bool")
-
-        # Bool
-        if isinstance(raw_value, bool):
-            if raw_value:
-                return "LIMITED"
-            else:
-                return "NONE"
-
-        # Str
-        if isinstance(raw_value, str):
-            raw_value = raw_value.strip()
-            raw_value_upper = raw_value.upper()
-            raw_value_lower = raw_value.lower()
-
-            # Direct string matches
-            if "FALSE" in raw_value_upper:
-                return "NONE"
-
-            # Ensure that only True is present 
-            elif "TRUE" in raw_value_upper and len(raw_value_upper) == 4:
-                return "LIMITED"
-
-            # Keywords for mapping levels
-            thorough_keywords = ["thorough", "advanced", "in-depth"]
-            average_keywords = ["average", "familiar", "general knowledge"]
-            limited_keywords = ["can learn", "basic", "some knowledge"]
-
-            if any(keyword in raw_value_lower for keyword in thorough_keywords):
-                return "THOROUGH"
-            elif any(keyword in raw_value_lower for keyword in average_keywords):
-                return "AVERAGE"
-            elif any(keyword in raw_value_lower for keyword in limited_keywords):
-                return "LIMITED"
-
-        # If no matches, return unknown
-        return "UNKNOWN"
+        return parsers.parse_knowledge_of_game(raw_value)
 
     def assess_knowledge_of_game(
         self, 
@@ -752,7 +621,7 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
             
-            game_knowledge = self.parse_knowledge_of_game(role["basic_game_knowledge"])
+            game_knowledge = self.catalog.record(role_name).game_knowledge
             
             # Handle unknown or invalid game knowledge requirements
             if game_knowledge == "UNKNOWN":
@@ -798,9 +667,8 @@ class Matches:
                 raise ValueError("Data input for requirement checking is the "
                             "unspecified bool True when specified require skills are needed.")
     
-        categorizer = RegexSkillCategorizer(keywords)
-        role_skills = categorizer.categorize_skills(skill_data)
-        return categorizer.get_top_category(role_skills)
+        # Shared categorizers and memoized results, no regex compiling per role
+        return get_top_skill_category(skill_data, keywords)
 
     def assess_requirements_general(
         self, 
@@ -845,8 +713,7 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
 
-            req_skill = role[req]
-            top_req_skill = self.get_top_skill_category(req_skill, keywords)
+            top_req_skill = self.catalog.top_category(role_name, req, keywords)
             
             if not top_req_skill:
                 continue
@@ -900,8 +767,7 @@ class Matches:
         for role in dataset:
             role_name = role["role_name"]
 
-            req_skill = role[req]
-            top_req_skill = self.get_top_skill_category(req_skill, keywords)
+            top_req_skill = self.catalog.top_category(role_name, req, keywords)
             
             if not top_req_skill:
                 continue
@@ -909,81 +775,180 @@ class Matches:
             if top_req_skill in responses:
                 self.all_role_scoreboard[role_name] += 3
 
-    def next_assessment(self, data: dict, eliminate_unqualified=False):
-        self.index += 1
-
-        assessment = [
-            match.assess_age,
-            match.assess_physical_ability,
-            match.assess_availability,
-            match.assess_working_pref,
-            match.leadership_pref,
-            match.assess_prior_first_experience, 
-            match.assess_knowledge_of_game, 
-            match.assess_requirements_general,
-            match.assess_requirements_general
-        ]
-
-        curr_assessment = assessment[self.index]
-        # Ineffective, currently reconstructs params every function call when not necessary
-        params = construct_params(match.dataset, data) 
-        curr_params = params[data["question_id"]]
-
-        curr_assessment(**curr_params)
-
-    def construct_params(self, dataset, data):
-        params = {
-            "age": {
-                "dataset": dataset,
-                "response": data["answer"],
-                "eliminate_unqualified": True
-            },
-            "physical ability": {
-                "dataset": dataset,
-                "response": PreferenceResponse(["answer"]),
-                "eliminate_unqualified": True
-            },
-            "availability": {
-                "dataset": dataset,
-                "response": AvailabilityResponse(["answer"]),
-                "eliminate_unqualified": True
-            },
-            "working preference": {
-                "dataset": dataset,
-                "response": MultiChoiceResponse(["answer"], {"NO_PREF", "BTS", "FRONT"}),
-                "eliminate_unqualified": True
-            },
-            "leadership preference": {
-                "dataset": dataset,
-                "response": PreferenceResponse(["answer"]),
-                "eliminate_unqualified": True
-            },
-            "prior first experience": {
-                "dataset": dataset,
-                "response": ["answer"]  # Boolean, probably True/False
-            },
-            "knowledge of game": {
-                "dataset": dataset,
-                "response": ["answer"],  # e.g. "LIMITED"
-                "eliminate_unqualified": True
-            },
-            "required skills": {
-                "dataset": dataset,
-                "requirement_field": "required_skills",
-                "keywords": REQ_SKILLS_KEYWORDS,
-                "responses": {["answer"]},  # assuming it's a string like "PROGRAMMING PROFICIENCY"
-                "eliminate_unqualified": True
-            },
-            "required experience": {
-                "dataset": dataset,
-                "requirement_field": "required_experience",
-                "keywords": REQ_EXPERIENCE_KEYWORDS,
-                "responses": {["answer"]},
-                "eliminate_unqualified": True
-            }
-        }
+    def partition(self, handler, response) -> RolePartition | None:
+        """
+        Returns what an answer does to every role of the catalog. The 
+        first session giving the answer scans all roles once, every 
+        later one reuses the partition kept on the catalog. A role's 
+        outcome never depends on the other roles, so replaying the 
+        partition on any subset of roles matches scanning them.
+
+        Args:
+            - handler (AssessmentHandler): The question's step of the 
+                assessment pipeline.
+            - response: The parsed answer.
+
+        Returns:
+            - RolePartition | None: None if the answer cannot be 
+                cached, because its question is not partitioned, it 
+                is unhashable or the catalog's partitions are full.
 
-        return params
+        Raises:
+            - TypeError | ValueError: If the answer is malformed.
+        """
+        if not handler.partitioned:
+            return None
+
+        partitions = self.catalog.partitions
+
+        # Computed before scanning, which adds "NONE" to multiselect sets
+        key = (handler.question_key, canonical_answer(response), self.student_status)
+
+        try:
+            partition = partitions.get(key)
+        except TypeError:
+            return None
+
+        limit = min(MAX_PARTITIONS, MAX_PARTITION_ENTRIES // max(len(self.catalog.rows_by_name), 1))
+
+        if partition is not None or len(partitions) >= limit:
+            return partition
+
+        # Called directly rather than through handler.scan, so building 
+        # partitions stays out of the metrics
+        scratch = Matches(student_status=self.student_status, catalog=self.catalog)
+        getattr(scratch, handler.assessment)(scratch.get_active_roles(), *handler.args, response, **handler.kwargs)
+
+        partition = RolePartition(
+            deltas={role_name: score for role_name, score
+                in scratch.all_role_scoreboard.items() if score},
+            eliminated=self.catalog.role_mask(scratch.eliminated_roles)
+        )
+
+        return partitions.setdefault(key, partition)
+
+    def apply_assessment(self, handler, response) -> None:
+        """
+        Applies a parsed answer through its partition, only touching 
+        the active roles it changes. Answers without a partition are 
+        scanned instead.
+
+        Args:
+            - handler (AssessmentHandler): The question's step of the 
+                assessment pipeline.
+            - response: The parsed answer.
+        """
+        partition = self.partition(handler, response)
+
+        if partition is None:
+            handler.scan(self, response)
+            return
+
+        start = time.perf_counter() if METRICS.enabled else None
+        active_roles = self.active_roles
+        scoreboard = self.all_role_scoreboard
+        deltas = partition.deltas
+        scored = 0
+
+        # Walk whichever side is smaller
+        if len(deltas) <= len(active_roles):
+            for role_name, delta in deltas.items():
+                if role_name in active_roles:
+                    scoreboard[role_name] += delta
+                    scored += 1
+        else:
+            for role_name in active_roles:
+                delta = deltas.get(role_name)
+
+                if delta:
+                    scoreboard[role_name] += delta
+                    scored += 1
+
+        eliminated = self.catalog.masked_roles(partition.eliminated, active_roles)
+
+        for role_name in eliminated:
+            self.eliminate_role(role_name)
+
+        if start is not None:
+            # Only the roles the partition changed were visited
+            touched = scored + sum(1 for role_name in eliminated if role_name not in deltas)
+            METRICS.observe_assessment(handler.question_key, time.perf_counter() - start,
+                touched, len(eliminated))
+
+    def next_assessment(self, data: dict) -> None:
+        """
+        Applies a single submitted answer to the session.
+
+        Args:
+            - data (dict): The answer under "answer" and its 
+                questions.py key under "question_id".
+
+        Raises:
+            - ValueError: If the question_id is not a question.
+            - TypeError | ValueError: If the answer is malformed.
+        """
+        handler = ASSESSMENT_HANDLERS.get(data["question_id"])
+
+        if handler is None:
+            raise ValueError(f"Unknown question_id '{data['question_id']}', expected "
+                f"one of {list(ASSESSMENT_HANDLERS)}")
+
+        handler(self, data["answer"])
+        self.answer_log.append([data["question_id"], data["answer"]])
+
+    def assess_answers(self, answers: dict) -> None:
+        """
+        Runs the whole assessment pipeline, from assess_age through 
+        assess_requirements_general, for a complete answer set. 
+        Unanswered questions are skipped, and each assessment only 
+        visits the roles that survived the previous ones.
+
+        Args:
+            - answers (dict): questions.py keys mapped to the raw 
+                answers sent by the front end.
+
+        Raises:
+            - TypeError | ValueError: If an answer is malformed, 
+                before any score is changed.
+        """
+        self.assess_responses(parse_answers(answers))
+
+    def assess_responses(self, responses: dict) -> None:
+        """
+        Runs the assessment pipeline on answers that were already 
+        parsed, e.g. by parse_answers.
+
+        Args:
+            - responses (dict): questions.py keys mapped to parsed 
+                responses.
+        """
+        for question_key, handler in ASSESSMENT_HANDLERS.items():
+            if question_key in responses:
+                handler.assess(self, responses[question_key])
+
+    def score_batch(self, answers_table) -> "BatchResult":
+        """
+        Scores many volunteers against this session's catalog in one
+        pass, without touching this session's scoreboard. Requires 
+        numpy.
+
+        Args:
+            - answers_table (list[dict] | pd.DataFrame): One row per 
+                volunteer, with questions.py keys as columns.
+
+        Returns:
+            - BatchResult: N x M score matrix and elimination mask.
+        """
+        # A DataFrame can only be passed in if pandas is already imported
+        pd = sys.modules.get("pandas")
+
+        if pd is not None and isinstance(answers_table, pd.DataFrame):
+            answers_table = answers_table.to_dict(orient="records")
+
+        # The vectorized engine pulls in numpy, so load it on first use
+        from .vectorized import score_batch
+
+        return score_batch(self.catalog, answers_table, self.student_status)
 
     def get_remaining_roles_count(self) -> int:
         """
@@ -992,7 +957,7 @@ class Matches:
         Returns:
             - int: Number of roles not eliminated.
         """
-        return len(self.all_role_scoreboard)
+        return len(self.active_roles)
 
     def get_eliminated_roles(self) -> list[str]:
         """
@@ -1003,33 +968,94 @@ class Matches:
         """
         return list(self.eliminated_roles)
 
-    def get_best_fit_roles(self, num=3) -> dict:
+    def rank_roles(self, num: int | None = None, eliminated: bool = False) -> list[tuple[str, int]]:
+        """
+        Ranks roles by score, highest first, breaking ties by their 
+        order in the role sheet. Uses a heap, so only the requested 
+        roles are sorted.
+
+        Args:
+            - num (int | None): Number of roles to return, all of 
+                them if None.
+            - eliminated (bool): If True, ranks the eliminated roles 
+                instead of the remaining ones.
+
+        Returns:
+            - list[tuple]: List of (role_name, score) tuples.
+        """
+        candidates = ((-score, position, role_name) for position, (role_name, score)
+            in enumerate(self.all_role_scoreboard.items())
+            if (role_name in self.eliminated_roles) == eliminated)
+
+        if num is None:
+            ranked = sorted(candidates)
+        else:
+            ranked = heapq.nsmallest(num, candidates)
+
+        return [(role_name, -negative_score) for negative_score, _, role_name in ranked]
+
+    def get_ranking_page(self, page: int, page_size: int = 10) -> dict:
+        """
+        Returns one page of the full ranking: remaining roles by 
+        score, followed by eliminated roles by score.
+
+        Args:
+            - page (int): Zero-based page number.
+            - page_size (int): Number of roles per page.
+
+        Returns:
+            - dict: The page, its size, the total number of roles and 
+                the ranked roles on the page.
+        """
+        if page < 0 or page_size < 1:
+            raise ValueError("Page must be >= 0 and page size must be >= 1")
+
+        start = page * page_size
+        end = start + page_size
+        remaining = self.rank_roles(num=end)
+        ranked = [(role_name, score, False) for role_name, score in remaining]
+
+        if len(ranked) < end:
+            ranked += [(role_name, score, True) for role_name, score
+                in self.rank_roles(num=end - len(ranked), eliminated=True)]
+
+        return {
+            "page": page,
+            "page_size": page_size,
+            "total": len(self.all_role_scoreboard),
+            "roles": [{"role": role_name, "score": score, "eliminated": is_eliminated}
+                for role_name, score, is_eliminated in ranked[start:end]]
+        }
+
+    def get_best_fit_roles(self, num=3, page=None, page_size=10) -> dict:
         """
         Returns the top scoring roles that haven't been 
-        eliminated.
+        eliminated. If fewer than num roles remain, the best 
+        eliminated roles are recommended as next best roles.
         
         Args:
             - num (int): Number of top roles to return.
+            - page (int | None): If given, also returns this page of 
+                the full ranking.
+            - page_size (int): Number of roles per ranking page.
             
         Returns:
-            - list[tuple]: List of (role_name, score) 
-                tuples sorted by score.
+            - dict: Comma separated "Best fit roles" and "Next best 
+                roles", the same roles with their scores, and 
+                optionally a "Ranking" page.
         """
-        remaining_roles = [role["role_name"] for role in match.dataset \
-            if role["role_name"] not in match.get_eliminated_roles()]
-        num_top_roles = len(remaining_roles)
-
-        if num_top_roles > 3:
-            result = {"Best fit roles": ", ".join(remaining_roles[:num])}
+        best = self.rank_roles(num=num)
+        next_best = self.rank_roles(num=num - len(best), eliminated=True) if len(best) < num else []
+
+        result = {
+            "Best fit roles": ", ".join(role_name for role_name, _ in best),
+            "Next best roles": ", ".join(role_name for role_name, _ in next_best) or "None",
+            "Best fit scores": [{"role": role_name, "score": score} for role_name, score in best],
+            "Next best scores": [{"role": role_name, "score": score} for role_name, score in next_best]
+        }
 
-        # If there isn't enough best fit roles (3), recommend the next best roles
-        if num_top_roles < 3:
-            next_best = sorted(self.all_role_scoreboard.items(), key=lambda item: item[1], 
-                reverse=True)[num_top_roles : num]
-            
-            result["Next best roles"] = ", ".join(role[0] for role in next_best)
-        else:
-            result["Next best roles"] = "None"
+        if page is not None:
+            result["Ranking"] = self.get_ranking_page(page, page_size)
 
         return result
 
@@ -1037,7 +1063,7 @@ class Matches:
     # (Machine Shop Staff)
 
 # Example test with elimination
-match = Matches(data_path=data, student_status=True)
+# match = Matches(data_path="Matching Logic - Sheet1.csv", student_status=True)
 
 # Aiming for Field Resetter role
 # match.assess_age(match.dataset, 14, eliminate_unqualified=True)
@@ -0,0 +1,195 @@
+import bisect
+import threading
+
+# Latency buckets in seconds, from 50 microseconds up to 5 seconds
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class Histogram:
+    """
+    A cumulative latency histogram in the Prometheus layout.
+
+    Attributes:
+        - buckets (tuple[float]): Upper bounds of the buckets.
+        - counts (list[int]): Observations per bucket, the last one
+            counting observations above every bound.
+        - total (float): Sum of the observations.
+        - count (int): Number of observations.
+    """
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """
+        Returns (le, cumulative count) pairs, ending with +Inf.
+        """
+        pairs = []
+        running = 0
+
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            running += count
+            pairs.append((bound if isinstance(bound, str) else repr(bound), running))
+
+        return pairs
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def format_labels(labels: dict) -> str:
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and latency histograms for the assessments
+    and HTTP routes, rendered in the Prometheus text format. While
+    disabled, instrumented code only checks the enabled flag.
+
+    Attributes:
+        - enabled (bool): Whether observations are recorded.
+    """
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.caches = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        Drops every recorded observation.
+        """
+        with self._lock:
+            self.assessment_calls = {}
+            self.assessment_latency = {}
+            self.roles_visited = {}
+            self.roles_eliminated = {}
+            self.request_calls = {}
+            self.request_latency = {}
+
+    def register_cache(self, name: str, cache_info) -> None:
+        """
+        Exposes the statistics of a functools.lru_cache memo.
+
+        Args:
+            - name (str): Label of the cache.
+            - cache_info (callable): Returns the cache's CacheInfo.
+        """
+        self.caches[name] = cache_info
+
+    def observe_assessment(self, assessment: str, seconds: float, visited: int, eliminated: int) -> None:
+        """
+        Records one assessment call.
+
+        Args:
+            - assessment (str): Key of the question assessed. 
+                Questions sharing an assess_* method, such as 
+                required_skills and experience, are kept apart.
+            - seconds (float): Time spent in the call.
+            - visited (int): Number of roles passed to the call, or 
+                changed by it when it replayed a partition.
+            - eliminated (int): Number of roles it eliminated.
+        """
+        with self._lock:
+            self.assessment_calls[assessment] = self.assessment_calls.get(assessment, 0) + 1
+            self.roles_visited[assessment] = self.roles_visited.get(assessment, 0) + visited
+            self.roles_eliminated[assessment] = self.roles_eliminated.get(assessment, 0) + eliminated
+
+            if assessment not in self.assessment_latency:
+                self.assessment_latency[assessment] = Histogram()
+
+            self.assessment_latency[assessment].observe(seconds)
+
+    def observe_request(self, route: str, method: str, status: int, seconds: float) -> None:
+        """
+        Records one handled HTTP request.
+        """
+        with self._lock:
+            key = (route, method, status)
+            self.request_calls[key] = self.request_calls.get(key, 0) + 1
+
+            if (route, method) not in self.request_latency:
+                self.request_latency[(route, method)] = Histogram()
+
+            self.request_latency[(route, method)].observe(seconds)
+
+    def render(self) -> str:
+        """
+        Returns every metric in the Prometheus text exposition format.
+        """
+        lines = []
+
+        with self._lock:
+            self._render_counter(lines, "matching_assessment_calls_total",
+                "Calls of each assessment.", {(name,): value
+                for name, value in self.assessment_calls.items()}, ("question",))
+            self._render_histogram(lines, "matching_assessment_duration_seconds",
+                "Latency of each assessment.", {(name,): histogram
+                for name, histogram in self.assessment_latency.items()}, ("question",))
+            self._render_counter(lines, "matching_assessment_roles_visited_total",
+                "Roles visited by each assessment.", {(name,): value
+                for name, value in self.roles_visited.items()}, ("question",))
+            self._render_counter(lines, "matching_assessment_roles_eliminated_total",
+                "Roles eliminated by each assessment.", {(name,): value
+                for name, value in self.roles_eliminated.items()}, ("question",))
+            self._render_counter(lines, "http_requests_total", "Handled HTTP requests.",
+                self.request_calls, ("route", "method", "status"))
+            self._render_histogram(lines, "http_request_duration_seconds",
+                "Latency of each HTTP route.", self.request_latency, ("route", "method"))
+
+        # Cache statistics are read on demand, whether or not recording is enabled
+        cache_infos = {(name,): cache_info() for name, cache_info in self.caches.items()}
+
+        self._render_counter(lines, "matching_cache_hits_total", "Hits of each memo cache.",
+            {key: info.hits for key, info in cache_infos.items()}, ("cache",))
+        self._render_counter(lines, "matching_cache_misses_total", "Misses of each memo cache.",
+            {key: info.misses for key, info in cache_infos.items()}, ("cache",))
+        self._render_gauge(lines, "matching_cache_entries", "Entries held by each memo cache.",
+            {key: info.currsize for key, info in cache_infos.items()}, ("cache",))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_counter(lines: list, name: str, help_text: str, values: dict,
+        label_names: tuple, metric_type: str = "counter") -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+        for key, value in sorted(values.items()):
+            lines.append(f"{name}{format_labels(dict(zip(label_names, key)))} {value}")
+
+    @classmethod
+    def _render_gauge(cls, lines: list, name: str, help_text: str, values: dict, label_names: tuple) -> None:
+        cls._render_counter(lines, name, help_text, values, label_names, metric_type="gauge")
+
+    @staticmethod
+    def _render_histogram(lines: list, name: str, help_text: str, histograms: dict, label_names: tuple) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+
+        for key, histogram in sorted(histograms.items()):
+            labels = dict(zip(label_names, key))
+
+            for bound, count in histogram.cumulative():
+                lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}")
+
+            lines.append(f"{name}_sum{format_labels(labels)} {histogram.total!r}")
+            lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+
+# The registry shared by the matching engine and the Flask app
+METRICS = MetricsRegistry()
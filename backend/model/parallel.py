@@ -0,0 +1,119 @@
+from .answers import parse_answers
+from .catalog import RoleCatalog
+from .result_cache import RESULT_CACHE
+from .snapshot import write_snapshot, load_snapshot
+from collections import deque
+import itertools
+import multiprocessing
+import os
+import tempfile
+
+DEFAULT_CHUNK_SIZE = 256
+
+# The catalog of a worker process, loaded once from the snapshot
+_worker_catalog = None
+_worker_student_status = True
+
+def score_volunteer(catalog: RoleCatalog, index: int, answers: dict,
+    student_status: bool = True, num: int = 3) -> dict:
+    """
+    Scores one volunteer the way a session does, reusing the ranking
+    of an identical answer profile from the result cache.
+
+    Returns:
+        - dict: The volunteer's position and best fit roles, or an
+            error for malformed answers.
+    """
+    try:
+        responses = parse_answers(answers)
+    except (TypeError, ValueError) as e:
+        return {"volunteer": index, "error": str(e)}
+
+    return {"volunteer": index, **RESULT_CACHE.best_fit_roles(catalog, responses, num, student_status)}
+
+def score_serial(catalog: RoleCatalog, answer_sets, student_status: bool = True, num: int = 3):
+    """
+    Scores volunteers one after another in this process. Yields the
+    same results as score_parallel.
+    """
+    for index, answers in enumerate(answer_sets):
+        yield score_volunteer(catalog, index, answers, student_status, num)
+
+def _init_worker(snapshot_path: str, student_status: bool) -> None:
+    global _worker_catalog, _worker_student_status
+
+    _worker_catalog = load_snapshot(snapshot_path)
+    _worker_student_status = student_status
+
+def _score_chunk(start: int, answer_sets: list[dict], num: int) -> list[dict]:
+    return [score_volunteer(_worker_catalog, start + offset, answers, _worker_student_status, num)
+        for offset, answers in enumerate(answer_sets)]
+
+def score_parallel(
+    catalog: RoleCatalog | None,
+    answer_sets,
+    student_status: bool = True,
+    num: int = 3,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    snapshot_path: str | None = None
+):
+    """
+    Scores volunteers across worker processes, yielding their results
+    in input order as soon as each chunk is done.
+
+    Workers load the catalog snapshot once when they start, so tasks
+    only carry their chunk of answers. At most two chunks per
+    worker are in flight, so answer_sets may be a lazy iterable of
+    any length.
+
+    Args:
+        - catalog (RoleCatalog | None): The roles to score against,
+            written to a temporary snapshot for the workers. May be
+            None if snapshot_path is given.
+        - answer_sets (Iterable[dict]): One dict of question keys to
+            raw answers per volunteer.
+        - student_status (bool): Student status of every volunteer.
+        - num (int): Number of best fit roles per volunteer.
+        - processes (int | None): Worker count, one per CPU if None.
+        - chunk_size (int): Volunteers per task.
+        - snapshot_path (str | None): An existing catalog snapshot
+            to share instead of writing one.
+
+    Returns:
+        - Iterator[dict]: Per volunteer, the same result as
+            score_serial.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    processes = processes or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        if snapshot_path is None:
+            if catalog is None:
+                raise ValueError("Pass a catalog or a snapshot_path")
+
+            snapshot_path = os.path.join(directory, "catalog.snapshot")
+            write_snapshot(catalog, snapshot_path)
+
+        with multiprocessing.Pool(processes, initializer=_init_worker,
+            initargs=(snapshot_path, student_status)) as pool:
+            answers = iter(answer_sets)
+            pending = deque()
+            start = 0
+
+            while True:
+                while len(pending) < 2 * processes:
+                    chunk = list(itertools.islice(answers, chunk_size))
+
+                    if not chunk:
+                        break
+
+                    pending.append(pool.apply_async(_score_chunk, (start, chunk, num)))
+                    start += len(chunk)
+
+                if not pending:
+                    break
+
+                yield from pending.popleft().get()
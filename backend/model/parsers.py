@@ -0,0 +1,297 @@
+from .metrics import METRICS
+from functools import lru_cache
+import re
+
+# Catalog cells repeat heavily ("2 days", "TRUE", "Students"), so every
+# parser is memoized. typed=True keeps True and 1 apart.
+PARSER_CACHE_SIZE = 4096
+
+FRACTION_PATTERN = re.compile(r"(-?\d+)\s*/\s*(\d+)")
+DECIMAL_PATTERN = re.compile(r"-?\d+\.\d+")
+INT_PATTERN = re.compile(r"-?\d+")
+
+VARIABLE_COMMITMENTS = frozenset(["varies", "variable", "tbd", "to be determined"])
+MOVEMENT_TERMS = ("move", "walk", "run", "carry", "lift", "transport", "stand")
+
+def is_missing(raw_value) -> bool:
+    """
+    Checks for an empty or NaN cell.
+    """
+    return not raw_value or (isinstance(raw_value, float) and raw_value != raw_value)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def extract_numerical_value(raw_str: str) -> int | float:
+    """
+    Extracts the first continous numerical value from
+    a string. Supports extraction of ints, fractions,
+    and decimals, which are all either returned as ints
+    or floats. Can handle negative values.
+
+    Args:
+        - raw_str (str): The string to extract a number
+            from.
+
+    Returns:
+        - int | float: The extracted value or -1 for any
+            failures.
+    """
+    if is_missing(raw_str):
+        return -1
+
+    raw_str = str(raw_str).strip()
+
+    # Ensure that the string contains at least one digit
+    if not any(digit.isnumeric() for digit in raw_str):
+        return -1  # Return -1 instead of raising error
+
+    # Extract fractions
+    fraction_match = FRACTION_PATTERN.search(raw_str)
+    if fraction_match:
+        numerator, denominator = fraction_match.groups()
+
+        if int(denominator) == 0:
+            return -1  # Return -1 instead of raising error
+
+        return float(numerator) / float(denominator)
+
+    # Extract decimals
+    decimal_match = DECIMAL_PATTERN.search(raw_str)
+    if decimal_match:
+        return float(decimal_match.group())
+
+    # Extract ints
+    int_match = INT_PATTERN.search(raw_str)
+    if int_match:
+        return int(int_match.group())
+
+    return -1
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def parse_age_min(raw_value) -> int | float | str:
+    """
+    Parses a role's minimum age.
+
+    Args:
+        - raw_value: The raw value from the age_min field.
+
+    Returns:
+        - int | float | str: The minimum age, "Students" for
+            student-only roles, or -1 if no age can be extracted.
+    """
+    if str(raw_value).isnumeric():
+        return int(raw_value)
+    elif raw_value == "Students":
+        return "Students"
+
+    # Try to extract as many numbers as possible
+    return extract_numerical_value(raw_value)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def parse_age_preference(raw_value) -> int | float | bool:
+    """
+    Parses a role's preferred age.
+
+    Args:
+        - raw_value: The raw value from the age_preference field.
+
+    Returns:
+        - int | float | bool: The preferred age, or False if the
+            role has no age preference.
+    """
+    if not raw_value:
+        return False # Default age preference value
+
+    if str(raw_value).isnumeric():
+        return int(raw_value)
+
+    return extract_numerical_value(raw_value)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def parse_time_commitment(time_commitment: str) -> int | float:
+    """
+    Parses time commitment from input, extracting numbers
+    from a string. Handles fractional days and hours, which
+    are all converted into days. A day is defined to be 8
+    hours.
+
+    Args:
+        - time_commitment (str): A string containing text
+            about time commitment.
+
+    Returns:
+        - int | float: The role's time commitment in days, 0 for
+            missing, variable or invalid commitments.
+
+    NOTE: Time commitment is expected to either be in days
+    or hours format.
+    """
+    if is_missing(time_commitment):
+        return 0  # Default to 0 for missing data
+
+    time_commitment = str(time_commitment).strip()
+
+    # Handle special cases
+    if not time_commitment or time_commitment.lower() in VARIABLE_COMMITMENTS:
+        return 0  # Default to 0 for variable commitments
+
+    # Handle the case that the input is in the hours format
+    in_hours = False
+    if "hours" in time_commitment.lower() or "hr" in time_commitment.lower():
+        in_hours = True
+
+    time_extracted = extract_numerical_value(time_commitment)
+
+    if time_extracted == -1 or time_extracted <= 0:
+        return 0  # Default to 0 for invalid extractions
+
+    return time_extracted if not in_hours else time_extracted / 8
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def requires_standing(physical_req) -> bool:
+    """
+    Checks if "stand" or "walk" appears in the physical_req field.
+    """
+    if not isinstance(physical_req, str):
+        return False
+
+    physical_req_lower = physical_req.lower()
+    return "stand" in physical_req_lower or "walk" in physical_req_lower
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def requires_moving(physical_req) -> bool:
+    """
+    Checks if movement-related terms appear in the physical_req field.
+    """
+    if not isinstance(physical_req, str):
+        return False
+
+    physical_req_lower = physical_req.lower()
+    return any(term in physical_req_lower for term in MOVEMENT_TERMS)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def parse_prior_first_experience(raw_value: str | bool) -> str:
+    """
+    Parses the prior_first_exp field to standardize
+    different formats.
+
+    Args:
+        raw_value: The raw value from the prior_first_exp
+        field.
+
+    Returns:
+        str: One of "REQUIRED", "PREFERRED", "FALSE", or
+        "UNKNOWN"
+    """
+    if not raw_value:
+        return "UNKNOWN"
+
+    if not isinstance(raw_value, str) and not isinstance(raw_value, bool):
+        raise TypeError("Cannot parse user input for prior experience "
+                f"as it is not str or bool")
+
+    # Bool
+    if isinstance(raw_value, bool):
+        if raw_value:
+            return "REQUIRED"
+        else:
+            return "FALSE"
+
+    # Str
+    if isinstance(raw_value, str):
+        raw_value = raw_value.strip().upper()
+
+        if "FALSE" in raw_value:
+            return "FALSE"
+        elif "TRUE" in raw_value:
+            return "REQUIRED"
+        elif "PREFERRED" in raw_value:
+            return "PREFERRED"
+
+        # In the case that the raw value is missing above keywords
+        req_keywords = ["must", "required", "years", "prior years",
+            "minimum", "experience required"]
+
+        pref_keywords = ["recommended", "helpful", "knowledge of",
+            "general knowledge", "understanding of"]
+
+        if any(indicator in raw_value.lower() for indicator in req_keywords):
+            return "REQUIRED"
+
+        if any(indicator in raw_value.lower() for indicator in pref_keywords):
+            return "PREFERRED"
+
+    return "UNKNOWN" # Last case
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE, typed=True)
+def parse_knowledge_of_game(raw_value: str | bool) -> str:
+    """
+    Parses the basic_game_knowledge in the dataset to
+    standardize formats.
+
+    Args:
+        - raw_value: The raw value from the target field
+
+    Returns:
+        - str: One of "NONE", "LIMITED", "AVERAGE",
+        "THOROUGH", or "UNKNOWN"
+    """
+    if not raw_value:
+        return "UNKNOWN"
+
+    if not isinstance(raw_value, str) and not isinstance(raw_value, bool):
+        raise TypeError("Cannot parse user input for game knowledge \
+                as it is not str or bool")
+
+    # Bool
+    if isinstance(raw_value, bool):
+        if raw_value:
+            return "LIMITED"
+        else:
+            return "NONE"
+
+    # Str
+    if isinstance(raw_value, str):
+        raw_value = raw_value.strip()
+        raw_value_upper = raw_value.upper()
+        raw_value_lower = raw_value.lower()
+
+        # Direct string matches
+        if "FALSE" in raw_value_upper:
+            return "NONE"
+
+        # Ensure that only True is present
+        elif "TRUE" in raw_value_upper and len(raw_value_upper) == 4:
+            return "LIMITED"
+
+        # Keywords for mapping levels
+        thorough_keywords = ["thorough", "advanced", "in-depth"]
+        average_keywords = ["average", "familiar", "general knowledge"]
+        limited_keywords = ["can learn", "basic", "some knowledge"]
+
+        if any(keyword in raw_value_lower for keyword in thorough_keywords):
+            return "THOROUGH"
+        elif any(keyword in raw_value_lower for keyword in average_keywords):
+            return "AVERAGE"
+        elif any(keyword in raw_value_lower for keyword in limited_keywords):
+            return "LIMITED"
+
+    # If no matches, return unknown
+    return "UNKNOWN"
+
+MEMOIZED_PARSERS = (extract_numerical_value, parse_age_min, parse_age_preference,
+    parse_time_commitment, requires_standing, requires_moving,
+    parse_prior_first_experience, parse_knowledge_of_game)
+
+def parser_cache_info() -> dict:
+    """
+    Returns hit and miss statistics of every memoized parser, keyed 
+    by parser name.
+    """
+    return {parser.__name__: parser.cache_info() for parser in MEMOIZED_PARSERS}
+
+def clear_parser_caches() -> None:
+    for parser in MEMOIZED_PARSERS:
+        parser.cache_clear()
+
+for parser in MEMOIZED_PARSERS:
+    METRICS.register_cache(parser.__name__, parser.cache_info)
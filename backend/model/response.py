@@ -1,4 +1,25 @@
+# Interned option sets, so every MultiChoiceResponse to a question
+# shares one uppercased frozenset instead of building its own
+_OPTION_SETS = {}
+
+def intern_options(valid_options) -> frozenset[str]:
+    """
+    Returns the shared, uppercased frozenset of valid_options.
+    """
+    key = frozenset(valid_options)
+    options = _OPTION_SETS.get(key)
+
+    if options is None:
+        options = frozenset(opt.upper() for opt in key)
+        options = _OPTION_SETS.setdefault(options, options)
+        _OPTION_SETS[key] = options
+
+    return options
+
 class Response:
+    # Slotted, so responses carry no per-instance __dict__
+    __slots__ = ("response",)
+
     def __init__(self, response: str) -> None:
         self.response = response
         self.parse_response()
@@ -12,6 +33,8 @@ class AvailabilityResponse(Response):
     Parses user response into defined availability and complete 
     availability.
     """  
+    __slots__ = ("defined", "completely", "days")
+
     def __init__(self, response: str):
         super().__init__(response)
     
@@ -46,6 +69,8 @@ class PreferenceResponse(Response):
     """
     Parses user response into yes, no, or no preference booleans.
     """
+    __slots__ = ("yes", "no", "no_pref")
+
     def __init__(self, response: str):
         super().__init__(response)
 
@@ -80,10 +105,14 @@ class MultiChoiceResponse(Response):
 
     Attributes:
         - self.choice (str): The parsed and standardized user choice.
+        - self.valid_options (frozenset[str]): The interned, 
+            uppercased options.
     """
+    __slots__ = ("valid_options", "choice")
+
     def __init__(self, response: str, valid_options: set[str]) -> None:
         self.response = response
-        self.valid_options = {opt.upper() for opt in valid_options}
+        self.valid_options = intern_options(valid_options)
         self.choice = self.parse_response()
 
     def parse_response(self) -> str:
@@ -0,0 +1,184 @@
+"""
+A bounded cache of finished rankings. Scoring is deterministic for a
+given catalog, so volunteers who give the same answers, and students
+often do, get the cached best fit roles instead of running the whole
+assessment pipeline again.
+"""
+from .answers import canonical_answer
+from .catalog import RoleCatalog
+from .matching_logic import Matches
+from .metrics import METRICS
+from collections import OrderedDict
+from typing import NamedTuple
+import hashlib
+import json
+import threading
+
+RESULT_CACHE_SIZE = 4096
+
+class CacheInfo(NamedTuple):
+    """
+    Cache statistics, shaped like functools.lru_cache's.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+def encode_canonical(value):
+    """
+    Converts a canonical answer into JSON-compatible values, sorting
+    sets so equal answers always encode the same way.
+    """
+    if isinstance(value, (set, frozenset)):
+        return sorted(encode_canonical(item) for item in value)
+
+    if isinstance(value, tuple):
+        return [encode_canonical(item) for item in value]
+
+    return value
+
+def result_key(catalog: RoleCatalog, responses: dict, student_status: bool = True, num: int = 3) -> str:
+    """
+    Hashes everything a ranking depends on: the catalog's contents,
+    the canonical form of each parsed response, the student status
+    and the number of best fit roles.
+
+    Args:
+        - catalog (RoleCatalog): The catalog being scored against.
+        - responses (dict): Question keys mapped to parsed responses,
+            as returned by parse_answers.
+        - student_status (bool): The volunteer's student status.
+        - num (int): Number of best fit roles.
+
+    Returns:
+        - str: A hex digest, equal for answers that score identically.
+    """
+    canonical = {key: encode_canonical(canonical_answer(response)) for key, response in responses.items()}
+    payload = json.dumps([catalog.fingerprint, bool(student_status), num, canonical],
+        sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """
+    A thread-safe, least recently used cache of get_best_fit_roles
+    results, keyed by result_key. With a shared backend, such as 
+    the SQLite or Redis backends of cache_backends.py, rankings 
+    missing from this process are looked up there, so every worker 
+    benefits from the others' hits.
+
+    Attributes:
+        - maxsize (int): Maximum number of rankings kept in this 
+            process.
+        - backend (CacheBackend | None): Shared store of rankings.
+        - ttl_seconds (float | None): Lifetime of shared rankings.
+        - hits (int): Lookups answered from the cache.
+        - misses (int): Lookups that had to score.
+    """
+    KEY_PREFIX = "result:"
+
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE, backend=None,
+        ttl_seconds: float | None = 24 * 60 * 60) -> None:
+        if maxsize < 1:
+            raise ValueError("Result cache must hold at least one ranking.")
+
+        self.maxsize = maxsize
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        # key -> ranking, least recently used first
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> dict | None:
+        """
+        Returns the cached ranking for key, or None, counting the
+        lookup as a hit or a miss.
+        """
+        with self._lock:
+            result = self._results.get(key)
+
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+
+        shared = self.backend.get(self.KEY_PREFIX + key) if self.backend is not None else None
+
+        if shared is None:
+            with self._lock:
+                self.misses += 1
+
+            return None
+
+        result = json.loads(shared)
+        self._keep(key, result)
+
+        with self._lock:
+            self.hits += 1
+
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        """
+        Caches a ranking, evicting the least recently used one if the
+        cache is full, and shares it through the backend.
+        """
+        self._keep(key, result)
+
+        if self.backend is not None:
+            self.backend.set(self.KEY_PREFIX + key, json.dumps(result).encode("utf-8"), self.ttl_seconds)
+
+    def _keep(self, key: str, result: dict) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops the rankings kept in this process and the statistics.
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def best_fit_roles(self, catalog: RoleCatalog, responses: dict, num: int = 3,
+        student_status: bool = True) -> dict:
+        """
+        Returns Matches.get_best_fit_roles(num) for a volunteer's
+        parsed responses, scoring them only on a cache miss. The
+        returned ranking is shared and must not be modified.
+        """
+        key = result_key(catalog, responses, student_status, num)
+        result = self.get(key)
+
+        if result is None:
+            match = Matches(catalog=catalog, student_status=student_status)
+            match.assess_responses(responses)
+            result = match.get_best_fit_roles(num=num)
+            self.put(key, result)
+
+        return result
+
+# The cache shared by the Flask app and the batch runners
+RESULT_CACHE = ResultCache()
+METRICS.register_cache("best_fit_roles", RESULT_CACHE.cache_info)
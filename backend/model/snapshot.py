@@ -0,0 +1,270 @@
+"""
+A compact, columnar binary snapshot of a parsed RoleCatalog.
+
+Building a snapshot parses the role sheet once, including the numbers
+and top skill categories. Workers then load the snapshot at startup
+instead of importing pandas and parsing the CSV, which makes a cold
+start faster. Each worker still decodes its own copy of the catalog,
+so the memory is not shared between workers.
+
+Build one from the backend directory:
+    python -m model.snapshot "Matching Logic - Sheet1.csv" roles.snapshot
+"""
+from .catalog import RoleCatalog, RoleRecord
+import json
+import os
+import struct
+
+MAGIC = b"RCATSNAP"
+VERSION = 1
+
+# Cell tags of the "cells" column encoding
+NONE, TRUE, FALSE, STR, INT, FLOAT, ABSENT = range(7)
+
+# Marks a key missing from a row, unlike a None (empty) cell
+ABSENT_CELL = object()
+
+BOOLEAN_FIELDS = ("age_exception_allowed", "physical_req", "requires_standing",
+    "requires_moving", "leadership_pref")
+
+class SnapshotError(ValueError):
+    """
+    Raised for files that are not readable role catalog snapshots.
+    """
+
+def encode_cells(values: list) -> tuple[bytes, bytes, bytes]:
+    """
+    Encodes a column of cells into a tag per cell, the end offset of
+    each cell's text and the concatenated UTF-8 text.
+    """
+    tags = bytearray()
+    ends = []
+    blob = bytearray()
+
+    for value in values:
+        text = ""
+
+        if value is ABSENT_CELL:
+            tag = ABSENT
+        elif value is None:
+            tag = NONE
+        elif value is True:
+            tag = TRUE
+        elif value is False:
+            tag = FALSE
+        elif isinstance(value, int):
+            tag, text = INT, str(value)
+        elif isinstance(value, float):
+            tag, text = FLOAT, repr(value)
+        elif isinstance(value, str):
+            tag, text = STR, value
+        else:
+            raise TypeError(f"Cannot store a {type(value)} cell in a snapshot")
+
+        tags.append(tag)
+        blob += text.encode("utf-8")
+        ends.append(len(blob))
+
+    return bytes(tags), struct.pack(f"<{len(ends)}I", *ends), bytes(blob)
+
+def decode_cells(buffer, base: int, column: dict, count: int) -> list:
+    """
+    Decodes count tagged cells whose chunks start at base.
+    """
+    tags = buffer[base + column["tags"]:base + column["tags"] + count]
+    ends = struct.unpack_from(f"<{count}I", buffer, base + column["ends"])
+    blob = base + column["blob"]
+    values = []
+
+    if len(tags) != count or (count and blob + ends[-1] > len(buffer)):
+        raise SnapshotError("A column of the snapshot is truncated")
+    start = 0
+
+    for tag, end in zip(tags, ends):
+        if tag == STR:
+            values.append(buffer[blob + start:blob + end].decode("utf-8"))
+        elif tag == INT:
+            values.append(int(buffer[blob + start:blob + end]))
+        elif tag == FLOAT:
+            values.append(float(buffer[blob + start:blob + end]))
+        elif tag == ABSENT:
+            values.append(ABSENT_CELL)
+        else:
+            values.append({NONE: None, TRUE: True, FALSE: False}[tag])
+
+        start = end
+
+    return values
+
+def data_start(header_length: int) -> int:
+    """
+    Returns where the column chunks begin: after the magic, the header
+    length and the header, padded to 8 bytes.
+    """
+    prefix = len(MAGIC) + 4 + header_length
+    return prefix + (-prefix % 8)
+
+def write_snapshot(catalog: RoleCatalog, path: str) -> None:
+    """
+    Writes a catalog's normalized rows and parsed records to path,
+    one column at a time. Boolean record fields are stored as bytes,
+    every other column as dictionary encoded, tagged cells, so equal
+    cells also share one object once loaded.
+
+    Args:
+        - catalog (RoleCatalog): The parsed catalog.
+        - path (str): Destination file, replaced atomically.
+    """
+    row_keys = list(dict.fromkeys(key for row in catalog.rows for key in row))
+    columns = {}
+    chunks = []
+    offset = 0
+
+    def add_chunk(data: bytes) -> int:
+        nonlocal offset
+        start = offset
+        padding = -len(data) % 8 # Keep every chunk 8-byte aligned
+        chunks.append(data + b"\0" * padding)
+        offset += len(data) + padding
+        return start
+
+    def add_cells(name: str, values: list) -> None:
+        # Dictionary encoded: each distinct cell is stored once, rows
+        # hold its position. Keys keep True, 1 and 1.0 apart
+        positions = {}
+        indices = [positions.setdefault((type(value), value), len(positions)) for value in values]
+        tags, ends, blob = encode_cells([value for _, value in positions])
+
+        columns[name] = {"kind": "cells", "count": len(positions), "tags": add_chunk(tags),
+            "ends": add_chunk(ends), "blob": add_chunk(blob),
+            "indices": add_chunk(struct.pack(f"<{len(indices)}I", *indices))}
+
+    for key in row_keys:
+        add_cells(f"row:{key}", [row.get(key, ABSENT_CELL) for row in catalog.rows])
+
+    for field in RoleRecord._fields[1:]:
+        values = [getattr(record, field) for record in catalog.records]
+
+        if field in BOOLEAN_FIELDS:
+            columns[f"record:{field}"] = {"kind": "bools", "data": add_chunk(bytes(values))}
+        else:
+            add_cells(f"record:{field}", values)
+
+    header = json.dumps({
+        "version": VERSION,
+        "num_roles": len(catalog),
+        "row_keys": row_keys,
+        "columns": columns
+    }).encode("utf-8")
+
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\0" * (data_start(len(header)) - len(prefix))
+
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "wb") as file:
+        file.write(prefix)
+        file.writelines(chunks)
+
+    os.replace(temporary_path, path)
+
+def read_snapshot(buffer) -> RoleCatalog:
+    """
+    Rebuilds a catalog from the bytes of a snapshot.
+
+    Raises:
+        - SnapshotError: If the data is not a supported snapshot, or
+            is truncated or malformed.
+    """
+    if len(buffer) < len(MAGIC) + 4 or buffer[:len(MAGIC)] != MAGIC:
+        raise SnapshotError("Not a role catalog snapshot")
+
+    try:
+        return decode_snapshot(buffer)
+    except SnapshotError:
+        raise
+    except (struct.error, KeyError, IndexError, TypeError, ValueError) as e:
+        raise SnapshotError(f"Truncated or malformed role catalog snapshot: {e!r}") from e
+
+def decode_snapshot(buffer) -> RoleCatalog:
+    (header_length,) = struct.unpack_from("<I", buffer, len(MAGIC))
+    header = json.loads(buffer[len(MAGIC) + 4:len(MAGIC) + 4 + header_length])
+
+    if header["version"] != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {header['version']}, "
+            f"expected {VERSION}")
+
+    num_roles = header["num_roles"]
+    base = data_start(header_length)
+
+    def column_values(name: str) -> list:
+        column = header["columns"][name]
+
+        if column["kind"] == "bools":
+            start = base + column["data"]
+            values = [bool(value) for value in buffer[start:start + num_roles]]
+
+            if len(values) != num_roles:
+                raise SnapshotError(f"Column {name} is truncated")
+
+            return values
+
+        distinct = decode_cells(buffer, base, column, column["count"])
+        indices = struct.unpack_from(f"<{num_roles}I", buffer, base + column["indices"])
+
+        return [distinct[index] for index in indices]
+
+    row_columns = [(key, column_values(f"row:{key}")) for key in header["row_keys"]]
+    rows = [{key: values[index] for key, values in row_columns if values[index] is not ABSENT_CELL}
+        for index in range(num_roles)]
+
+    field_columns = [column_values(f"record:{field}") for field in RoleRecord._fields[1:]]
+    records = [RoleRecord(index, *values) for index, values in enumerate(zip(*field_columns))]
+
+    return RoleCatalog.from_parsed(rows, records)
+
+def load_snapshot(path: str) -> RoleCatalog:
+    """
+    Reads the snapshot at path and rebuilds its catalog.
+
+    Raises:
+        - SnapshotError: If the file is not a supported snapshot.
+    """
+    with open(path, "rb") as file:
+        return read_snapshot(file.read())
+
+def build_snapshot(data_path: str, snapshot_path: str) -> RoleCatalog:
+    """
+    Parses the role sheet CSV at data_path and writes its snapshot.
+    """
+    catalog = RoleCatalog.from_csv(data_path)
+    write_snapshot(catalog, snapshot_path)
+    return catalog
+
+def is_fresh(snapshot_path: str, data_path: str) -> bool:
+    """
+    Checks that a snapshot exists and is no older than its CSV.
+    """
+    if not os.path.exists(snapshot_path):
+        return False
+
+    if not os.path.exists(data_path):
+        return True
+
+    return os.path.getmtime(snapshot_path) >= os.path.getmtime(data_path)
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Builds a role catalog snapshot from the role sheet CSV")
+    parser.add_argument("data_path", help="The role sheet CSV")
+    parser.add_argument("snapshot_path", help="Where to write the snapshot")
+    args = parser.parse_args(argv)
+
+    catalog = build_snapshot(args.data_path, args.snapshot_path)
+    print(f"Wrote {len(catalog)} roles to {args.snapshot_path}")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
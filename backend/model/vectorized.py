@@ -0,0 +1,452 @@
+from .response import *
+from .catalog import RoleCatalog, REQUIREMENT_KEYWORDS
+from .answers import ASSESSMENT_PLAN, parse_answers, canonical_answer
+import weakref
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, only this engine needs it
+    np = None
+
+KNOWLEDGE_HIERARCHY = ["NONE", "LIMITED", "AVERAGE", "THOROUGH"]
+
+class RoleTable:
+    """
+    A columnar, typed-array view of a RoleCatalog. Built once per
+    catalog and shared by every vectorized session.
+
+    Attributes:
+        - role_names (list[str]): Role names in catalog order.
+        - categories (dict): For each requirement column, the
+            category names indexed by the codes in top_categories.
+        - top_categories (dict): For each requirement column, an int
+            array of top category codes, -1 where the requirement
+            can't be assessed.
+    """
+    _tables = weakref.WeakKeyDictionary()
+
+    def __init__(self, catalog: RoleCatalog) -> None:
+        if np is None:
+            raise ImportError("The vectorized matching engine requires numpy")
+
+        records = catalog.records
+        self.role_names = list(catalog.role_names)
+
+        # Only int minimum ages qualify by age, floats never did
+        self.age_min = np.array([record.age_min if isinstance(record.age_min, int)
+            else np.nan for record in records], dtype=float)
+        self.students_only = np.array([record.age_min == "Students" for record in records], dtype=bool)
+        self.has_age_pref = np.array([bool(record.age_pref) for record in records], dtype=bool)
+        self.age_pref = np.array([record.age_pref if record.age_pref else 0
+            for record in records], dtype=float)
+        self.age_exception_allowed = np.array([record.age_exception_allowed
+            for record in records], dtype=bool)
+
+        self.physical_req = np.array([record.physical_req for record in records], dtype=bool)
+        self.requires_standing = np.array([record.requires_standing for record in records], dtype=bool)
+        self.requires_moving = np.array([record.requires_moving for record in records], dtype=bool)
+        self.time_commitment = np.array([record.time_commitment for record in records], dtype=float)
+
+        self.work_bts = np.array([record.work_pref == "BTS" for record in records], dtype=bool)
+        self.work_front = np.array([record.work_pref == "FRONT" for record in records], dtype=bool)
+        self.leadership = np.array([record.leadership_pref for record in records], dtype=bool)
+
+        self.prior_required = np.array([record.prior_experience == "REQUIRED"
+            for record in records], dtype=bool)
+        self.prior_preferred = np.array([record.prior_experience == "PREFERRED"
+            for record in records], dtype=bool)
+        self.prior_false = np.array([record.prior_experience == "FALSE"
+            for record in records], dtype=bool)
+
+        # -1 marks an unknown game knowledge requirement, which is never scored
+        self.knowledge_level = np.array([KNOWLEDGE_HIERARCHY.index(record.game_knowledge)
+            if record.game_knowledge in KNOWLEDGE_HIERARCHY else -1
+            for record in records], dtype=np.int8)
+
+        self.categories = {}
+        self.top_categories = {}
+        self._catalog = catalog
+
+        for req, keywords in REQUIREMENT_KEYWORDS.items():
+            names = []
+            codes = []
+
+            for record in records:
+                top = catalog.top_category(record.role_name, req, keywords)
+
+                if not top:
+                    codes.append(-1)
+                    continue
+
+                if top not in names:
+                    names.append(top)
+
+                codes.append(names.index(top))
+
+            self.categories[req] = names
+            self.top_categories[req] = np.array(codes, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.role_names)
+
+    @classmethod
+    def for_catalog(cls, catalog: RoleCatalog) -> "RoleTable":
+        """
+        Returns the shared table of a catalog, building it on first
+        use.
+        """
+        table = cls._tables.get(catalog)
+
+        if table is None:
+            table = cls(catalog)
+            cls._tables[catalog] = table
+
+        return table
+
+    def category_mask(self, req: str, keywords: dict, responses: set[str]):
+        """
+        Returns (assessable, matched) boolean masks for a requirement
+        column and a set of user responses.
+        """
+        if REQUIREMENT_KEYWORDS.get(req) is not keywords:
+            # Uncommon column or keyword set, classify it on the fly
+            tops = [self._catalog.top_category(name, req, keywords) for name in self.role_names]
+            assessable = np.array([bool(top) for top in tops], dtype=bool)
+            matched = np.array([bool(top) and top in responses for top in tops], dtype=bool)
+            return assessable, matched
+
+        codes = self.top_categories[req]
+        response_codes = [code for code, name in enumerate(self.categories[req]) if name in responses]
+
+        return codes >= 0, np.isin(codes, response_codes)
+
+class VectorizedMatches:
+    """
+    A NumPy-backed counterpart of Matches. Scores live in an int
+    array and eliminations in a boolean mask aligned with the
+    catalog, so each assessment is a handful of array operations
+    instead of a Python loop over roles. Eliminated roles take no
+    further score deltas. Produces the same scoreboard and
+    eliminations as Matches assessing its active roles, for catalogs
+    with unique role names.
+
+    Attributes:
+        - table (RoleTable): The shared columnar role attributes.
+        - scores (np.ndarray): Score of every role.
+        - eliminated (np.ndarray): True for eliminated roles.
+    """
+    def __init__(self, catalog: RoleCatalog, student_status: bool) -> None:
+        self.catalog = catalog
+        self.table = RoleTable.for_catalog(catalog)
+        self.student_status = student_status
+
+        self.scores = np.zeros(len(self.table), dtype=np.int64)
+        self.eliminated = np.zeros(len(self.table), dtype=bool)
+
+    @property
+    def all_role_scoreboard(self) -> dict:
+        return dict(zip(self.table.role_names, self.scores.tolist()))
+
+    @property
+    def eliminated_roles(self) -> set[str]:
+        return {self.table.role_names[index] for index in np.flatnonzero(self.eliminated)}
+
+    def _add_scores(self, delta) -> None:
+        # Like Matches, eliminated roles keep their score but are no
+        # longer assessed
+        self.scores += np.where(self.eliminated, 0, delta)
+
+    def assess_age(self, age: int, eliminate_unqualified: bool = False) -> None:
+        """
+        Vectorized Matches.assess_age.
+        """
+        if not isinstance(age, int):
+            raise TypeError("Input age is not type int.")
+
+        if not isinstance(self.student_status, bool):
+            raise TypeError("Input student status is not type boolean.")
+
+        table = self.table
+        meets_minimum = table.age_min <= age
+
+        self._add_scores(5 * (meets_minimum & ~table.has_age_pref))
+        self._add_scores(3 * (meets_minimum & table.has_age_pref & (table.age_pref > age)))
+
+        qualified = meets_minimum
+
+        if self.student_status:
+            qualified = qualified | table.students_only
+            self._add_scores(5 * table.students_only)
+
+        if eliminate_unqualified:
+            unqualified = ~qualified
+            self.eliminated |= unqualified & ~table.age_exception_allowed
+            self._add_scores(-3 * (unqualified & table.age_exception_allowed))
+
+    def assess_physical_ability(
+        self,
+        response: PreferenceResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_physical_ability.
+        """
+        if response.no_pref:
+            return
+
+        wanted = self.table.physical_req if response.yes else ~self.table.physical_req
+        self._add_scores(5 * wanted)
+
+        if eliminate_unqualified:
+            self.eliminated |= ~wanted
+
+    def assess_standing_ability(
+        self,
+        response: PreferenceResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_standing_ability.
+        """
+        self._assess_ability(self.table.requires_standing, response, eliminate_unqualified)
+
+    def assess_moving_ability(
+        self,
+        response: PreferenceResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_moving_ability.
+        """
+        self._assess_ability(self.table.requires_moving, response, eliminate_unqualified)
+
+    def _assess_ability(self, required, response: PreferenceResponse, eliminate_unqualified: bool) -> None:
+        if response.no and eliminate_unqualified:
+            self.eliminated |= required
+        elif response.yes:
+            self._add_scores(3 * required)
+
+    def assess_availability(
+        self,
+        availability: AvailabilityResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_availability.
+        """
+        if availability.defined:
+            assert(availability.days is not None), "Days of availability is not defined"
+
+        if availability.completely:
+            self._add_scores(5)
+        elif availability.defined:
+            available = self.table.time_commitment <= availability.days
+            self._add_scores(5 * available)
+
+            if eliminate_unqualified:
+                self.eliminated |= ~available
+
+    def assess_working_pref(
+        self,
+        pref: MultiChoiceResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_working_pref.
+        """
+        valid = ["NO_PREF", "BTS", "FRONT"]
+        if pref.choice not in valid:
+            raise ValueError(f"Invalid user input: {pref.choice}, expected "
+                f"a response from {valid}")
+
+        if pref.choice == "NO_PREF":
+            return
+
+        if pref.choice == "BTS":
+            matched, opposite = self.table.work_bts, self.table.work_front
+        else:
+            matched, opposite = self.table.work_front, self.table.work_bts
+
+        self._add_scores(5 * matched)
+
+        if eliminate_unqualified:
+            self.eliminated |= opposite
+
+    def assess_leadership_pref(
+        self,
+        response: PreferenceResponse,
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_leadership_pref.
+        """
+        if response.no_pref:
+            return
+
+        leadership = self.table.leadership
+        wanted = leadership if response.yes else ~leadership
+
+        self._add_scores(5 * wanted)
+
+        if eliminate_unqualified:
+            self.eliminated |= ~wanted
+
+    def assess_prior_first_experience(self, response: bool) -> None:
+        """
+        Vectorized Matches.assess_prior_first_experience.
+        """
+        if not isinstance(response, bool):
+            raise TypeError("User response for prior experience is not a bool")
+
+        table = self.table
+
+        if response:
+            self._add_scores(3 + 5 * table.prior_required + 2 * table.prior_preferred)
+        else:
+            self._add_scores(5 * table.prior_false - 2 * table.prior_preferred)
+
+    def assess_knowledge_of_game(self, response: str, eliminate_unqualified: bool = False) -> None:
+        """
+        Vectorized Matches.assess_knowledge_of_game.
+        """
+        if not isinstance(response, str):
+            raise TypeError("User response for game knowledge is not a string")
+
+        try:
+            user_level = KNOWLEDGE_HIERARCHY.index(response)
+        except ValueError:
+            raise ValueError(f"Invalid response: {response}. Must be one of {KNOWLEDGE_HIERARCHY}")
+
+        required_level = self.table.knowledge_level
+        known = required_level >= 0
+        meets = known & (required_level <= user_level)
+
+        self._add_scores(8 * (meets & (required_level == user_level)))
+        self._add_scores(5 * (meets & (required_level < user_level)))
+
+        if eliminate_unqualified:
+            self.eliminated |= known & ~meets
+
+    def assess_requirements_general(
+        self,
+        req: str,
+        keywords: dict,
+        responses: set[str],
+        eliminate_unqualified: bool = False
+    ) -> None:
+        """
+        Vectorized Matches.assess_requirements_general.
+        """
+        if not isinstance(responses, set):
+            raise TypeError(f"Invalid user input for required skills. Expects a "
+                        f"set but input is a {type(responses)} instead")
+
+        assessable, matched = self.table.category_mask(req, keywords, responses | {"NONE"})
+
+        self._add_scores(8 * matched)
+
+        if eliminate_unqualified:
+            self.eliminated |= assessable & ~matched
+
+    def assess_pref_experience(self, req: str, keywords: dict, responses: set[str]) -> None:
+        """
+        Vectorized Matches.assess_pref_experience.
+        """
+        if not isinstance(responses, set):
+            raise TypeError(f"Invalid user input for preferred experience. Expects a "
+                        f"set but input is a {type(responses)} instead")
+
+        _, matched = self.table.category_mask(req, keywords, responses | {"NONE"})
+
+        self._add_scores(3 * matched)
+
+class BatchResult:
+    """
+    Scores of many volunteers against every role of a catalog.
+
+    Attributes:
+        - role_names (list[str]): Role names, one per column.
+        - scores (np.ndarray): N x M int matrix, one row per
+            volunteer.
+        - eliminated (np.ndarray): N x M boolean elimination mask.
+    """
+    def __init__(self, role_names: list[str], scores, eliminated) -> None:
+        self.role_names = role_names
+        self.scores = scores
+        self.eliminated = eliminated
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def best_fit_roles(self, num: int = 3) -> list[list[str]]:
+        """
+        Returns each volunteer's top scoring roles that haven't been
+        eliminated, ties broken by catalog order.
+        """
+        # Eliminated roles sort last, a stable sort keeps catalog order for ties
+        keys = np.where(self.eliminated, np.inf, -self.scores.astype(float))
+        order = np.argsort(keys, axis=1, kind="stable")[:, :num]
+
+        return [[self.role_names[column] for column in row_order if not self.eliminated[row, column]]
+            for row, row_order in enumerate(order)]
+
+    def to_dict(self, num: int = 3) -> dict:
+        return {
+            "roles": self.role_names,
+            "scores": self.scores.tolist(),
+            "eliminated": self.eliminated.tolist(),
+            "best_fit_roles": self.best_fit_roles(num)
+        }
+
+def score_batch(catalog: RoleCatalog, answer_sets: list[dict], student_status: bool) -> BatchResult:
+    """
+    Applies every assessment to many volunteers at once. Volunteers
+    giving the same answer to a question share one vectorized
+    assessment, whose score deltas and eliminations are then added
+    to all of their rows.
+
+    Args:
+        - catalog (RoleCatalog): The roles to score against.
+        - answer_sets (list[dict]): One dict per volunteer, mapping
+            question keys to raw answers. Unanswered questions are
+            skipped for that volunteer.
+        - student_status (bool): Student status applied to every
+            volunteer.
+
+    Returns:
+        - BatchResult: The N x M score matrix and elimination mask.
+
+    Raises:
+        - ValueError: If an answer is malformed, naming its row.
+    """
+    parsed = []
+
+    for row, answers in enumerate(answer_sets):
+        try:
+            parsed.append(parse_answers(answers))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Row {row}: {e}") from e
+
+    table = RoleTable.for_catalog(catalog)
+    scores = np.zeros((len(parsed), len(table)), dtype=np.int64)
+    eliminated = np.zeros((len(parsed), len(table)), dtype=bool)
+
+    for question_key, assessment, args, eliminate in ASSESSMENT_PLAN:
+        groups = {}
+
+        for row, answers in enumerate(parsed):
+            if question_key in answers:
+                response = answers[question_key]
+                key = canonical_answer(response)
+                groups.setdefault(key, (response, []))[1].append(row)
+
+        for response, rows in groups.values():
+            engine = VectorizedMatches(catalog, student_status)
+            params = (*args, response) if eliminate is None else (*args, response, eliminate)
+            getattr(engine, assessment)(*params)
+
+            # Roles a volunteer already eliminated take no further deltas
+            scores[rows] += np.where(eliminated[rows], 0, engine.scores)
+            eliminated[rows] |= engine.eliminated
+
+    return BatchResult(list(table.role_names), scores, eliminated)
@@ -1,3 +1,7 @@
+from typing import NamedTuple
+import hashlib
+import json
+
 questions = {
     "age": {
         "question": "What is your age?",
@@ -91,12 +95,38 @@ keys = ["age", "physical_ability", "physical_ability_stand",
             "game_knowledge", "required_skills", "experience"
         ]
 
+class SerializedPayload(NamedTuple):
+    """
+    A JSON payload encoded once, along with its strong ETag (the 
+    unquoted hash of the body).
+    """
+    body: bytes
+    etag: str
+
+def serialize_payload(payload) -> SerializedPayload:
+    body = json.dumps(payload).encode("utf-8")
+    return SerializedPayload(body, hashlib.sha256(body).hexdigest()[:32])
+
 class Questions:
+    def __init__(self):
+        # The questions never change while the server runs, so encode 
+        # them once instead of on every request
+        self.payloads = [serialize_payload(questions[key]) for key in keys]
+        self.questionnaire = serialize_payload({"questions": [questions[key] for key in keys]})
+
     def get_question(self, question_id):
         if question_id > len(questions) - 1:
             question_id = 0
         return questions[keys[question_id]]
 
+    def get_payload(self, question_id) -> SerializedPayload:
+        """
+        Returns the encoded payload of get_question(question_id).
+        """
+        if question_id > len(questions) - 1:
+            question_id = 0
+        return self.payloads[question_id]
+
     def get_type(self, question_id):
         return questions[question_id]["type"]
 
@@ -0,0 +1,459 @@
+import asyncio
+import json
+import logging
+import secrets
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable
+from cache_backends import CacheBackend
+from model.matching_logic import Matches
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLocks:
+    """
+    One threading.Lock per session token, so a threaded server applies
+    concurrent requests for the same session one at a time. A lock 
+    only lives while a request holds or waits on it.
+    """
+    def __init__(self) -> None:
+        # token -> [lock, number of requests holding or waiting on it]
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, token: str):
+        with self._lock:
+            entry = self._locks.get(token)
+
+            if entry is None:
+                entry = self._locks[token] = [threading.Lock(), 0]
+
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+
+                if not entry[1]:
+                    del self._locks[token]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._locks)
+
+
+class SessionStore:
+    """
+    Keeps one independent matching session per volunteer, keyed by
+    an opaque session token. Sessions expire after a period of
+    inactivity and the number of live sessions is capped, evicting
+    the least recently used session once the cap is reached.
+
+    Attributes:
+        - factory (Callable): Builds a fresh session object.
+        - ttl_seconds (float): Seconds of inactivity before a
+            session expires.
+        - max_sessions (int): Maximum number of live sessions.
+    """
+    def __init__(
+        self,
+        factory: Callable,
+        ttl_seconds: float = 1800,
+        max_sessions: int = 5000,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("Session TTL must be a positive number of seconds.")
+
+        if max_sessions < 1:
+            raise ValueError("Session store must allow at least one session.")
+
+        self.factory = factory
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.clock = clock
+
+        # token -> (session, last access time), least recently used first
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._session_locks = SessionLocks()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict_expired(self.clock())
+            return len(self._sessions)
+
+    def create(self) -> tuple[str, object]:
+        """
+        Starts a new session, evicting expired sessions and, if the
+        store is still full, the least recently used one.
+
+        Returns:
+            - tuple[str, object]: The new session token and session.
+        """
+        session = self.factory()
+        token = secrets.token_urlsafe(16)
+
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+
+            self._sessions[token] = (session, now)
+
+        return token, session
+
+    def get(self, token: str) -> object | None:
+        """
+        Returns the session for a token and refreshes its expiry.
+
+        Args:
+            - token (str): The session token.
+
+        Returns:
+            - object | None: The session, or None if the token is
+                unknown or has expired.
+        """
+        with self._lock:
+            now = self.clock()
+            entry = self._sessions.get(token)
+
+            if entry is None:
+                return None
+
+            session, last_access = entry
+
+            if now - last_access > self.ttl_seconds:
+                del self._sessions[token]
+                return None
+
+            self._sessions[token] = (session, now)
+            self._sessions.move_to_end(token)
+
+            return session
+
+    def reset(self, token: str) -> object | None:
+        """
+        Replaces the session for a token with a fresh one, keeping
+        the same token.
+
+        Returns:
+            - object | None: The fresh session, or None if the token
+                is unknown or has expired.
+        """
+        if self.get(token) is None:
+            return None
+
+        session = self.factory()
+
+        with self._lock:
+            if token not in self._sessions:
+                return None
+
+            self._sessions[token] = (session, self.clock())
+            self._sessions.move_to_end(token)
+
+        return session
+
+    def remove(self, token: str) -> bool:
+        """
+        Ends a session.
+
+        Returns:
+            - bool: True if the token belonged to a live session.
+        """
+        with self._lock:
+            return self._sessions.pop(token, None) is not None
+
+    def locked(self, token: str):
+        """
+        Holds the lock of a session, so that getting, changing and 
+        saving it is not interleaved with another thread doing the 
+        same.
+        """
+        return self._session_locks.hold(token)
+
+    def save(self, token: str, session: object) -> None:
+        """
+        Records changes made to a session. Sessions live in this 
+        process and are changed in place, so there is nothing to do.
+        """
+
+    def _evict_expired(self, now: float) -> None:
+        # Entries are ordered by last access, so stop at the first live one
+        while self._sessions:
+            token, (_, last_access) = next(iter(self._sessions.items()))
+
+            if now - last_access <= self.ttl_seconds:
+                break
+
+            del self._sessions[token]
+
+
+class SharedSessionStore:
+    """
+    Keeps matching sessions in a cache backend shared by every worker,
+    so a volunteer's requests may land on any of them. A session is 
+    stored as the fingerprint of its catalog and the answers applied 
+    to it, and each worker rebuilds it by replaying those answers. 
+    Workers also keep the sessions they served recently, and only 
+    replay the answers another worker added since.
+
+    Sessions finish on the catalog version they started on. A session
+    whose catalog version is not loaded in this worker, such as one 
+    started before this worker reloaded the role sheet, cannot be 
+    replayed faithfully, so it is restarted on the current catalog 
+    with no answers.
+
+    Saving is last write wins: if two workers answer for the same 
+    token at once, each saves its own answer log and one of the 
+    answers is lost. Requests for one session within a worker are 
+    serialized with locked(), and a questionnaire sends its answers 
+    one at a time, so this only happens when a client sends answers 
+    concurrently to different workers.
+
+    Attributes:
+        - backend (CacheBackend): Where session state is stored.
+        - catalog (Callable): Returns the current RoleCatalog.
+        - student_status (bool): Student status of new sessions.
+        - ttl_seconds (float): Seconds of inactivity before a
+            session expires.
+        - local_sessions (int): Sessions kept in this process.
+    """
+    KEY_PREFIX = "session:"
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        catalog: Callable,
+        student_status: bool = True,
+        ttl_seconds: float = 1800,
+        local_sessions: int = 1000
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("Session TTL must be a positive number of seconds.")
+
+        if local_sessions < 1:
+            raise ValueError("Session store must keep at least one local session.")
+
+        self.backend = backend
+        self.catalog = catalog
+        self.student_status = student_status
+        self.ttl_seconds = ttl_seconds
+        self.local_sessions = local_sessions
+
+        # token -> session, least recently used first
+        self._local = OrderedDict()
+        self._catalogs = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._session_locks = SessionLocks()
+
+    def _new_session(self, catalog=None) -> Matches:
+        catalog = catalog or self.catalog()
+        self._catalogs[catalog.fingerprint] = catalog
+        return Matches(catalog=catalog, student_status=self.student_status)
+
+    def _keep(self, token: str, session: Matches) -> None:
+        with self._lock:
+            self._local[token] = session
+            self._local.move_to_end(token)
+
+            while len(self._local) > self.local_sessions:
+                self._local.popitem(last=False)
+
+    def create(self) -> tuple[str, Matches]:
+        """
+        Starts a new session on the current catalog.
+
+        Returns:
+            - tuple[str, Matches]: The new session token and session.
+        """
+        token = secrets.token_urlsafe(16)
+        session = self._new_session()
+
+        self.save(token, session)
+        self._keep(token, session)
+
+        return token, session
+
+    def get(self, token: str) -> Matches | None:
+        """
+        Returns the session for a token and refreshes its expiry.
+
+        Returns:
+            - Matches | None: The session, or None if the token is
+                unknown or has expired.
+        """
+        raw = self.backend.get(self.KEY_PREFIX + token)
+
+        if raw is None:
+            with self._lock:
+                self._local.pop(token, None)
+
+            return None
+
+        state = json.loads(raw)
+        answers = state["answers"]
+
+        with self._lock:
+            session = self._local.get(token)
+
+        applied = len(session.answer_log) if session is not None else 0
+
+        # Rebuild unless the local copy is this session minus the latest answers
+        if session is None or session.catalog.fingerprint != state["catalog"] \
+            or applied > len(answers) or session.answer_log != answers[:applied]:
+            current = self.catalog()
+            catalog = current if current.fingerprint == state["catalog"] \
+                else self._catalogs.get(state["catalog"])
+
+            # The answers were scored against a catalog version this 
+            # worker never loaded, so start the session over
+            if catalog is None:
+                logger.warning("Restarting session on the current role catalog, "
+                    "its catalog %s is not loaded", state["catalog"])
+                session = self._new_session(current)
+
+                self.save(token, session)
+                self._keep(token, session)
+
+                return session
+
+            session = self._new_session(catalog)
+            applied = 0
+
+        for question_id, answer in answers[applied:]:
+            session.next_assessment({"question_id": question_id, "answer": answer})
+
+        self.backend.set(self.KEY_PREFIX + token, raw, self.ttl_seconds)
+        self._keep(token, session)
+
+        return session
+
+    def locked(self, token: str):
+        """
+        Holds the lock of a session in this process. Requests for the
+        session handled by other workers are not held back.
+        """
+        return self._session_locks.hold(token)
+
+    def save(self, token: str, session: Matches) -> None:
+        """
+        Writes a session's catalog and answers to the backend, 
+        replacing whatever another worker saved for the token.
+        """
+        state = {"catalog": session.catalog.fingerprint, "answers": session.answer_log}
+        self.backend.set(self.KEY_PREFIX + token, json.dumps(state).encode("utf-8"), self.ttl_seconds)
+
+    def reset(self, token: str) -> Matches | None:
+        """
+        Replaces the session for a token with a fresh one on the 
+        current catalog, keeping the same token.
+
+        Returns:
+            - Matches | None: The fresh session, or None if the token
+                is unknown or has expired.
+        """
+        if self.backend.get(self.KEY_PREFIX + token) is None:
+            return None
+
+        session = self._new_session()
+
+        self.save(token, session)
+        self._keep(token, session)
+
+        return session
+
+    def remove(self, token: str) -> bool:
+        """
+        Ends a session.
+
+        Returns:
+            - bool: True if the token belonged to a live session.
+        """
+        with self._lock:
+            self._local.pop(token, None)
+
+        return self.backend.delete(self.KEY_PREFIX + token)
+
+
+class AsyncSessionStore:
+    """
+    A SessionStore for the ASGI server. session() holds a per-session 
+    asyncio.Lock, so concurrent requests for the same session are 
+    applied one at a time even if a handler awaits. Operations on an 
+    in-process SessionStore never block, so they run directly on the 
+    event loop. Those of a SharedSessionStore make blocking backend 
+    round trips, so they run in worker threads instead of stalling 
+    every other connection.
+
+    Attributes:
+        - store (SessionStore | SharedSessionStore): The underlying 
+            session store.
+        - offload (bool): Whether store operations run in worker 
+            threads.
+    """
+    def __init__(
+        self,
+        factory: Callable,
+        ttl_seconds: float = 1800,
+        max_sessions: int = 5000,
+        clock: Callable[[], float] = time.monotonic,
+        store=None
+    ) -> None:
+        # A SharedSessionStore may be passed to share sessions between workers
+        self.store = store or SessionStore(factory, ttl_seconds, max_sessions, clock)
+        self.offload = isinstance(self.store, SharedSessionStore)
+
+        # Locks only live while a request holds or waits on them
+        self._locks = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    async def _call(self, func: Callable, *args):
+        if self.offload:
+            return await asyncio.to_thread(func, *args)
+
+        return func(*args)
+
+    async def create(self) -> tuple[str, object]:
+        return await self._call(self.store.create)
+
+    def _lock(self, token: str) -> asyncio.Lock:
+        lock = self._locks.get(token)
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[token] = lock
+
+        return lock
+
+    @asynccontextmanager
+    async def session(self, token: str):
+        """
+        Holds the session for a token, yielding None if the token is 
+        unknown or has expired.
+        """
+        async with self._lock(token):
+            yield await self._call(self.store.get, token)
+
+    async def reset(self, token: str) -> object | None:
+        async with self._lock(token):
+            return await self._call(self.store.reset, token)
+
+    async def remove(self, token: str) -> bool:
+        return await self._call(self.store.remove, token)
+
+    async def save(self, token: str, session: object) -> None:
+        await self._call(self.store.save, token, session)
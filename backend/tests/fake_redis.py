@@ -0,0 +1,95 @@
+import socketserver
+import threading
+import time
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """
+    An in-memory stand-in for a Redis server, speaking enough of the
+    protocol for RedisBackend: PING, SELECT, GET, SET with PX or EX,
+    DEL and FLUSHDB. Use it as a context manager, it listens on a
+    free local port while open.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.data = {}
+        self.data_lock = threading.Lock()
+        self.commands = []
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+    def execute(self, command: str, args: list[bytes]):
+        self.commands.append(command)
+
+        with self.data_lock:
+            if command in ("PING", "SELECT"):
+                return "+OK" if command == "SELECT" else "+PONG"
+
+            if command == "GET":
+                value, expires_at = self.data.get(args[0], (None, None))
+
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    del self.data[args[0]]
+                    return None
+
+                return value
+
+            if command == "SET":
+                expires_at = None
+
+                if len(args) == 4:
+                    unit = 1000 if args[2].upper() == b"PX" else 1
+                    expires_at = time.monotonic() + int(args[3]) / unit
+
+                self.data[args[0]] = (args[1], expires_at)
+                return "+OK"
+
+            if command == "DEL":
+                return sum(self.data.pop(key, None) is not None for key in args)
+
+            if command == "FLUSHDB":
+                self.data.clear()
+                return "+OK"
+
+        return f"-ERR unknown command '{command}'"
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+
+            if not line:
+                return
+
+            args = []
+
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+
+            reply = self.server.execute(args[0].decode().upper(), args[1:])
+            self.wfile.write(encode_reply(reply))
+
+def encode_reply(reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+
+    return reply.encode() + b"\r\n"
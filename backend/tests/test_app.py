@@ -0,0 +1,200 @@
+from model.catalog import RoleCatalog
+from questions import Questions
+from sessions import SessionStore, SharedSessionStore
+from cache_backends import MemoryBackend
+from model.matching_logic import Matches
+from test_data import TestData
+import app as app_module
+import threading
+import unittest
+
+class TestApp(unittest.TestCase):
+    def setUp(self):
+        catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+
+        self.saved = app_module.role_catalog, app_module.sessions, app_module.questions
+        app_module.role_catalog = catalog
+        app_module.questions = Questions()
+        app_module.sessions = SessionStore(lambda: Matches(catalog=catalog, student_status=True))
+        self.client = app_module.app.test_client()
+
+    def tearDown(self):
+        app_module.role_catalog, app_module.sessions, app_module.questions = self.saved
+
+    def test_match_is_stateless(self):
+        answers = {"age": 14, "working_preference": "Front-facing"}
+
+        first = self.client.post("/api/match", json={"answers": answers})
+        second = self.client.post("/api/match", json={"answers": answers})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.get_json(), second.get_json())
+        self.assertEqual(first.get_json()["Best fit roles"], "Queuer, Pit Admin")
+
+    def test_match_rejects_malformed_answers(self):
+        response = self.client.post("/api/match", json={"answers": {"game_knowledge": "Expert"}})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post("/api/match", json={"answers": ["Yes"]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_bodies_that_are_not_objects_are_rejected(self):
+        for body in ([], ["answers"], "x", 3):
+            single = self.client.post("/api/match", json=body)
+            batch = self.client.post("/api/batch-match", json=body)
+
+            self.assertEqual(single.status_code, 400, body)
+            self.assertEqual(batch.status_code, 400, body)
+
+    def test_update_role_rejects_out_of_range_numbers(self):
+        token = self.client.post("/api/session").get_json()["session_token"]
+        headers = {app_module.SESSION_HEADER: token}
+
+        for question_id, answer in (("availability", "inf"), ("availability", "nan"),
+            ("availability", "-2"), ("age", -4), ("age", "-4")):
+            response = self.client.post("/api/update-role", headers=headers,
+                json={"question_id": question_id, "answer": answer})
+
+            self.assertEqual(response.status_code, 400, (question_id, answer))
+
+        self.assertEqual(app_module.sessions.get(token).answer_log, [])
+
+    def test_malformed_num_is_rejected(self):
+        answers = {"age": 14}
+
+        for num in ("three", 0, 2.5, True, [3]):
+            single = self.client.post("/api/match", json={"answers": answers, "num": num})
+            batch = self.client.post("/api/batch-match", json={"answers": [answers], "num": num})
+
+            self.assertEqual(single.status_code, 400)
+            self.assertEqual(batch.status_code, 400)
+
+        response = self.client.post("/api/match", json={"answers": answers, "num": "2"})
+        self.assertEqual(len(response.get_json()["Best fit scores"]), 2)
+
+    def test_batch_match(self):
+        response = self.client.post("/api/batch-match", json={"answers": [
+            {"age": 14, "working_preference": "BTS"},
+            {"age": 14, "working_preference": "Front-facing"}
+        ]})
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data["scores"]), 2)
+        self.assertEqual(data["best_fit_roles"][1], ["Queuer", "Pit Admin"])
+
+    def test_sessions_are_isolated(self):
+        token = self.client.post("/api/session").get_json()["session_token"]
+
+        self.assertEqual(self.client.get("/api/get-roles").status_code, 400)
+        self.assertEqual(self.client.get("/api/get-roles",
+            headers={"X-Session-Token": "unknown"}).status_code, 404)
+        self.assertEqual(self.client.get("/api/get-roles",
+            headers={"X-Session-Token": token}).status_code, 200)
+
+    def test_negative_pages_are_rejected(self):
+        headers = {"X-Session-Token": self.client.post("/api/session").get_json()["session_token"]}
+
+        for query in ("page=-1", "page_size=0", "page=0&page_size=-5"):
+            response = self.client.get(f"/api/get-roles?{query}", headers=headers)
+            self.assertEqual(response.status_code, 400, query)
+
+        self.assertEqual(self.client.get("/api/get-roles?page=0&page_size=2", headers=headers).status_code, 200)
+
+    def test_update_role_matches_stateless_match(self):
+        token = self.client.post("/api/session").get_json()["session_token"]
+        headers = {"X-Session-Token": token}
+
+        for question_id, answer in [("age", 14), (5, "Front-facing")]:
+            response = self.client.post("/api/update-role", headers=headers,
+                json={"question_id": question_id, "answer": answer})
+            self.assertEqual(response.status_code, 200)
+
+        roles = self.client.get("/api/get-roles", headers=headers).get_json()
+        self.assertEqual(roles["Best fit roles"], "Queuer, Pit Admin")
+
+        response = self.client.post("/api/update-role", headers=headers,
+            json={"question_id": "favourite_colour", "answer": "Blue"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_concurrent_answers_to_one_session_are_all_applied(self):
+        token = self.client.post("/api/session").get_json()["session_token"]
+        headers = {app_module.SESSION_HEADER: token}
+        answers = ["YES", "NO", "NO_PREF"] * 10
+        statuses = []
+
+        def answer(value: str):
+            client = app_module.app.test_client()
+            response = client.post("/api/update-role", headers=headers,
+                json={"question_id": "leadership_preference", "answer": value})
+            statuses.append(response.status_code)
+
+        threads = [threading.Thread(target=answer, args=(value,)) for value in answers]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(statuses, [200] * len(answers))
+        self.assertEqual(len(app_module.sessions.get(token).answer_log), len(answers))
+
+    def test_shared_sessions_are_saved_after_each_answer(self):
+        backend = MemoryBackend()
+        app_module.sessions = SharedSessionStore(backend, lambda: app_module.role_catalog)
+
+        token = self.client.post("/api/session").get_json()["session_token"]
+        headers = {"X-Session-Token": token}
+
+        for question_id, answer in [("age", 14), (5, "Front-facing")]:
+            self.client.post("/api/update-role", headers=headers,
+                json={"question_id": question_id, "answer": answer})
+
+        # Another worker only has the backend to go on
+        app_module.sessions = SharedSessionStore(backend, lambda: app_module.role_catalog)
+        roles = self.client.get("/api/get-roles", headers=headers).get_json()
+
+        self.assertEqual(roles["Best fit roles"], "Queuer, Pit Admin")
+
+    def test_questions_are_cached(self):
+        urls = ["/api/get-question?question_id=1", "/api/questions"]
+        question, questionnaire = (self.client.get(url) for url in urls)
+
+        self.assertEqual(question.status_code, 200)
+        self.assertEqual(question.get_json(), questionnaire.get_json()["questions"][1])
+        self.assertEqual(len(questionnaire.get_json()["questions"]), app_module.TOTAL_ID + 1)
+        self.assertIn("max-age=3600", question.headers["Cache-Control"])
+
+        for url, response in zip(urls, (question, questionnaire)):
+            revalidated = self.client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+            self.assertEqual(revalidated.status_code, 304)
+
+        other = self.client.get("/api/get-question?question_id=2")
+        self.assertNotEqual(other.headers["ETag"], question.headers["ETag"])
+
+    def test_reloaded_catalog_applies_to_new_sessions(self):
+        rows = TestData().schema_test_data
+        app_module.sessions = SessionStore(
+            lambda: Matches(catalog=app_module.role_catalog, student_status=True))
+
+        old = self.client.post("/api/session").get_json()
+        app_module.set_role_catalog(RoleCatalog(rows[:1], convert_booleans=True).with_version(2))
+        new = self.client.post("/api/session").get_json()
+
+        self.assertEqual((old["catalog_version"], new["catalog_version"]), (0, 2))
+
+        def ranked(token):
+            return self.client.get("/api/get-roles?page=0",
+                headers={"X-Session-Token": token}).get_json()["Ranking"]["total"]
+
+        self.assertEqual(ranked(old["session_token"]), len(rows))
+        self.assertEqual(ranked(new["session_token"]), 1)
+
+        reset = self.client.post("/api/reset", headers={"X-Session-Token": old["session_token"]})
+
+        self.assertEqual(reset.get_json()["catalog_version"], 2)
+        self.assertEqual(ranked(old["session_token"]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+from asgi import QuestionnaireApp
+from model.catalog import RoleCatalog
+from model.metrics import METRICS, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from questions import Questions
+from test_data import TestData
+import asyncio
+import json
+import unittest
+
+async def call(app, method: str, path: str, payload=None, token: str | None = None, query: str = "",
+    headers: list | None = None, sent: list | None = None):
+    scope = {"type": "http", "method": method, "path": path, "query_string": query.encode(),
+        "headers": ([(b"x-session-token", token.encode())] if token else []) + (headers or [])}
+    body = b"" if payload is None else json.dumps(payload).encode()
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = [] if sent is None else sent
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+
+    response_body = sent[1]["body"]
+    return sent[0]["status"], json.loads(response_body) if response_body else None
+
+class TestASGI(unittest.TestCase):
+    def setUp(self):
+        catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        self.app = QuestionnaireApp(catalog, Questions())
+
+    def run_calls(self, *calls):
+        async def run():
+            return await asyncio.gather(*calls)
+
+        return asyncio.run(run())
+
+    def test_session_routes_match_flask(self):
+        async def flow():
+            _, data = await call(self.app, "POST", "/api/session")
+            token = data["session_token"]
+
+            await call(self.app, "POST", "/api/update-role", {"question_id": "age", "answer": 14}, token)
+            await call(self.app, "POST", "/api/update-role", {"question_id": 5, "answer": "Front-facing"}, token)
+            return token, await call(self.app, "GET", "/api/get-roles", token=token)
+
+        token, (status, roles) = asyncio.run(flow())
+
+        self.assertEqual(status, 200)
+        self.assertEqual(roles["Best fit roles"], "Queuer, Pit Admin")
+
+        status, _ = asyncio.run(call(self.app, "POST", "/api/reset", {}, token))
+        self.assertEqual(status, 200)
+
+    def test_errors(self):
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/get-roles"))[0], 400)
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/get-roles", token="unknown"))[0], 404)
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/missing"))[0], 404)
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/reset"))[0], 405)
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/get-question", query="question_id=99"))[0], 404)
+
+        token = asyncio.run(call(self.app, "POST", "/api/session"))[1]["session_token"]
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/get-roles", token=token, query="page=-1"))[0], 400)
+        self.assertEqual(asyncio.run(call(self.app, "GET", "/api/get-roles", token=token, query="page_size=0"))[0], 400)
+
+    def test_metrics_match_flask(self):
+        was_enabled = METRICS.enabled
+        METRICS.reset()
+        METRICS.enable()
+        self.addCleanup(METRICS.reset)
+        self.addCleanup(setattr, METRICS, "enabled", was_enabled)
+
+        asyncio.run(call(self.app, "POST", "/api/session"))
+        scope = {"type": "http", "method": "GET", "path": "/api/metrics", "query_string": b"", "headers": []}
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+        headers = dict(sent[0]["headers"])
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(headers[b"content-type"].decode(), METRICS_CONTENT_TYPE)
+        self.assertIn('http_requests_total{route="/api/session",method="POST",status="201"} 1',
+            sent[1]["body"].decode())
+
+    def test_get_question(self):
+        status, question = asyncio.run(call(self.app, "GET", "/api/get-question", query="question_id=1"))
+
+        self.assertEqual(status, 200)
+        self.assertEqual(question["options"], ["Yes", "No", "No Preference"])
+
+    def test_questions_are_cached(self):
+        sent = []
+        status, questionnaire = asyncio.run(call(self.app, "GET", "/api/questions", sent=sent))
+        headers = dict(sent[0]["headers"])
+
+        self.assertEqual(status, 200)
+        self.assertEqual(questionnaire["questions"][1]["options"], ["Yes", "No", "No Preference"])
+        self.assertEqual(headers[b"cache-control"], b"public, max-age=3600")
+
+        status, body = asyncio.run(call(self.app, "GET", "/api/questions",
+            headers=[(b"if-none-match", headers[b"etag"])]))
+
+        self.assertEqual((status, body), (304, None))
+
+    def test_concurrent_sessions_are_isolated(self):
+        async def flow(age: int):
+            _, data = await call(self.app, "POST", "/api/session")
+            token = data["session_token"]
+            await call(self.app, "POST", "/api/update-role", {"question_id": "age", "answer": age}, token)
+            return (await call(self.app, "GET", "/api/get-roles", token=token))[1]
+
+        results = self.run_calls(*(flow(age) for age in [14, 30] * 50))
+
+        self.assertEqual(len({json.dumps(result) for result in results[0::2]}), 1)
+        self.assertNotEqual(results[0], results[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from model.answers import ASSESSMENT_PLAN, parse_answers
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.vectorized import np
+from test_data import TestData
+import random
+import unittest
+
+def random_answers(rng: random.Random) -> dict:
+    answers = {
+        "age": rng.randint(13, 40),
+        "physical_ability": rng.choice(["Yes", "No", "No Preference"]),
+        "physical_ability_stand": rng.choice(["Yes", "No"]),
+        "physical_ability_move": rng.choice(["Yes", "No"]),
+        "availability": rng.choice([-1, 1, 2, 3]),
+        "working_preference": rng.choice(["Behind the scenes", "Front-facing", "No Preference"]),
+        "leadership_preference": rng.choice(["Yes", "No", "No Preference"]),
+        "prior_experience": rng.choice(["Yes", "No"]),
+        "game_knowledge": rng.choice(["None", "Limited", "Average", "Thorough"]),
+        "required_skills": rng.sample(["PROGRAMMING PROFICIENCY", "pv", "Photography",
+            "Control systems and diagnostics", "MECHANICAL/TECHNICAL SKILLS"], 2),
+        "experience": rng.sample(["Event management experience", "FRC CONTROL SYSTEM EXPERIENCE",
+            "FIRST SAFETY KNOWLEDGE"], 1)
+    }
+
+    # Leave a question unanswered now and then
+    if rng.random() < 0.3:
+        del answers[rng.choice(list(answers))]
+
+    return answers
+
+def score_sequentially(catalog: RoleCatalog, answers: dict) -> Matches:
+    match = Matches(catalog=catalog, student_status=True)
+    parsed = parse_answers(answers)
+
+    for question_key, assessment, args, eliminate in ASSESSMENT_PLAN:
+        if question_key in parsed:
+            params = (*args, parsed[question_key])
+            getattr(match, assessment)(match.get_active_roles(), *params,
+                *(() if eliminate is None else (eliminate,)))
+
+    return match
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestScoreBatch(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        self.match = Matches(catalog=self.catalog, student_status=True)
+
+    def test_batch_matches_sequential_sessions(self):
+        rng = random.Random(3)
+        answer_sets = [random_answers(rng) for _ in range(150)]
+
+        result = self.match.score_batch(answer_sets)
+
+        self.assertEqual(result.scores.shape, (150, len(self.catalog)))
+
+        for row, answers in enumerate(answer_sets):
+            expected = score_sequentially(self.catalog, answers)
+            eliminated = {result.role_names[column]
+                for column in np.flatnonzero(result.eliminated[row])}
+
+            self.assertEqual(dict(zip(result.role_names, result.scores[row].tolist())),
+                expected.all_role_scoreboard)
+            self.assertEqual(eliminated, expected.eliminated_roles)
+
+    def test_session_state_untouched(self):
+        self.match.score_batch([{"age": 15}])
+
+        self.assertEqual(set(self.match.all_role_scoreboard.values()), {0})
+        self.assertEqual(self.match.get_eliminated_roles(), [])
+
+    def test_best_fit_roles_skip_eliminated(self):
+        result = self.match.score_batch([
+            {"age": 14, "working_preference": "BTS"},
+            {"age": 14, "working_preference": "Front-facing"}
+        ])
+        bts, front = result.best_fit_roles(num=3)
+
+        self.assertEqual(bts, ["Field Resetter", "Scorekeeper", "Photographer"])
+        self.assertEqual(front, ["Queuer", "Pit Admin"])
+
+    def test_malformed_row_is_reported(self):
+        with self.assertRaisesRegex(ValueError, "Row 1"):
+            self.match.score_batch([{"age": 20}, {"working_preference": "Sometimes"}])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+from benchmarks.synthetic import generate_roles, generate_answers
+from benchmarks import run_benchmarks
+from model.answers import parse_answers
+from model.catalog import RoleCatalog
+import json
+import os
+import tempfile
+import unittest
+
+class TestBenchmarks(unittest.TestCase):
+    def test_synthetic_data_uses_real_schema(self):
+        roles = generate_roles(200, seed=3)
+        catalog = RoleCatalog(roles, convert_booleans=True)
+
+        self.assertEqual(len(catalog), 200)
+        self.assertEqual(roles, generate_roles(200, seed=3))
+        self.assertTrue(any(record.top_required_skill not in ("NONE", -1) for record in catalog))
+
+        for answers in generate_answers(50, seed=3):
+            parse_answers(answers)
+
+    def test_results_are_saved_and_compared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            args = ["--sizes", "20", "--repeat", "1", "--volunteers", "2", "--output", output]
+
+            self.assertEqual(run_benchmarks.main(args), 0)
+
+            with open(output) as file:
+                report = json.load(file)
+
+            self.assertIn("assess_age[age]", report["results"]["20"]["assessments"])
+
+            # Halving every baseline timing must be reported as a regression
+            baseline = json.loads(json.dumps(report), parse_float=lambda value: float(value) / 2)
+            self.assertTrue(run_benchmarks.compare(report, baseline, threshold=1.5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+from cache_backends import MemoryBackend, SQLiteBackend, RedisBackend, backend_from_url
+from fake_redis import FakeRedisServer
+from model.answers import parse_answers
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.result_cache import ResultCache
+from sessions import SharedSessionStore
+from test_data import TestData
+import os
+import tempfile
+import time
+import unittest
+
+class BackendContract:
+    """
+    Checks every backend against the same behaviour. Subclasses build
+    the backend under test in make_backend.
+    """
+    def setUp(self):
+        self.backend = self.make_backend()
+        self.addCleanup(self.backend.close)
+
+    def test_get_set_delete(self):
+        self.assertIsNone(self.backend.get("missing"))
+
+        self.backend.set("key", b"value")
+        self.backend.set("binary", bytes(range(256)))
+
+        self.assertEqual(self.backend.get("key"), b"value")
+        self.assertEqual(self.backend.get("binary"), bytes(range(256)))
+
+        self.backend.set("key", b"replaced")
+        self.assertEqual(self.backend.get("key"), b"replaced")
+
+        self.assertTrue(self.backend.delete("key"))
+        self.assertFalse(self.backend.delete("key"))
+        self.assertIsNone(self.backend.get("key"))
+
+    def test_values_expire(self):
+        self.backend.set("short", b"1", ttl_seconds=0.05)
+        self.backend.set("long", b"2", ttl_seconds=60)
+        time.sleep(0.1)
+
+        self.assertIsNone(self.backend.get("short"))
+        self.assertEqual(self.backend.get("long"), b"2")
+
+class TestMemoryBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        return MemoryBackend()
+
+    def test_least_recently_used_entries_are_evicted(self):
+        backend = MemoryBackend(max_entries=2)
+
+        for key in ("a", "b", "c"):
+            backend.set(key, key.encode())
+
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(backend.get("c"), b"c")
+
+class TestSQLiteBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+        return SQLiteBackend(self.path)
+
+    def test_connections_share_the_file(self):
+        other = SQLiteBackend(self.path)
+        self.addCleanup(other.close)
+
+        self.backend.set("key", b"value")
+        self.assertEqual(other.get("key"), b"value")
+
+class TestRedisBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        self.server = FakeRedisServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        return RedisBackend("127.0.0.1", self.server.port, db=1)
+
+    def test_reconnects_after_the_connection_drops(self):
+        self.backend.set("key", b"value")
+        self.backend._local.connection.close()
+
+        self.assertEqual(self.backend.get("key"), b"value")
+        self.assertIn("SELECT", self.server.commands)
+
+class TestBackendFromURL(unittest.TestCase):
+    def test_schemes(self):
+        self.assertIsInstance(backend_from_url("memory://"), MemoryBackend)
+
+        redis = backend_from_url("redis://cache.local:6380/2")
+        self.assertEqual((redis.host, redis.port, redis.db), ("cache.local", 6380, 2))
+
+        with tempfile.TemporaryDirectory() as directory:
+            sqlite = backend_from_url(f"sqlite://{directory}/cache.db")
+            self.assertEqual(sqlite.path, f"{directory}/cache.db")
+            sqlite.close()
+
+        with self.assertRaises(ValueError):
+            backend_from_url("memcached://localhost")
+
+class TestSharedState(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        self.server = FakeRedisServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+    def workers(self):
+        # Two workers, each with its own connection to the shared server
+        return [SharedSessionStore(RedisBackend("127.0.0.1", self.server.port), lambda: self.catalog)
+            for _ in range(2)]
+
+    def test_sessions_continue_on_any_worker(self):
+        first, second = self.workers()
+        token, match = first.create()
+
+        match.next_assessment({"question_id": "age", "answer": 14})
+        first.save(token, match)
+
+        elsewhere = second.get(token)
+        elsewhere.next_assessment({"question_id": "working_preference", "answer": "Front-facing"})
+        second.save(token, elsewhere)
+
+        # The first worker only replays the answer the second one added
+        back = first.get(token)
+
+        self.assertIs(back, match)
+        self.assertEqual(back.get_best_fit_roles(), elsewhere.get_best_fit_roles())
+        self.assertEqual(back.get_best_fit_roles()["Best fit roles"], "Queuer, Pit Admin")
+
+        self.assertEqual(second.reset(token).answer_log, [])
+        self.assertEqual(first.get(token).answer_log, [])
+        self.assertTrue(first.remove(token))
+        self.assertIsNone(second.get(token))
+        self.assertIsNone(second.reset(token))
+
+    def test_sessions_on_an_unloaded_catalog_restart(self):
+        first, second = self.workers()
+        token, match = first.create()
+
+        match.next_assessment({"question_id": "age", "answer": 14})
+        first.save(token, match)
+
+        # The second worker has reloaded a different role sheet
+        second.catalog = lambda: RoleCatalog(TestData().medium_test_data)
+
+        with self.assertLogs("sessions", "WARNING"):
+            restarted = second.get(token)
+
+        self.assertEqual(restarted.answer_log, [])
+        self.assertEqual(restarted.catalog.fingerprint, second.catalog().fingerprint)
+
+        # The new catalog is saved, so the session is not restarted again
+        restarted.next_assessment({"question_id": "age", "answer": 16})
+        second.save(token, restarted)
+
+        with self.assertNoLogs("sessions", "WARNING"):
+            self.assertIs(second.get(token), restarted)
+
+    def test_sessions_expire(self):
+        store = SharedSessionStore(MemoryBackend(), lambda: self.catalog, ttl_seconds=0.05)
+        token, _ = store.create()
+        time.sleep(0.1)
+
+        self.assertIsNone(store.get(token))
+
+    def test_rankings_are_shared_between_workers(self):
+        first, second = (ResultCache(backend=RedisBackend("127.0.0.1", self.server.port))
+            for _ in range(2))
+        responses = parse_answers({"age": 14, "working_preference": "BTS"})
+
+        expected = Matches(catalog=self.catalog, student_status=True)
+        expected.assess_responses(responses)
+
+        self.assertEqual(first.best_fit_roles(self.catalog, responses), expected.get_best_fit_roles())
+        self.assertEqual(second.best_fit_roles(self.catalog, responses), expected.get_best_fit_roles())
+        self.assertEqual((first.misses, second.hits, second.misses), (1, 1, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+from model.catalog import RoleCatalog, ThresholdIndex, SCORING_COLUMNS
+from model.matching_logic import Matches
+from model.answers import parse_answer
+from model.response import MultiChoiceResponse, PreferenceResponse
+from test_data import TestData
+import pandas as pd
+import pickle
+import tempfile
+import os
+import unittest
+
+class TestRoleCatalog(unittest.TestCase):
+    def setUp(self):
+        self.rows = TestData().schema_test_data
+        self.catalog = RoleCatalog(self.rows, convert_booleans=True)
+
+    def test_records_are_parsed(self):
+        queuer = self.catalog.record("Queuer")
+
+        self.assertEqual(queuer.age_min, "Students")
+        self.assertEqual(queuer.time_commitment, 0.75)
+        self.assertTrue(queuer.requires_standing)
+        self.assertEqual(queuer.work_pref, "FRONT")
+
+        inspector = self.catalog.record("Lead Robot Inspector")
+
+        self.assertTrue(inspector.leadership_pref)
+        self.assertEqual(inspector.prior_experience, "REQUIRED")
+        self.assertEqual(inspector.game_knowledge, "THOROUGH")
+        self.assertEqual(inspector.top_required_skill, "MECHANICAL/TECHNICAL SKILLS")
+
+        self.assertEqual(self.catalog.record("Pit Admin").age_pref, 18)
+        self.assertEqual(self.catalog.record("Pit Admin").time_commitment, 0)
+        self.assertEqual(self.catalog.record("Field Resetter").top_required_skill, "NONE")
+
+    def test_work_preferences_are_compared_verbatim(self):
+        rows = [
+            {"role_name": "Scorekeeper", "work_pref": "BTS"},
+            {"role_name": "Runner", "work_pref": "bts "},
+            {"role_name": "Emcee", "work_pref": "FRONT"}
+        ]
+        match = Matches(dataset=rows, student_status=True)
+
+        match.assess_working_pref(match.get_active_roles(), parse_answer("working_preference", "BTS"),
+            eliminate_unqualified=True)
+
+        self.assertEqual(match.catalog.record("Runner").work_pref, "bts ")
+        self.assertEqual(match.all_role_scoreboard, {"Scorekeeper": 5, "Runner": 0, "Emcee": 0})
+        self.assertEqual(match.eliminated_roles, {"Emcee"})
+
+    def test_blank_age_preferences_score_as_no_preference(self):
+        # Blank cells become None, so a role with only a minimum age
+        # gets the full +5. Baseline scoring compared against the NaN
+        # and gave it 0
+        rows = [
+            {"role_name": "Runner", "age_min": 14, "age_preference": float("nan")},
+            {"role_name": "Emcee", "age_min": 14, "age_preference": 18},
+            {"role_name": "Judge", "age_min": 14, "age_preference": 15}
+        ]
+        match = Matches(dataset=rows, student_status=False)
+
+        match.assess_age(match.get_active_roles(), 16, eliminate_unqualified=True)
+
+        self.assertIsNone(match.catalog.rows[0]["age_preference"])
+        self.assertEqual(match.all_role_scoreboard, {"Runner": 5, "Emcee": 3, "Judge": 0})
+
+    def test_catalog_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.catalog.records = ()
+
+        with self.assertRaises(TypeError):
+            self.catalog.rows[0]["role_name"] = "Changed"
+
+    def test_missing_cells_are_normalized(self):
+        catalog = RoleCatalog([{"role_name": "Runner", "age_min": float("nan"),
+            "leadership_pref": float("nan"), "required_skills": float("nan")}])
+        runner = catalog.record("Runner")
+
+        self.assertIsNone(catalog.rows[0]["age_min"])
+        self.assertEqual(runner.age_min, -1)
+        self.assertFalse(runner.leadership_pref)
+        self.assertEqual(runner.top_required_skill, "NONE")
+
+    def test_invalid_leadership_rejected(self):
+        with self.assertRaises(TypeError):
+            RoleCatalog([{"role_name": "Runner", "leadership_pref": "sometimes"}])
+
+    def test_from_csv_matches_rows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roles.csv")
+            pd.DataFrame(self.rows).to_csv(path, index=False)
+
+            from_csv = RoleCatalog.from_csv(path)
+
+        self.assertEqual(from_csv.role_names, self.catalog.role_names)
+        self.assertEqual(from_csv.records, self.catalog.records)
+
+    def test_sessions_share_catalog(self):
+        first = Matches(catalog=self.catalog, student_status=True)
+        second = Matches(catalog=self.catalog, student_status=True)
+
+        first.assess_age(first.dataset, 15, eliminate_unqualified=True)
+
+        self.assertIs(first.dataset, second.dataset)
+        self.assertEqual(set(second.all_role_scoreboard.values()), {0})
+        self.assertEqual(second.get_eliminated_roles(), [])
+        self.assertIn("Lead Robot Inspector", first.get_eliminated_roles())
+
+class TestCompactRecords(unittest.TestCase):
+    def test_rows_hold_only_scoring_columns(self):
+        catalog = RoleCatalog(TestData().short_test_data, convert_booleans=True)
+        row = catalog.rows[0]
+
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertNotIn("notes", row)
+        self.assertIsNone(row.get("game_category"))
+        self.assertTrue(set(row) <= set(SCORING_COLUMNS))
+        self.assertEqual(row["role_name"], "Teleportation Engineer")
+        self.assertEqual(pickle.loads(pickle.dumps(row)), row)
+
+        with self.assertRaises(KeyError):
+            row["notes"]
+
+        with self.assertRaises(AttributeError):
+            row.role_name = "Changed"
+
+    def test_responses_are_slotted_and_share_options(self):
+        first = parse_answer("working_preference", "Front-facing")
+        second = MultiChoiceResponse("bts", {"no_pref", "bts", "front"})
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertFalse(hasattr(PreferenceResponse("YES"), "__dict__"))
+        self.assertIs(first.valid_options, second.valid_options)
+        self.assertEqual(second.choice, "BTS")
+
+class TestThresholdIndexes(unittest.TestCase):
+    def test_prefix_is_found_by_binary_search(self):
+        index = ThresholdIndex({"a": 3, "b": 1, "c": 2, "d": 2})
+
+        self.assertEqual(index.names, ("b", "c", "d", "a"))
+        self.assertEqual(index.count_at_most(0), 0)
+        self.assertEqual(index.at_most(2), ("b", "c", "d"))
+        self.assertEqual(index.above(2), ("a",))
+        self.assertEqual(index.ranks["a"], 3)
+
+    def test_catalog_indexes_thresholds_of_distinct_roles(self):
+        rows = [
+            {"role_name": "Field Reset", "age_min": "16", "age_preference": "18", "time_commitment": "2 days"},
+            {"role_name": "Queuer", "age_min": "Students", "time_commitment": "4 hours"},
+            {"role_name": "Judge", "age_min": "21", "time_commitment": "3 days"},
+            {"role_name": "Field Reset", "age_min": "30", "time_commitment": "5 days"}
+        ]
+        catalog = RoleCatalog(rows)
+
+        self.assertEqual(catalog.age_min_index.at_most(20), ("Field Reset",))
+        self.assertEqual(catalog.age_preference_index.above(17), ("Field Reset",))
+        self.assertEqual(catalog.student_roles, {"Queuer"})
+        self.assertEqual(catalog.time_commitment_index.above(1), ("Field Reset", "Judge"))
+        self.assertIs(catalog.with_version(3).age_min_index, catalog.age_min_index)
+
+    def test_indexed_assessments_keep_boundaries(self):
+        rows = [
+            {"role_name": "Field Reset", "age_min": "16", "age_preference": "18",
+                "time_commitment": "2 days", "age_exception_allowed": True},
+            {"role_name": "Judge", "age_min": "21", "time_commitment": "3 days"},
+            {"role_name": "Queuer", "age_min": "Students", "time_commitment": "4 hours"}
+        ]
+        match = Matches(dataset=rows, student_status=False)
+
+        match.assess_age(match.get_active_roles(), 16, eliminate_unqualified=True)
+        match.assess_availability(match.get_active_roles(), parse_answer("availability", 2),
+            eliminate_unqualified=True)
+
+        self.assertEqual(match.all_role_scoreboard, {"Field Reset": 8, "Judge": 0, "Queuer": 0})
+        self.assertEqual(match.eliminated_roles, {"Judge", "Queuer"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+from catalog_watcher import CatalogWatcher
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from test_data import TestData
+import os
+import tempfile
+import time
+import unittest
+
+class TestCatalogWatcher(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "roles.txt")
+        self.rows = TestData().schema_test_data
+        self.write(len(self.rows))
+
+        self.loads = 0
+        self.watcher = CatalogWatcher(self.load, [self.path], interval=0.01)
+        self.published = []
+        self.watcher.subscribe(self.published.append)
+
+    def write(self, count):
+        with open(self.path, "w") as file:
+            file.write(str(count))
+
+        # Move the mtime forward, coarse filesystem clocks may not tick between writes
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + self.bumps()))
+
+    def bumps(self):
+        self.bump = getattr(self, "bump", 0) + 1_000_000_000
+        return self.bump
+
+    def load(self):
+        self.loads += 1
+
+        with open(self.path) as file:
+            count = int(file.read())
+
+        return RoleCatalog(self.rows[:count], convert_booleans=True)
+
+    def settled_check(self):
+        # The first check after a change only notes it
+        self.assertIsNone(self.watcher.check())
+        return self.watcher.check()
+
+    def test_reloads_only_changed_files(self):
+        first = self.watcher.load()
+
+        self.assertEqual(first.version, 1)
+        self.assertIsNone(self.watcher.check())
+
+        self.write(2)
+        second = self.settled_check()
+
+        self.assertEqual(second.version, 2)
+        self.assertEqual(len(second), 2)
+        self.assertEqual(self.published, [first, second])
+        self.assertIsNone(self.watcher.check())
+        self.assertEqual(self.loads, 2)
+
+    def test_sessions_keep_their_version(self):
+        catalog = self.watcher.load()
+        self.watcher.subscribe(lambda new: setattr(self, "current", new))
+        self.current = catalog
+
+        started = Matches(catalog=self.current, student_status=True)
+        self.write(2)
+        self.settled_check()
+        restarted = Matches(catalog=self.current, student_status=True)
+
+        self.assertEqual(started.catalog.version, 1)
+        self.assertEqual(len(started.get_active_roles()), len(self.rows))
+        self.assertEqual(restarted.catalog.version, 2)
+        self.assertEqual(len(restarted.get_active_roles()), 2)
+        self.assertIs(restarted.catalog.records, self.current.records)
+
+    def test_failed_reload_keeps_catalog(self):
+        self.watcher.load()
+
+        with open(self.path, "w") as file:
+            file.write("not a number")
+
+        with self.assertLogs("catalog_watcher", "WARNING"):
+            self.assertIsNone(self.settled_check())
+
+        self.assertIsInstance(self.watcher.last_error, ValueError)
+        self.assertEqual(self.watcher.version, 1)
+
+        # A broken sheet is not parsed again until it changes
+        self.assertIsNone(self.watcher.check())
+        self.assertEqual(self.loads, 2)
+
+        self.write(3)
+
+        self.assertEqual(self.settled_check().version, 2)
+        self.assertIsNone(self.watcher.last_error)
+
+    def test_files_still_being_written_are_not_loaded(self):
+        self.watcher.load()
+
+        # A partial write, then the rest of it before the next poll
+        self.write(1)
+        self.assertIsNone(self.watcher.check())
+        self.write(3)
+        self.assertIsNone(self.watcher.check())
+
+        catalog = self.watcher.check()
+
+        self.assertEqual(len(catalog), 3)
+        self.assertEqual(self.loads, 2)
+
+    def test_background_thread_picks_up_edits(self):
+        self.watcher.load()
+        self.watcher.start()
+        self.addCleanup(self.watcher.stop)
+
+        self.write(1)
+        deadline = time.monotonic() + 5
+
+        while self.watcher.version < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.watcher.version, 2)
+        self.assertEqual(len(self.published[-1]), 1)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            CatalogWatcher(self.load, [self.path], interval=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 class TestData:
+    __test__ = False # Test fixtures, not a pytest test class
+
     def __init__(self):
         self.short_test_data = [
             {
@@ -240,3 +242,143 @@ class TestData:
             }
         ]
 
+
+        # Rows carrying every column read by scoring, as they come out of the sheet
+        self.schema_test_data = [
+            {
+                "role_name": "Field Resetter",
+                "event_type": "FRC",
+                "age_min": "14",
+                "age_preference": "",
+                "age_exception_allowed": "FALSE",
+                "required_skills": "FALSE",
+                "prior_first_exp": "FALSE",
+                "required_experience": "FALSE",
+                "preferred_experience": "Basic game knowledge",
+                "basic_game_knowledge": "TRUE",
+                "physical_req": "Must be able to walk, lift and carry field elements",
+                "time_commitment": "2 days",
+                "work_pref": "BTS",
+                "leadership_pref": "FALSE",
+                "notes": ""
+            },
+            {
+                "role_name": "Scorekeeper",
+                "event_type": "FRC",
+                "age_min": "18",
+                "age_preference": "21",
+                "age_exception_allowed": "TRUE",
+                "required_skills": "Competent computer skills, spreadsheets and online forms",
+                "prior_first_exp": "Preferred",
+                "required_experience": "Basic knowledge of match process",
+                "preferred_experience": "Prior years as FRC referee",
+                "basic_game_knowledge": "Thorough knowledge of game rules",
+                "physical_req": "FALSE",
+                "time_commitment": "1.5 days",
+                "work_pref": "BTS",
+                "leadership_pref": "FALSE",
+                "notes": "Sits at the scoring table"
+            },
+            {
+                "role_name": "Queuer",
+                "event_type": "FRC",
+                "age_min": "Students",
+                "age_preference": "",
+                "age_exception_allowed": "FALSE",
+                "required_skills": "FALSE",
+                "prior_first_exp": "FALSE",
+                "required_experience": "FALSE",
+                "preferred_experience": "Team experience, alumni welcome",
+                "basic_game_knowledge": "Basic game knowledge",
+                "physical_req": "Stand for long periods of time",
+                "time_commitment": "6 hours",
+                "work_pref": "FRONT",
+                "leadership_pref": "FALSE",
+                "notes": ""
+            },
+            {
+                "role_name": "Lead Robot Inspector",
+                "event_type": "FRC",
+                "age_min": "21",
+                "age_preference": "",
+                "age_exception_allowed": "FALSE",
+                "required_skills": "Mechanical skills, technical skills and robot inspection",
+                "prior_first_exp": "Must have 2 prior years of FIRST experience",
+                "required_experience": "Hands-on FRC control system experience",
+                "preferred_experience": "Robot build experience",
+                "basic_game_knowledge": "Advanced",
+                "physical_req": "Walk the pits and move between robots",
+                "time_commitment": "3 days",
+                "work_pref": "FRONT",
+                "leadership_pref": "TRUE",
+                "notes": "Supervises the inspection team"
+            },
+            {
+                "role_name": "Pit Admin",
+                "event_type": "FRC",
+                "age_min": "16",
+                "age_preference": "18",
+                "age_exception_allowed": "TRUE",
+                "required_skills": "Email, word and excel",
+                "prior_first_exp": "Helpful",
+                "required_experience": "Event management",
+                "preferred_experience": "Pit volunteer",
+                "basic_game_knowledge": "Familiar with general knowledge of events",
+                "physical_req": "FALSE",
+                "time_commitment": "Varies",
+                "work_pref": "FRONT",
+                "leadership_pref": "FALSE",
+                "notes": ""
+            },
+            {
+                "role_name": "Control System Advisor",
+                "event_type": "FRC",
+                "age_min": "18",
+                "age_preference": "",
+                "age_exception_allowed": "FALSE",
+                "required_skills": "Control systems & diagnostics, robot control system and electronics",
+                "prior_first_exp": "TRUE",
+                "required_experience": "FRC control system, diagnostic tools",
+                "preferred_experience": "Control system wiring",
+                "basic_game_knowledge": "In-depth",
+                "physical_req": "FALSE",
+                "time_commitment": "4 hours",
+                "work_pref": "BTS",
+                "leadership_pref": "FALSE",
+                "notes": ""
+            },
+            {
+                "role_name": "Volunteer Coordinator",
+                "event_type": "FRC",
+                "age_min": "21",
+                "age_preference": "25",
+                "age_exception_allowed": "FALSE",
+                "required_skills": "Proficient use of office software",
+                "prior_first_exp": "Experience required",
+                "required_experience": "Able to supervise and evaluate volunteers",
+                "preferred_experience": "Volunteer management",
+                "basic_game_knowledge": "FALSE",
+                "physical_req": "FALSE",
+                "time_commitment": "1/2 day",
+                "work_pref": "FRONT",
+                "leadership_pref": "TRUE",
+                "notes": "Runs the volunteer lounge"
+            },
+            {
+                "role_name": "Photographer",
+                "event_type": "FRC",
+                "age_min": "16",
+                "age_preference": "",
+                "age_exception_allowed": "TRUE",
+                "required_skills": "Photography, shooting indoor in low light",
+                "prior_first_exp": "FALSE",
+                "required_experience": "FALSE",
+                "preferred_experience": "FALSE",
+                "basic_game_knowledge": "FALSE",
+                "physical_req": "Move around the venue and carry equipment",
+                "time_commitment": "2 days",
+                "work_pref": "BTS",
+                "leadership_pref": "FALSE",
+                "notes": ""
+            }
+        ]
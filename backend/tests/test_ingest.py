@@ -0,0 +1,141 @@
+from benchmarks.synthetic import generate_roles, generate_answers
+from model.catalog import RoleCatalog
+from model.ingest import read_answer_rows, match_answer_file, MULTISELECT_SEPARATOR
+from model.parallel import score_serial
+import csv
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(generate_roles(100, seed=8), convert_booleans=True)
+        self.answer_sets = generate_answers(30, seed=8)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_jsonl(self, name: str, lines: list[str]) -> str:
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, "w") as file:
+            file.writelines(line + "\n" for line in lines)
+
+        return path
+
+    def write_csv(self, name: str, answer_sets: list[dict]) -> str:
+        path = os.path.join(self.directory.name, name)
+        fieldnames = sorted({key for answers in answer_sets for key in answers})
+
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for answers in answer_sets:
+                writer.writerow({key: MULTISELECT_SEPARATOR.join(value) if isinstance(value, list) else value
+                    for key, value in answers.items()})
+
+        return path
+
+    def expected(self) -> list[dict]:
+        return [{key: value for key, value in result.items() if key != "volunteer"}
+            for result in score_serial(self.catalog, self.answer_sets)]
+
+    def match(self, path: str) -> tuple[list[dict], dict]:
+        output = io.StringIO()
+        summary = match_answer_file(self.catalog, path, output)
+
+        return [json.loads(line) for line in output.getvalue().splitlines()], summary
+
+    def test_jsonl_matches_serial_scoring(self):
+        path = self.write_jsonl("answers.jsonl", [json.dumps(answers) for answers in self.answer_sets])
+        results, summary = self.match(path)
+
+        self.assertEqual(summary, {"rows": 30, "matched": 30, "malformed": 0})
+        self.assertEqual([result.pop("row") for result in results], list(range(1, 31)))
+        self.assertEqual(results, self.expected())
+
+    def test_csv_matches_serial_scoring(self):
+        results, summary = self.match(self.write_csv("answers.csv", self.answer_sets))
+
+        self.assertEqual(summary["matched"], 30)
+        self.assertEqual([result.pop("row") for result in results], list(range(2, 32)))
+        self.assertEqual(results, self.expected())
+
+    def test_malformed_rows_are_reported(self):
+        lines = [json.dumps(self.answer_sets[0]), "{not json", "", "[1, 2]",
+            json.dumps({"age": "fourteen"}), json.dumps(self.answer_sets[1])]
+        path = self.write_jsonl("answers.jsonl", lines)
+        output, errors = io.StringIO(), io.StringIO()
+
+        summary = match_answer_file(self.catalog, path, output, errors)
+
+        self.assertEqual(summary, {"rows": 5, "matched": 2, "malformed": 3})
+        self.assertEqual([json.loads(line)["row"] for line in output.getvalue().splitlines()], [1, 6])
+        self.assertEqual([json.loads(line)["row"] for line in errors.getvalue().splitlines()], [2, 4, 5])
+
+    def test_undecodable_and_unparsable_rows_are_reported(self):
+        path = os.path.join(self.directory.name, "answers.csv")
+
+        with open(path, "wb") as file:
+            file.write(b"age,working_preference\n14,BTS\n15,Fr\xe9nt\n16," + b"x" * 200
+                + b"\n17,FRONT\n")
+
+        limit = csv.field_size_limit(100)
+        self.addCleanup(csv.field_size_limit, limit)
+        output, errors = io.StringIO(), io.StringIO()
+
+        summary = match_answer_file(self.catalog, path, output, errors)
+        reported = [json.loads(line) for line in errors.getvalue().splitlines()]
+
+        self.assertEqual(summary, {"rows": 4, "matched": 2, "malformed": 2})
+        self.assertEqual([json.loads(line)["row"] for line in output.getvalue().splitlines()], [2, 5])
+        self.assertEqual([error["row"] for error in reported], [3, 4])
+        self.assertIn("UTF-8", reported[0]["error"])
+        self.assertIn("Invalid CSV", reported[1]["error"])
+
+    def test_undecodable_jsonl_lines_are_reported(self):
+        path = os.path.join(self.directory.name, "answers.jsonl")
+
+        with open(path, "wb") as file:
+            file.write(b'{"age": 14}\n{"working_preference": "\xff"}\n{"age": 15}\n')
+
+        output, errors = io.StringIO(), io.StringIO()
+        summary = match_answer_file(self.catalog, path, output, errors)
+
+        self.assertEqual(summary, {"rows": 3, "matched": 2, "malformed": 1})
+        self.assertEqual(json.loads(errors.getvalue())["row"], 2)
+
+    def test_rows_are_typed_responses(self):
+        path = self.write_csv("answers.csv", self.answer_sets[:1])
+        row = next(read_answer_rows(path))
+
+        self.assertIsNone(row.error)
+        self.assertEqual(row.responses.keys(), self.answer_sets[0].keys())
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            next(read_answer_rows(os.path.join(self.directory.name, "answers.txt")))
+
+    def test_memory_stays_flat(self):
+        def peak(rows: int) -> int:
+            path = self.write_jsonl(f"answers-{rows}.jsonl",
+                [json.dumps(self.answer_sets[i % 30]) for i in range(rows)])
+
+            with open(os.devnull, "w") as output:
+                tracemalloc.start()
+
+                try:
+                    match_answer_file(self.catalog, path, output)
+                    return tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+        small, large = peak(50), peak(500)
+
+        self.assertLess(large, small * 1.5)
+
+if __name__ == "__main__":
+    unittest.main()
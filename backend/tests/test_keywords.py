@@ -0,0 +1,82 @@
+from model.keywords import *
+import unittest
+
+class TestCategorizerCache(unittest.TestCase):
+    def test_registry_reuses_categorizer(self):
+        first = get_categorizer(REQ_SKILLS_KEYWORDS)
+
+        self.assertIs(get_categorizer(REQ_SKILLS_KEYWORDS), first)
+        self.assertIsNot(get_categorizer(REQ_EXPERIENCE_KEYWORDS), first)
+
+    def test_memoized_top_category_matches_categorizer(self):
+        text = "Hands-on robot control system diagnostics and electronics"
+        categorizer = RegexSkillCategorizer(REQ_SKILLS_KEYWORDS)
+        expected = categorizer.get_top_category(categorizer.categorize_skills(text))
+
+        self.assertEqual(get_top_skill_category(text, REQ_SKILLS_KEYWORDS), expected)
+
+        hits = top_category_cache_info().hits
+        self.assertEqual(get_top_skill_category(text, REQ_SKILLS_KEYWORDS), expected)
+        self.assertEqual(top_category_cache_info().hits, hits + 1)
+
+    def test_keyword_sets_cached_separately(self):
+        text = "field management system"
+
+        self.assertEqual(get_top_skill_category(text, REQ_SKILLS_KEYWORDS),
+            "CONTROL SYSTEMS & DIAGNOSTICS")
+        self.assertEqual(get_top_skill_category(text, REQ_EXPERIENCE_KEYWORDS),
+            "FIELD MANAGEMENT SYSTEM EXPERIENCE")
+
+class TestSinglePassCategorizer(unittest.TestCase):
+    def assert_matches_regex(self, categorizer, text):
+        self.assertEqual(categorizer.categorize_skills(text),
+            categorizer.categorize_skills_regex(text), text)
+
+    def test_shared_keywords_credit_every_category(self):
+        categorizer = RegexSkillCategorizer(REQ_SKILLS_KEYWORDS)
+        scores = categorizer.categorize_skills("Word and Excel, robot DIAGNOSTICS")
+
+        self.assertEqual(scores["pv"], 2)
+        self.assertEqual(scores["PROFICIENT USE OF OFFICE MATERIALS"], 2)
+        self.assertEqual(scores["MECHANICAL/TECHNICAL SKILLS"], 1)
+        self.assertEqual(scores["CONTROL SYSTEMS & DIAGNOSTICS"], 1)
+
+    def test_word_boundaries(self):
+        categorizer = RegexSkillCategorizer({"A": ["c++", "java"], "B": ["java script", "script"]})
+
+        for text in ["c++", "c++11", "use c++ daily", "javascript", "java script",
+                "java_script", "Java-Script", "scripts"]:
+            self.assert_matches_regex(categorizer, text)
+
+    def test_alternation_order_and_overlaps(self):
+        categorizer = RegexSkillCategorizer({
+            "A": ["ab", "abc", "b"],
+            "B": ["abc d", "c"],
+            "C": ["d"]
+        })
+
+        for text in ["abc d", "ab abc b", "abc", "b c d", "ABC D abc"]:
+            self.assert_matches_regex(categorizer, text)
+
+    def test_default_keywords_match_regex(self):
+        texts = [
+            "Hands-on FRC control system experience, diagnostic tools",
+            "Proficient use of office software: Word, Excel, printers and copiers",
+            "Prior years of FIRST Robotics Competition referee, game & event rules",
+            "Vertical milling machine, engine lathes, TIG welder",
+            "Fast-paced environment; photo processing software (low light)"
+        ]
+
+        for keywords in [REQ_SKILLS_KEYWORDS, REQ_EXPERIENCE_KEYWORDS, PREF_EXPERIENCE_KEYWORDS]:
+            categorizer = RegexSkillCategorizer(keywords)
+
+            for text in texts:
+                self.assert_matches_regex(categorizer, text)
+
+    def test_non_ascii_falls_back_to_regex(self):
+        categorizer = RegexSkillCategorizer(REQ_SKILLS_KEYWORDS)
+
+        self.assert_matches_regex(categorizer, "Caf\u00e9 word processing, excel \u2013 python")
+
+if __name__ == "__main__":
+    unittest.main()
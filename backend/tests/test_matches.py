@@ -1,11 +1,11 @@
-from matching_logic import Matches, PreferenceResponse, AvailabilityResponse
+from model.matching_logic import Matches, PreferenceResponse, AvailabilityResponse
 from test_data import TestData
 import pandas as pd
 import random
 import unittest
 
 class MatchTestUtils:
-    def __init__(self, data: list[dicts] = None, data_path: str = None):
+    def __init__(self, data: list[dict] = None, data_path: str = None):
         self.data = None
 
         if data:
@@ -13,22 +13,104 @@ class MatchTestUtils:
 
         if isinstance(data_path, str):
             try:
-                self.data = pd.read_csv(data_path)
-            except error as e:
+                self.data = pd.read_csv(data_path).to_dict(orient="records")
+            except Exception as e:
                 print(e)
 
-        if self.data == None:
-            self.data = random.choice([TestData.short_test_data, 
-                                       TestData.medium_test_data])
+        if self.data is None:
+            test_data = TestData()
+            self.data = random.choice([test_data.short_test_data,
+                                       test_data.medium_test_data])
 
         self.match_system = Matches(dataset=self.data, student_status=True)
 
-    def test_create_dataset(self):
-        # Short test
+class TestMatches(unittest.TestCase):
+    def test_sessions_do_not_share_state(self):
+        data = TestData().short_test_data
+        first = Matches(dataset=data, student_status=True)
+        second = Matches(dataset=data, student_status=True)
 
-    # ..... lol i'll write later
+        first.eliminate_role("Dragon Handler")
+        first.all_role_scoreboard["Teleportation Engineer"] += 5
 
-    def test_assess_availability(self):
-        # Most basic test case
+        self.assertEqual(second.get_eliminated_roles(), [])
+        self.assertEqual(second.all_role_scoreboard["Teleportation Engineer"], 0)
 
+    def test_active_roles_shrink_as_roles_are_eliminated(self):
+        match = Matches(dataset=TestData().medium_test_data, student_status=True)
+        self.assertEqual(match.get_remaining_roles_count(), 10)
 
+        match.eliminate_role("Dragon Handler")
+        match.eliminate_role("Dragon Handler")
+
+        self.assertEqual(match.get_remaining_roles_count(), 9)
+        self.assertNotIn("Dragon Handler", [role["role_name"] for role in match.get_active_roles()])
+
+    def test_eliminated_roles_are_not_assessed_again(self):
+        match = Matches(dataset=TestData().short_test_data, student_status=True)
+        match.eliminate_role("Dragon Handler")
+
+        match.assess_answers({"availability": -1})
+
+        self.assertEqual(match.all_role_scoreboard["Dragon Handler"], 0)
+        self.assertEqual(match.all_role_scoreboard["Teleportation Engineer"], 5)
+
+    def test_catalog_sessions_create_datasets_from_their_rows(self):
+        data = TestData().short_test_data
+        match = Matches(dataset=data, student_status=True)
+
+        dataset = match.create_dataset(convert_booleans=True)
+
+        self.assertEqual([role["role_name"] for role in dataset], [role["role_name"] for role in data])
+        self.assertIsInstance(dataset[0], dict)
+
+class TestRanking(unittest.TestCase):
+    def setUp(self):
+        self.match = Matches(dataset=TestData().medium_test_data, student_status=True)
+
+        scores = [4, 9, 4, 1, 9, 0, 7, 4, 2, 6]
+        for role_name, score in zip(self.match.all_role_scoreboard, scores):
+            self.match.all_role_scoreboard[role_name] = score
+
+    def test_rank_roles_orders_by_score_then_sheet_order(self):
+        self.assertEqual(self.match.rank_roles(num=4), [
+            ("Dragon Handler", 9),
+            ("Virtual Arena Referee", 9),
+            ("Wand Charging Technician", 7),
+            ("Time Travel Safety Officer", 6)
+        ])
+        self.assertEqual(len(self.match.rank_roles()), 10)
+
+    def test_best_fit_roles_skip_eliminated(self):
+        self.match.eliminate_role("Dragon Handler")
+        best = self.match.get_best_fit_roles(num=2)
+
+        self.assertEqual(best["Best fit roles"], "Virtual Arena Referee, Wand Charging Technician")
+        self.assertEqual(best["Next best roles"], "None")
+        self.assertEqual(best["Best fit scores"][0], {"role": "Virtual Arena Referee", "score": 9})
+
+    def test_next_best_roles_fall_back_to_eliminated(self):
+        for role_name in list(self.match.all_role_scoreboard)[1:]:
+            self.match.eliminate_role(role_name)
+
+        best = self.match.get_best_fit_roles(num=3)
+
+        self.assertEqual(best["Best fit roles"], "Teleportation Engineer")
+        self.assertEqual(best["Next best roles"], "Dragon Handler, Virtual Arena Referee")
+
+    def test_ranking_pages(self):
+        self.match.eliminate_role("Dragon Handler")
+
+        first = self.match.get_best_fit_roles(page=0, page_size=4)["Ranking"]
+        last = self.match.get_ranking_page(page=2, page_size=4)
+
+        self.assertEqual(first["total"], 10)
+        self.assertEqual([role["role"] for role in first["roles"]], ["Virtual Arena Referee",
+            "Wand Charging Technician", "Time Travel Safety Officer", "Teleportation Engineer"])
+        self.assertEqual(last["roles"], [
+            {"role": "Magical Ethics Officer", "score": 0, "eliminated": False},
+            {"role": "Dragon Handler", "score": 9, "eliminated": True}
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
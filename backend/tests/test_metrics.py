@@ -0,0 +1,87 @@
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.metrics import METRICS, MetricsRegistry, Histogram
+from sessions import SessionStore
+from test_data import TestData
+import app as app_module
+import unittest
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = METRICS.enabled
+        METRICS.reset()
+
+    def tearDown(self):
+        METRICS.enabled = self.was_enabled
+        METRICS.reset()
+
+    def test_histogram_is_cumulative(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [("0.1", 2), ("1.0", 3), ("+Inf", 4)])
+        self.assertEqual(histogram.count, 4)
+
+    def test_assessments_are_recorded_when_enabled(self):
+        METRICS.enable()
+        match = Matches(dataset=TestData().medium_test_data, student_status=True)
+
+        match.assess_answers({"age": 14, "availability": 1})
+        match.assess_answers({"availability": 1})
+
+        self.assertEqual(METRICS.assessment_calls["availability"], 2)
+        self.assertEqual(METRICS.roles_visited["age"], 10)
+        self.assertEqual(sum(METRICS.roles_eliminated.values()), 10 - match.get_remaining_roles_count())
+
+        text = METRICS.render()
+        self.assertIn('matching_assessment_calls_total{question="age"} 1', text)
+        self.assertIn('matching_assessment_duration_seconds_bucket{question="age",le="+Inf"} 1', text)
+
+    def test_questions_sharing_an_assessment_are_labelled_apart(self):
+        METRICS.enable()
+        match = Matches(dataset=TestData().medium_test_data, student_status=True)
+
+        match.assess_answers({"required_skills": ["Basic computer literacy"], "experience": ["None"]})
+
+        self.assertEqual(METRICS.assessment_calls["required_skills"], 1)
+        self.assertEqual(METRICS.assessment_calls["experience"], 1)
+        self.assertNotIn("assess_requirements_general", METRICS.assessment_calls)
+
+    def test_nothing_is_recorded_when_disabled(self):
+        METRICS.disable()
+        match = Matches(dataset=TestData().short_test_data, student_status=True)
+
+        match.assess_answers({"age": 14})
+
+        self.assertEqual(METRICS.assessment_calls, {})
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.observe_request('/api/"odd"', "GET", 200, 0.01)
+
+        self.assertIn('route="/api/\\"odd\\""', registry.render())
+
+    def test_metrics_endpoint(self):
+        METRICS.enable()
+        catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        saved = app_module.role_catalog, app_module.sessions
+        app_module.role_catalog = catalog
+        app_module.sessions = SessionStore(lambda: Matches(catalog=catalog, student_status=True))
+
+        try:
+            client = app_module.app.test_client()
+            client.post("/api/match", json={"answers": {"age": 14}})
+            response = client.get("/api/metrics")
+        finally:
+            app_module.role_catalog, app_module.sessions = saved
+
+        text = response.get_data(as_text=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn('http_requests_total{route="/api/match",method="POST",status="200"} 1', text)
+        self.assertIn('matching_assessment_roles_visited_total{question="age"} 8', text)
+
+if __name__ == "__main__":
+    unittest.main()
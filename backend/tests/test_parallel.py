@@ -0,0 +1,40 @@
+from benchmarks.synthetic import generate_roles, generate_answers
+from model.catalog import RoleCatalog
+from model.parallel import score_serial, score_parallel
+from model.snapshot import write_snapshot
+import os
+import tempfile
+import unittest
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(generate_roles(300, seed=5), convert_booleans=True)
+        self.answer_sets = generate_answers(60, seed=5)
+        self.answer_sets[7] = {"age": "fourteen"}
+
+    def test_parallel_matches_serial(self):
+        expected = list(score_serial(self.catalog, self.answer_sets))
+        actual = list(score_parallel(self.catalog, iter(self.answer_sets), processes=2, chunk_size=7))
+
+        self.assertEqual(actual, expected)
+        self.assertEqual([result["volunteer"] for result in actual], list(range(60)))
+        self.assertIn("error", actual[7])
+
+    def test_existing_snapshot_is_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roles.snapshot")
+            write_snapshot(self.catalog, path)
+
+            results = list(score_parallel(None, self.answer_sets[:5], processes=1, snapshot_path=path))
+
+        self.assertEqual(results, list(score_serial(self.catalog, self.answer_sets[:5])))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            list(score_parallel(self.catalog, [], chunk_size=0))
+
+        with self.assertRaises(ValueError):
+            list(score_parallel(None, []))
+
+if __name__ == "__main__":
+    unittest.main()
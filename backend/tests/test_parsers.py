@@ -0,0 +1,35 @@
+from model import parsers
+from model.metrics import METRICS
+import unittest
+
+class TestParsers(unittest.TestCase):
+    def setUp(self):
+        parsers.clear_parser_caches()
+
+    def test_values_are_parsed(self):
+        self.assertEqual(parsers.extract_numerical_value("1/2 day"), 0.5)
+        self.assertEqual(parsers.extract_numerical_value("1.5 days"), 1.5)
+        self.assertEqual(parsers.extract_numerical_value("Ages 14+"), 14)
+        self.assertEqual(parsers.extract_numerical_value(float("nan")), -1)
+        self.assertEqual(parsers.parse_time_commitment("4 hours"), 0.5)
+        self.assertEqual(parsers.parse_time_commitment("Varies"), 0)
+        self.assertEqual(parsers.parse_age_min("Students"), "Students")
+        self.assertTrue(parsers.requires_moving("Must carry field elements"))
+
+    def test_repeated_cells_hit_the_memo(self):
+        for _ in range(5):
+            parsers.parse_time_commitment("2 days")
+
+        info = parsers.parser_cache_info()["parse_time_commitment"]
+
+        self.assertEqual((info.hits, info.misses), (4, 1))
+        self.assertIn('matching_cache_hits_total{cache="parse_time_commitment"} 4', METRICS.render())
+
+    def test_booleans_and_ints_are_cached_apart(self):
+        self.assertEqual(parsers.parse_prior_first_experience(True), "REQUIRED")
+
+        with self.assertRaises(TypeError):
+            parsers.parse_prior_first_experience(1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+from benchmarks.synthetic import generate_roles, generate_answers
+from model.answers import ASSESSMENT_HANDLERS, parse_answers
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.metrics import METRICS
+from test_data import TestData
+import unittest
+from unittest import mock
+
+class TestRolePartitions(unittest.TestCase):
+    def setUp(self):
+        roles = generate_roles(150, seed=11)
+
+        # Duplicate role names score every row but share one entry
+        roles += [dict(role) for role in roles[:10]]
+        self.catalog = RoleCatalog(roles, convert_booleans=True)
+
+    def scanned(self, responses: dict, student_status: bool) -> Matches:
+        match = Matches(catalog=self.catalog, student_status=student_status)
+
+        for question_key, handler in ASSESSMENT_HANDLERS.items():
+            if question_key in responses:
+                handler.scan(match, responses[question_key])
+
+        return match
+
+    def test_partitions_match_scanning(self):
+        for index, answers in enumerate(generate_answers(300, seed=5)):
+            student_status = index % 3 != 0
+            match = Matches(catalog=self.catalog, student_status=student_status)
+            match.assess_responses(parse_answers(answers))
+            expected = self.scanned(parse_answers(answers), student_status)
+
+            self.assertEqual(match.all_role_scoreboard, expected.all_role_scoreboard)
+            self.assertEqual(match.eliminated_roles, expected.eliminated_roles)
+            self.assertEqual(list(match.active_roles), list(expected.active_roles))
+
+    def test_partitions_are_shared_by_sessions_and_versions(self):
+        first = Matches(catalog=self.catalog, student_status=True)
+        first.assess_answers({"physical_ability": "YES", "working_preference": "BTS"})
+        partitions = dict(self.catalog.partitions)
+
+        reloaded = self.catalog.with_version(2)
+        second = Matches(catalog=reloaded, student_status=True)
+
+        with mock.patch.object(Matches, "assess_working_pref") as scan:
+            second.assess_answers({"working_preference": "Behind the scenes"})
+
+        scan.assert_not_called()
+        self.assertEqual(len(partitions), 2)
+        self.assertIs(reloaded.partitions, self.catalog.partitions)
+        self.assertIn(("physical_ability", ("PREFERENCE", "YES"), True), partitions)
+
+    def test_student_status_gets_its_own_partition(self):
+        Matches(catalog=self.catalog, student_status=True).assess_answers({"game_knowledge": "LIMITED"})
+        Matches(catalog=self.catalog, student_status=False).assess_answers({"game_knowledge": "LIMITED"})
+
+        self.assertIn(("game_knowledge", "LIMITED", True), self.catalog.partitions)
+        self.assertIn(("game_knowledge", "LIMITED", False), self.catalog.partitions)
+
+    def test_numeric_answers_are_never_partitioned(self):
+        answers = {"age": 15, "availability": 2}
+
+        for age in range(13, 40):
+            match = Matches(catalog=self.catalog, student_status=True)
+            match.assess_answers({**answers, "age": age})
+            expected = self.scanned(parse_answers({**answers, "age": age}), True)
+
+            self.assertEqual(match.all_role_scoreboard, expected.all_role_scoreboard)
+            self.assertEqual(match.eliminated_roles, expected.eliminated_roles)
+
+        self.assertEqual(self.catalog.partitions, {})
+
+    def test_malformed_answers_are_not_cached(self):
+        match = Matches(catalog=self.catalog, student_status=True)
+
+        with self.assertRaises(ValueError):
+            ASSESSMENT_HANDLERS["game_knowledge"].assess(match, "EXPERT")
+
+        self.assertEqual(self.catalog.partitions, {})
+        self.assertEqual(match.get_remaining_roles_count(), len(self.catalog.rows_by_name))
+
+    def test_full_catalog_falls_back_to_scanning(self):
+        with mock.patch("model.matching_logic.MAX_PARTITIONS", 1):
+            match = Matches(catalog=self.catalog, student_status=True)
+            match.assess_answers({"physical_ability": "NO", "working_preference": "FRONT"})
+
+        expected = self.scanned(parse_answers({"physical_ability": "NO", "working_preference": "FRONT"}), True)
+
+        self.assertEqual(list(self.catalog.partitions), [("physical_ability", ("PREFERENCE", "NO"), True)])
+        self.assertEqual(match.all_role_scoreboard, expected.all_role_scoreboard)
+
+    def test_eliminations_are_a_bitmask(self):
+        Matches(catalog=self.catalog, student_status=True).assess_answers({"physical_ability": "NO"})
+        partition = self.catalog.partitions[("physical_ability", ("PREFERENCE", "NO"), True)]
+        expected = self.scanned(parse_answers({"physical_ability": "NO"}), True)
+
+        self.assertIsInstance(partition.eliminated, int)
+        self.assertEqual(set(self.catalog.masked_roles(partition.eliminated)), expected.eliminated_roles)
+        self.assertEqual(self.catalog.role_mask(expected.eliminated_roles), partition.eliminated)
+
+        among = list(self.catalog.rows_by_name)[:3]
+        self.assertEqual(self.catalog.masked_roles(partition.eliminated, among),
+            [role_name for role_name in among if role_name in expected.eliminated_roles])
+
+    def test_partitions_are_bounded_by_catalog_size(self):
+        # Room for the partitions of two answers' worth of roles
+        entries = 2 * len(self.catalog.rows_by_name) + 1
+
+        with mock.patch("model.matching_logic.MAX_PARTITION_ENTRIES", entries):
+            for answer in ("LIMITED", "AVERAGE", "THOROUGH"):
+                Matches(catalog=self.catalog, student_status=True).assess_answers({"game_knowledge": answer})
+
+        self.assertEqual(len(self.catalog.partitions), 2)
+
+    def test_disabled_metrics_skip_the_clock(self):
+        was_enabled = METRICS.enabled
+        METRICS.enabled = False
+        self.addCleanup(setattr, METRICS, "enabled", was_enabled)
+
+        Matches(catalog=self.catalog, student_status=True).assess_answers({"leadership_preference": "YES"})
+
+        with mock.patch("model.matching_logic.time.perf_counter") as clock:
+            Matches(catalog=self.catalog, student_status=True).assess_answers({"leadership_preference": "YES"})
+
+        clock.assert_not_called()
+
+    def test_metrics_count_replayed_assessments(self):
+        was_enabled = METRICS.enabled
+        METRICS.reset()
+        METRICS.enable()
+
+        try:
+            catalog = RoleCatalog(TestData().medium_test_data)
+
+            Matches(catalog=catalog, student_status=True).assess_answers({"leadership_preference": "YES"})
+
+            # Replaying only touches the roles still active
+            match = Matches(catalog=catalog, student_status=True)
+
+            for role_name in catalog.role_names[:4]:
+                match.eliminate_role(role_name)
+
+            match.assess_answers({"leadership_preference": "YES"})
+
+            self.assertEqual(METRICS.assessment_calls["leadership_preference"], 2)
+            self.assertEqual(METRICS.roles_visited["leadership_preference"], 16)
+            self.assertEqual(METRICS.roles_eliminated["leadership_preference"], 16)
+        finally:
+            METRICS.enabled = was_enabled
+            METRICS.reset()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from benchmarks.synthetic import generate_roles, generate_answers
+from model.answers import parse_answers
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.metrics import METRICS
+from model.result_cache import ResultCache, result_key
+from test_data import TestData
+import unittest
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(generate_roles(150, seed=4), convert_booleans=True)
+        self.answer_sets = generate_answers(20, seed=4)
+        self.cache = ResultCache(maxsize=8)
+
+    def score(self, answers, num=3):
+        match = Matches(catalog=self.catalog, student_status=True)
+        match.assess_answers(answers)
+        return match.get_best_fit_roles(num=num)
+
+    def test_equivalent_answers_share_a_key(self):
+        first = parse_answers({"age": 16, "working_preference": "Front-facing",
+            "required_skills": ["Technical writing", "Basic computer literacy"]})
+        second = parse_answers({"age": "16", "working_preference": "front facing",
+            "required_skills": ["Basic computer literacy", "Technical writing"]})
+
+        self.assertEqual(result_key(self.catalog, first), result_key(self.catalog, second))
+        self.assertNotEqual(result_key(self.catalog, first), result_key(self.catalog, first, num=5))
+        self.assertNotEqual(result_key(self.catalog, first),
+            result_key(self.catalog, first, student_status=False))
+
+    def test_catalog_contents_are_part_of_the_key(self):
+        responses = parse_answers(self.answer_sets[0])
+        reloaded = RoleCatalog(generate_roles(150, seed=4), convert_booleans=True).with_version(7)
+        edited = RoleCatalog(generate_roles(149, seed=4), convert_booleans=True)
+
+        self.assertEqual(result_key(self.catalog, responses), result_key(reloaded, responses))
+        self.assertNotEqual(result_key(self.catalog, responses), result_key(edited, responses))
+
+    def test_cached_rankings_match_scoring(self):
+        for answers in self.answer_sets[:5] * 2:
+            self.assertEqual(self.cache.best_fit_roles(self.catalog, parse_answers(answers)),
+                self.score(answers))
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (5, 5))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_least_recently_used_rankings_are_evicted(self):
+        for answers in self.answer_sets:
+            self.cache.best_fit_roles(self.catalog, parse_answers(answers))
+
+        self.assertEqual(len(self.cache), 8)
+        self.assertEqual(self.cache.cache_info().currsize, 8)
+
+        self.cache.best_fit_roles(self.catalog, parse_answers(self.answer_sets[-1]))
+        self.cache.best_fit_roles(self.catalog, parse_answers(self.answer_sets[0]))
+
+        self.assertEqual(self.cache.cache_info().hits, 1)
+
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+    def test_hit_rate_is_exported(self):
+        catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        METRICS.register_cache("test_results", self.cache.cache_info)
+        self.addCleanup(METRICS.caches.pop, "test_results")
+
+        for _ in range(3):
+            self.cache.best_fit_roles(catalog, parse_answers({"age": 14}))
+
+        rendered = METRICS.render()
+
+        self.assertIn('matching_cache_hits_total{cache="test_results"} 2', rendered)
+        self.assertIn('matching_cache_misses_total{cache="test_results"} 1', rendered)
+        self.assertIn('matching_cache_hits_total{cache="best_fit_roles"}', rendered)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+from sessions import SessionStore, SharedSessionStore, AsyncSessionStore
+from cache_backends import MemoryBackend
+from model.catalog import RoleCatalog
+from test_data import TestData
+import asyncio
+import threading
+import time
+import unittest
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = SessionStore(dict, ttl_seconds=60, max_sessions=3, clock=self.clock)
+
+    def test_sessions_are_independent(self):
+        first_token, first = self.store.create()
+        second_token, second = self.store.create()
+
+        first["answer"] = "YES"
+
+        self.assertNotEqual(first_token, second_token)
+        self.assertIs(self.store.get(first_token), first)
+        self.assertEqual(self.store.get(second_token), {})
+
+    def test_expired_sessions_are_evicted(self):
+        token, _ = self.store.create()
+
+        self.clock.now = 61
+        self.assertIsNone(self.store.get(token))
+        self.assertEqual(len(self.store), 0)
+
+    def test_access_refreshes_expiry(self):
+        token, session = self.store.create()
+
+        self.clock.now = 50
+        self.assertIs(self.store.get(token), session)
+
+        self.clock.now = 100
+        self.assertIs(self.store.get(token), session)
+
+    def test_cap_evicts_least_recently_used(self):
+        tokens = [self.store.create()[0] for _ in range(3)]
+
+        # Touch the oldest session so the second becomes least recently used
+        self.store.get(tokens[0])
+        newest, _ = self.store.create()
+
+        self.assertEqual(len(self.store), 3)
+        self.assertIsNone(self.store.get(tokens[1]))
+        self.assertIsNotNone(self.store.get(tokens[0]))
+        self.assertIsNotNone(self.store.get(newest))
+
+    def test_reset_keeps_token(self):
+        token, session = self.store.create()
+        session["answer"] = "NO"
+
+        fresh = self.store.reset(token)
+
+        self.assertEqual(fresh, {})
+        self.assertIs(self.store.get(token), fresh)
+        self.assertIsNone(self.store.reset("missing"))
+
+    def test_remove(self):
+        token, _ = self.store.create()
+
+        self.assertTrue(self.store.remove(token))
+        self.assertFalse(self.store.remove(token))
+
+    def test_locked_sessions_are_changed_one_thread_at_a_time(self):
+        token, session = self.store.create()
+        session["log"] = []
+
+        def update(label: str):
+            with self.store.locked(token):
+                log = self.store.get(token)["log"]
+                log.append(f"{label} start")
+                time.sleep(0.01)
+                log.append(f"{label} end")
+
+        threads = [threading.Thread(target=update, args=(label,)) for label in "abc"]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        log = session["log"]
+
+        self.assertEqual(len(log), 6)
+        self.assertTrue(all(log[i][0] == log[i + 1][0] for i in range(0, 6, 2)))
+        self.assertEqual(len(self.store._session_locks), 0)
+
+class TestAsyncSessionStore(unittest.TestCase):
+    def test_requests_for_one_session_run_one_at_a_time(self):
+        store = AsyncSessionStore(list)
+        token, _ = asyncio.run(store.create())
+        order = []
+
+        async def update(label: str):
+            async with store.session(token) as session:
+                order.append(f"{label} start")
+                await asyncio.sleep(0)
+                session.append(label)
+                order.append(f"{label} end")
+
+        async def run():
+            await asyncio.gather(update("first"), update("second"))
+
+        asyncio.run(run())
+
+        self.assertEqual(order, ["first start", "first end", "second start", "second end"])
+        self.assertEqual(store.store.get(token), ["first", "second"])
+
+    def test_shared_store_calls_run_off_the_event_loop(self):
+        threads = set()
+
+        class RecordingBackend(MemoryBackend):
+            def get(self, key):
+                threads.add(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, value, ttl_seconds=None):
+                threads.add(threading.get_ident())
+                super().set(key, value, ttl_seconds)
+
+        catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        store = AsyncSessionStore(None, store=SharedSessionStore(RecordingBackend(), lambda: catalog))
+
+        async def run():
+            token, _ = await store.create()
+
+            async with store.session(token) as match:
+                match.next_assessment({"question_id": "age", "answer": 16})
+                await store.save(token, match)
+
+            return threading.get_ident(), token
+
+        loop_thread, token = asyncio.run(run())
+
+        self.assertTrue(store.offload)
+        self.assertNotIn(loop_thread, threads)
+        self.assertEqual(store.store.get(token).answer_log, [["age", 16]])
+
+    def test_unknown_tokens(self):
+        store = AsyncSessionStore(list)
+
+        async def run():
+            async with store.session("missing") as session:
+                pass
+
+            return session, await store.reset("missing")
+
+        self.assertEqual(asyncio.run(run()), (None, None))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.snapshot import write_snapshot, load_snapshot, read_snapshot, is_fresh, SnapshotError
+from test_data import TestData
+from unittest import mock
+import app as app_module
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "roles.snapshot")
+        self.catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+        write_snapshot(self.catalog, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_keeps_rows_records_and_types(self):
+        loaded = load_snapshot(self.path)
+
+        self.assertEqual(loaded.records, self.catalog.records)
+        self.assertEqual([dict(row) for row in loaded.rows], [dict(row) for row in self.catalog.rows])
+
+        for original, restored in zip(self.catalog.records, loaded.records):
+            self.assertEqual([type(value) for value in original], [type(value) for value in restored])
+
+    def test_loaded_catalog_scores_identically(self):
+        answers = {"age": 16, "availability": 2, "working_preference": "Behind the scenes",
+            "required_skills": ["Basic computer literacy"]}
+        expected = Matches(catalog=self.catalog, student_status=True)
+        actual = Matches(catalog=load_snapshot(self.path), student_status=True)
+
+        expected.assess_answers(answers)
+        actual.assess_answers(answers)
+
+        self.assertEqual(actual.all_role_scoreboard, expected.all_role_scoreboard)
+        self.assertEqual(actual.eliminated_roles, expected.eliminated_roles)
+
+    def test_other_files_are_rejected(self):
+        with self.assertRaises(SnapshotError):
+            read_snapshot(b"role_name,age_min\n")
+
+    def test_truncated_and_malformed_snapshots_are_rejected(self):
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for broken in (data[:len(data) // 2], data[:14], data[:-9], data[:12] + b"{}" + data[14:]):
+            with self.assertRaises(SnapshotError):
+                read_snapshot(broken)
+
+    def test_app_falls_back_to_the_csv_for_a_broken_snapshot(self):
+        data_path = os.path.join(self.directory.name, "roles.csv")
+        rows = [dict(row) for row in TestData().schema_test_data]
+
+        with open(data_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        with open(self.path, "wb") as file:
+            file.write(b"garbage")
+
+        os.utime(data_path, (0, 0))
+
+        with mock.patch.object(app_module, "DATA_PATH", data_path), mock.patch.object(app_module, "SNAPSHOT_PATH", self.path):
+            with self.assertLogs(app_module.app.logger, "WARNING"):
+                catalog = app_module.load_role_catalog()
+
+        self.assertEqual(len(catalog), len(rows))
+
+    def test_freshness_follows_the_csv(self):
+        data_path = os.path.join(self.directory.name, "roles.csv")
+        self.assertTrue(is_fresh(self.path, data_path))
+
+        with open(data_path, "w") as file:
+            file.write("role_name\n")
+
+        os.utime(self.path, (0, 0))
+        self.assertFalse(is_fresh(self.path, data_path))
+        self.assertFalse(is_fresh(self.path + ".missing", data_path))
+
+    def test_worker_starts_without_pandas(self):
+        code = ("import sys, app; "
+            "assert app.role_catalog is not None and len(app.role_catalog) == 8; "
+            "print('pandas' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True,
+            text=True, env={**os.environ, "ROLE_SNAPSHOT_PATH": self.path})
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+if __name__ == "__main__":
+    unittest.main()
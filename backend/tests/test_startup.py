@@ -0,0 +1,24 @@
+from benchmarks.startup_benchmark import benchmark_startup, BACKEND_DIR
+import subprocess
+import sys
+import unittest
+
+class TestStartup(unittest.TestCase):
+    def test_model_imports_are_side_effect_free(self):
+        code = ("import sys, model.matching_logic, model.keywords, questions; "
+            "print(sorted(name for name in ('pandas', 'numpy') if name in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR,
+            capture_output=True, text=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_startup_benchmark(self):
+        results = benchmark_startup(num_roles=20, repeat=1)
+
+        self.assertTrue(results["csv"]["pandas_imported"])
+        self.assertFalse(results["snapshot"]["pandas_imported"])
+        self.assertGreater(results["snapshot"]["total"]["best"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
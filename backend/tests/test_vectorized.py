@@ -0,0 +1,67 @@
+from model.catalog import RoleCatalog
+from model.matching_logic import Matches
+from model.response import *
+from model.keywords import *
+from model.vectorized import VectorizedMatches, np
+from test_data import TestData
+import random
+import unittest
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorizedParity(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoleCatalog(TestData().schema_test_data, convert_booleans=True)
+
+    def assert_same_state(self, matches, vectorized):
+        self.assertEqual(matches.all_role_scoreboard, vectorized.all_role_scoreboard)
+        self.assertEqual(matches.eliminated_roles, vectorized.eliminated_roles)
+
+    def test_each_assessment_matches_dict_engine(self):
+        skills = list(REQ_SKILLS_KEYWORDS)
+        experience = list(REQ_EXPERIENCE_KEYWORDS)
+        preferred = list(PREF_EXPERIENCE_KEYWORDS)
+        rng = random.Random(7)
+
+        for _ in range(200):
+            student_status = rng.choice([True, False])
+            eliminate = rng.choice([True, False])
+            matches = Matches(catalog=self.catalog, student_status=student_status)
+            vectorized = VectorizedMatches(self.catalog, student_status)
+
+            steps = [
+                ("assess_age", rng.randint(13, 30), eliminate),
+                ("assess_physical_ability", PreferenceResponse(rng.choice(["YES", "NO", "NO_PREF"])), eliminate),
+                ("assess_standing_ability", PreferenceResponse(rng.choice(["YES", "NO"])), eliminate),
+                ("assess_moving_ability", PreferenceResponse(rng.choice(["YES", "NO"])), eliminate),
+                ("assess_availability", AvailabilityResponse(rng.choice([-1, 1, 2, 3])), eliminate),
+                ("assess_working_pref", MultiChoiceResponse(rng.choice(["BTS", "FRONT", "NO_PREF"]),
+                    {"NO_PREF", "BTS", "FRONT"}), eliminate),
+                ("assess_leadership_pref", PreferenceResponse(rng.choice(["YES", "NO", "NO_PREF"])), eliminate),
+                ("assess_prior_first_experience", rng.choice([True, False])),
+                ("assess_knowledge_of_game", rng.choice(["NONE", "LIMITED", "AVERAGE", "THOROUGH"]), eliminate),
+                ("assess_requirements_general", "required_skills", REQ_SKILLS_KEYWORDS,
+                    set(rng.sample(skills, 2)), eliminate),
+                ("assess_requirements_general", "required_experience", REQ_EXPERIENCE_KEYWORDS,
+                    set(rng.sample(experience, 2)), eliminate),
+                ("assess_pref_experience", "preferred_experience", PREF_EXPERIENCE_KEYWORDS,
+                    set(rng.sample(preferred, 3)))
+            ]
+
+            for name, *args in steps:
+                dict_args = [set(arg) if isinstance(arg, set) else arg for arg in args]
+                getattr(matches, name)(matches.get_active_roles(), *dict_args)
+                getattr(vectorized, name)(*args)
+                self.assert_same_state(matches, vectorized)
+
+    def test_custom_keywords_are_classified(self):
+        keywords = {"ROBOTS": ["robot"], "PEOPLE": ["volunteers", "team"]}
+        matches = Matches(catalog=self.catalog, student_status=True)
+        vectorized = VectorizedMatches(self.catalog, True)
+
+        matches.assess_requirements_general(matches.dataset, "notes", keywords, {"PEOPLE"}, True)
+        vectorized.assess_requirements_general("notes", keywords, {"PEOPLE"}, True)
+
+        self.assert_same_state(matches, vectorized)
+
+if __name__ == "__main__":
+    unittest.main()
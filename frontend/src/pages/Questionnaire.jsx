@@ -207,18 +207,20 @@ const Modal = ({ isModalOpen, setModalOpen }) => {
 
 function Questionnaire() {
     const [questionId, setQuestionId] = useState(0);
-    const [data, setData] = useState(null);
+    const [questions, setQuestions] = useState(null);
     const [isModalOpen, setModalOpen] = useState(false);
     const [button, setSelectedButton] = useState(null);
     let navigate = useNavigate();
 
-
-    const fetchData = async () => {
-        const response = await fetch(`http://127.0.0.1:5000/api/get-question?question_id=${questionId}`);
+    // The whole questionnaire is loaded once, moving between questions never hits the backend
+    const fetchQuestions = async () => {
+        const response = await fetch('http://127.0.0.1:5000/api/questions');
         const result = await response.json();
-        setData(result);
+        setQuestions(result.questions);
     };
 
+    const data = questions ? questions[questionId] : null;
+
     const handleNextAnswerClick = () => {
         setQuestionId(prev => prev + 1); 
     };
@@ -228,8 +230,8 @@ function Questionnaire() {
     };
 
     useEffect(() => {
-        fetchData();
-    }, [questionId]); 
+        fetchQuestions();
+    }, []); 
 
     // Dynamically changes the size of questions based on length
     useEffect(() => {